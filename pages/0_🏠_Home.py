@@ -14,7 +14,7 @@ from musicleague.dashboard import (
 )
 
 # Page setup
-setup_page()
+setup_page("home")
 
 # Use default leagues from config
 league1, league2 = DEFAULT_LEAGUES
@@ -18,7 +18,7 @@ from musicleague.dashboard import (
 from musicleague.metrics import SongMetrics
 
 # Page setup
-setup_page()
+setup_page("songs")
 
 # Get leagues from session state or use defaults
 league1 = st.session_state.get('league1', DEFAULT_LEAGUES[0])
@@ -31,7 +31,7 @@ league2_display = format_league_name(league2)
 # Page Header
 st.markdown("""
 <div class="page-header songs">
-    <h1>The Track Record</h1>
+    <h1 class="gradient-text">The Track Record</h1>
     <p>Every song tells a story. Here's how they scored.</p>
 </div>
 """, unsafe_allow_html=True)
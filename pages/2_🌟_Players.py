@@ -17,7 +17,7 @@ from musicleague.dashboard import (
 from musicleague.visualizations import SubmitterVisualizations, VoterVisualizations
 
 # Page setup
-setup_page()
+setup_page("players")
 
 # Get leagues from session state
 league1 = st.session_state.get('league1', DEFAULT_LEAGUES[0])
@@ -30,7 +30,7 @@ league2_display = format_league_name(league2)
 # Page Header
 st.markdown("""
 <div class="page-header players">
-    <h1>The Roster</h1>
+    <h1 class="gradient-text">The Roster</h1>
     <p>Every player has a style. Here's what the numbers say about theirs.</p>
 </div>
 """, unsafe_allow_html=True)
@@ -124,19 +124,19 @@ with tab1:
                 st.markdown(f"""
                 <div class="player-card">
                     <span class="rank">#{int(row['Rank'])}</span>
-                    <div class="name">{row['Submitter']}</div>
-                    <div class="stats">
+                    <div class="card-name">{row['Submitter']}</div>
+                    <div class="card-stats">
                         <div class="stat">
-                            <div class="stat-value">{row['A&R Score']:.1f}</div>
-                            <div class="stat-label">A&R Score</div>
+                            <div class="card-score text-lg">{row['A&R Score']:.1f}</div>
+                            <div class="card-label text-sm">A&R Score</div>
                         </div>
                         <div class="stat">
-                            <div class="stat-value">{row['Consistency']:.1f}</div>
-                            <div class="stat-label">Consistency</div>
+                            <div class="card-score text-lg">{row['Consistency']:.1f}</div>
+                            <div class="card-label text-sm">Consistency</div>
                         </div>
                         <div class="stat">
-                            <div class="stat-value">{row['Deep Cut Cred']:.0f}</div>
-                            <div class="stat-label">Deep Cuts</div>
+                            <div class="card-score text-lg">{row['Deep Cut Cred']:.0f}</div>
+                            <div class="card-label text-sm">Deep Cuts</div>
                         </div>
                     </div>
                 </div>
@@ -169,19 +169,19 @@ with tab1:
                 st.markdown(f"""
                 <div class="player-card">
                     <span class="rank">#{int(row['Rank'])}</span>
-                    <div class="name">{row['Submitter']}</div>
-                    <div class="stats">
+                    <div class="card-name">{row['Submitter']}</div>
+                    <div class="card-stats">
                         <div class="stat">
-                            <div class="stat-value">{row['A&R Score']:.1f}</div>
-                            <div class="stat-label">A&R Score</div>
+                            <div class="card-score text-lg">{row['A&R Score']:.1f}</div>
+                            <div class="card-label text-sm">A&R Score</div>
                         </div>
                         <div class="stat">
-                            <div class="stat-value">{row['Consistency']:.1f}</div>
-                            <div class="stat-label">Consistency</div>
+                            <div class="card-score text-lg">{row['Consistency']:.1f}</div>
+                            <div class="card-label text-sm">Consistency</div>
                         </div>
                         <div class="stat">
-                            <div class="stat-value">{row['Deep Cut Cred']:.0f}</div>
-                            <div class="stat-label">Deep Cuts</div>
+                            <div class="card-score text-lg">{row['Deep Cut Cred']:.0f}</div>
+                            <div class="card-label text-sm">Deep Cuts</div>
                         </div>
                     </div>
                 </div>
@@ -10,14 +10,14 @@ from musicleague.dashboard import (
     setup_page, LEAGUE_COLORS,
     load_league_data,
     get_wordsmith_rankings, get_critic_rankings, get_best_comments,
+    get_comment_vs_points, get_comment_length_correlation, get_comment_engagement,
     generate_wordsmith_commentary, generate_best_comment_showcase,
     DEFAULT_LEAGUES, format_league_name,
     apply_plotly_theme, PLOTLY_FONT_SIZES,
 )
-from musicleague.metrics.comments import CommentMetrics
 
 # Page setup
-setup_page()
+setup_page("commentary")
 
 # Get leagues from session state
 league1 = st.session_state.get('league1', DEFAULT_LEAGUES[0])
@@ -30,7 +30,7 @@ league2_display = format_league_name(league2)
 # Page Header
 st.markdown("""
 <div class="page-header commentary">
-    <h1>The Commentary Booth</h1>
+    <h1 class="gradient-text">The Commentary Booth</h1>
     <p>Words matter. Here's who brings the most flavor to the discourse.</p>
 </div>
 """, unsafe_allow_html=True)
@@ -124,20 +124,20 @@ with tab1:
             top = wordsmiths_l1.iloc[0]
             st.markdown(f"""
             <div class="wordsmith-card blue">
-                <div class="top-label">Top Wordsmith</div>
-                <div class="name">{top['Submitter']}</div>
-                <div class="stats">
+                <div class="card-label">Top Wordsmith</div>
+                <div class="card-name">{top['Submitter']}</div>
+                <div class="card-stats">
                     <div>
-                        <div class="stat-value">{top['Avg Length']:.0f}</div>
-                        <div class="stat-label">Avg Chars</div>
+                        <div class="card-score text-lg text-white">{top['Avg Length']:.0f}</div>
+                        <div class="card-label text-sm">Avg Chars</div>
                     </div>
                     <div>
-                        <div class="stat-value">{top['Comment Rate %']:.0f}%</div>
-                        <div class="stat-label">Comment Rate</div>
+                        <div class="card-score text-lg text-white">{top['Comment Rate %']:.0f}%</div>
+                        <div class="card-label text-sm">Comment Rate</div>
                     </div>
                     <div>
-                        <div class="stat-value">{int(top['Total Comments'])}</div>
-                        <div class="stat-label">Total</div>
+                        <div class="card-score text-lg text-white">{int(top['Total Comments'])}</div>
+                        <div class="card-label text-sm">Total</div>
                     </div>
                 </div>
             </div>
@@ -161,20 +161,20 @@ with tab1:
             top = wordsmiths_l2.iloc[0]
             st.markdown(f"""
             <div class="wordsmith-card red">
-                <div class="top-label">Top Wordsmith</div>
-                <div class="name">{top['Submitter']}</div>
-                <div class="stats">
+                <div class="card-label">Top Wordsmith</div>
+                <div class="card-name">{top['Submitter']}</div>
+                <div class="card-stats">
                     <div>
-                        <div class="stat-value">{top['Avg Length']:.0f}</div>
-                        <div class="stat-label">Avg Chars</div>
+                        <div class="card-score text-lg text-white">{top['Avg Length']:.0f}</div>
+                        <div class="card-label text-sm">Avg Chars</div>
                     </div>
                     <div>
-                        <div class="stat-value">{top['Comment Rate %']:.0f}%</div>
-                        <div class="stat-label">Comment Rate</div>
+                        <div class="card-score text-lg text-white">{top['Comment Rate %']:.0f}%</div>
+                        <div class="card-label text-sm">Comment Rate</div>
                     </div>
                     <div>
-                        <div class="stat-value">{int(top['Total Comments'])}</div>
-                        <div class="stat-label">Total</div>
+                        <div class="card-score text-lg text-white">{int(top['Total Comments'])}</div>
+                        <div class="card-label text-sm">Total</div>
                     </div>
                 </div>
             </div>
@@ -209,8 +209,8 @@ with tab1:
 
     with col1:
         st.markdown(f"**{league1_display}**")
-        comment_vs_points_l1 = CommentMetrics.submission_comment_vs_points(data1)
-        corr_stats_l1 = CommentMetrics.comment_length_correlation(data1)
+        comment_vs_points_l1 = get_comment_vs_points(data1)
+        corr_stats_l1 = get_comment_length_correlation(data1)
 
         if len(comment_vs_points_l1) > 0:
             fig = px.scatter(
@@ -250,8 +250,8 @@ with tab1:
 
     with col2:
         st.markdown(f"**{league2_display}**")
-        comment_vs_points_l2 = CommentMetrics.submission_comment_vs_points(data2)
-        corr_stats_l2 = CommentMetrics.comment_length_correlation(data2)
+        comment_vs_points_l2 = get_comment_vs_points(data2)
+        corr_stats_l2 = get_comment_length_correlation(data2)
 
         if len(comment_vs_points_l2) > 0:
             fig = px.scatter(
@@ -363,7 +363,7 @@ with tab2:
     col1, col2 = st.columns(2)
 
     with col1:
-        engagement_l1 = CommentMetrics.comment_engagement_by_points(data1)
+        engagement_l1 = get_comment_engagement(data1)
         if len(engagement_l1) > 0:
             fig = px.scatter(
                 engagement_l1,
@@ -377,7 +377,7 @@ with tab2:
             st.plotly_chart(fig, use_container_width=True)
 
     with col2:
-        engagement_l2 = CommentMetrics.comment_engagement_by_points(data2)
+        engagement_l2 = get_comment_engagement(data2)
         if len(engagement_l2) > 0:
             fig = px.scatter(
                 engagement_l2,
@@ -18,7 +18,7 @@ from musicleague.dashboard import (
 )
 
 # Page setup
-setup_page()
+setup_page("trends")
 
 # Get leagues from session state
 league1 = st.session_state.get('league1', DEFAULT_LEAGUES[0])
@@ -31,7 +31,7 @@ league2_display = format_league_name(league2)
 # Page Header
 st.markdown("""
 <div class="page-header trends">
-    <h1>The Arc</h1>
+    <h1 class="gradient-text">The Arc</h1>
     <p>Every player has a story. Watch it unfold round by round.</p>
 </div>
 """, unsafe_allow_html=True)
@@ -16,7 +16,7 @@ from musicleague.visualizations import NetworkVisualizations, VoterVisualization
 from musicleague.metrics import NetworkMetrics
 
 # Page setup
-setup_page()
+setup_page("connections")
 
 # Get leagues from session state
 league1 = st.session_state.get('league1', DEFAULT_LEAGUES[0])
@@ -29,7 +29,7 @@ league2_display = format_league_name(league2)
 # Page Header
 st.markdown("""
 <div class="page-header connections">
-    <h1>The Web</h1>
+    <h1 class="gradient-text">The Web</h1>
     <p>Who influences who? Uncover the hidden connections in the voting network.</p>
 </div>
 """, unsafe_allow_html=True)
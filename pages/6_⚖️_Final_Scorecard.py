@@ -10,17 +10,19 @@ import plotly.graph_objects as go
 from musicleague.dashboard import (
     setup_page, LEAGUE_COLORS,
     load_league_data,
+    get_player_scorecard_metrics,
     generate_final_verdict,
     DEFAULT_LEAGUES, format_league_name,
     apply_plotly_theme, PLOTLY_FONT_SIZES,
 )
-from musicleague.metrics.submitters import SubmitterMetrics
-from musicleague.metrics.voters import VoterMetrics
-from musicleague.metrics.network import NetworkMetrics
-from musicleague.metrics.songs import SongMetrics
+from musicleague.data.cache import CacheManager
+
+# Version of the scoring and normalization code behind the persisted
+# metrics; bump it whenever either changes so stale caches are recomputed.
+NORMALIZED_METRICS_VERSION = 1
 
 # Page setup
-setup_page()
+setup_page("scorecard")
 
 # Get leagues from session state
 league1 = st.session_state.get('league1', DEFAULT_LEAGUES[0])
@@ -33,7 +35,7 @@ league2_display = format_league_name(league2)
 # Page Header
 st.markdown("""
 <div class="page-header scorecard">
-    <h1>The Reckoning</h1>
+    <h1 class="gradient-text">The Reckoning</h1>
     <p>Set your priorities. Crown your champion. There can only be one.</p>
 </div>
 """, unsafe_allow_html=True)
@@ -58,7 +60,36 @@ def normalize_metric(values: list[float]) -> list[float]:
     return [((v - min_val) / (max_val - min_val)) * 100 for v in values]
 
 
-def calculate_player_scores(data, weights):
+@st.cache_data
+def _compute_normalized_metrics(league_name: str) -> pd.DataFrame:
+    """Compute weight-independent metrics for each player, normalized to 0-100.
+
+    Results are persisted alongside the league's preprocessed cache so cold
+    starts skip recomputing golden ear, influence, etc.
+    """
+    cache_manager = CacheManager()
+    cached = cache_manager.load_normalized_metrics(league_name, NORMALIZED_METRICS_VERSION)
+    if cached is not None:
+        return cached
+
+    raw = get_player_scorecard_metrics(load_league_data(league_name))
+
+    # Normalize each metric to 0-100 using min-max scaling
+    normalized = pd.DataFrame({
+        'player_name': raw['player_name'].tolist(),
+        'mainstream_hits': normalize_metric(raw['avg_points'].tolist()),
+        'deep_cuts': normalize_metric(raw['underdog'].tolist()),
+        'taste': normalize_metric(raw['golden_ear'].tolist()),
+        'controversy': normalize_metric(raw['avg_controversy'].tolist()),
+        'clout': normalize_metric(raw['influence'].tolist()),
+    })
+
+    cache_manager.save_normalized_metrics(league_name, normalized, NORMALIZED_METRICS_VERSION)
+    return normalized
+
+
+@st.cache_data
+def calculate_player_scores(league_name, weights):
     """Calculate weighted scores for each player in a league.
 
     All metrics are normalized to 0-100 using min-max scaling based on
@@ -69,52 +100,20 @@ def calculate_player_scores(data, weights):
     if total_weight == 0:
         return pd.DataFrame()
 
-    song_df = SongMetrics.get_all_song_metrics(data)
-    influence_scores = NetworkMetrics.influence_score(data)
-
-    # First pass: collect raw metric values for all players
-    raw_data = []
-    for player_id, player_info in data.competitors.items():
-        player_name = player_info['name']
-
-        avg_points = SubmitterMetrics.average_points_per_submission(data, player_id)
-        underdog = SubmitterMetrics.underdog_factor(data, player_id)
-        golden_ear = VoterMetrics.golden_ear_score(data, player_id)
-
-        player_songs = song_df[song_df['submitter'] == player_name]
-        avg_controversy = player_songs['controversy_score'].mean() if len(player_songs) > 0 else 0
-
-        raw_influence = influence_scores.get(player_name, 0)
-
-        raw_data.append({
-            'player_name': player_name,
-            'avg_points': avg_points,
-            'underdog': underdog,
-            'golden_ear': golden_ear,
-            'avg_controversy': avg_controversy,
-            'influence': raw_influence,
-        })
-
-    if not raw_data:
+    normalized = _compute_normalized_metrics(league_name)
+    if len(normalized) == 0:
         return pd.DataFrame()
 
-    # Extract raw values for normalization
-    avg_points_raw = [d['avg_points'] for d in raw_data]
-    underdog_raw = [d['underdog'] for d in raw_data]
-    golden_ear_raw = [d['golden_ear'] for d in raw_data]
-    controversy_raw = [d['avg_controversy'] for d in raw_data]
-    influence_raw = [d['influence'] for d in raw_data]
-
-    # Normalize each metric to 0-100 using min-max scaling
-    points_norm = normalize_metric(avg_points_raw)
-    deepcut_norm = normalize_metric(underdog_raw)
-    taste_norm = normalize_metric(golden_ear_raw)
-    controversy_norm = normalize_metric(controversy_raw)
-    influence_norm = normalize_metric(influence_raw)
+    player_names = normalized['player_name'].tolist()
+    points_norm = normalized['mainstream_hits'].tolist()
+    deepcut_norm = normalized['deep_cuts'].tolist()
+    taste_norm = normalized['taste'].tolist()
+    controversy_norm = normalized['controversy'].tolist()
+    influence_norm = normalized['clout'].tolist()
 
-    # Second pass: build player data with normalized scores
+    # Build player data with weighted scores
     player_data = []
-    for i, d in enumerate(raw_data):
+    for i, player_name in enumerate(player_names):
         metrics = {
             'mainstream_hits': points_norm[i],
             'deep_cuts': deepcut_norm[i],
@@ -129,7 +128,7 @@ def calculate_player_scores(data, weights):
                 final_score += metrics[metric] * (weight / total_weight)
 
         player_data.append({
-            'Player': d['player_name'],
+            'Player': player_name,
             'Score': round(final_score, 1),
             'Avg Pts': round(points_norm[i], 1),
             'Deep Cut': round(deepcut_norm[i], 1),
@@ -188,8 +187,8 @@ with st.sidebar:
 
 # Main content
 if total_weight > 0:
-    scores1 = calculate_player_scores(data1, weights)
-    scores2 = calculate_player_scores(data2, weights)
+    scores1 = calculate_player_scores(league1, weights)
+    scores2 = calculate_player_scores(league2, weights)
 
     # =========================================================================
     # Champions Section
@@ -210,9 +209,9 @@ if total_weight > 0:
             runner_up1 = scores1.iloc[1]['Player'] if len(scores1) > 1 else ""
             st.markdown(f"""
             <div class="champion-card blue">
-                <div class="league">{league1_display}</div>
-                <div class="name">{winner1['Player']}</div>
-                <div class="score">{winner1['Score']:.1f}</div>
+                <div class="card-label">{league1_display}</div>
+                <div class="card-name text-2xl">{winner1['Player']}</div>
+                <div class="card-score text-3xl">{winner1['Score']:.1f}</div>
                 <div class="margin">+{margin1:.1f} over {runner_up1}</div>
             </div>
             """, unsafe_allow_html=True)
@@ -226,9 +225,9 @@ if total_weight > 0:
             runner_up2 = scores2.iloc[1]['Player'] if len(scores2) > 1 else ""
             st.markdown(f"""
             <div class="champion-card red">
-                <div class="league">{league2_display}</div>
-                <div class="name">{winner2['Player']}</div>
-                <div class="score">{winner2['Score']:.1f}</div>
+                <div class="card-label">{league2_display}</div>
+                <div class="card-name text-2xl">{winner2['Player']}</div>
+                <div class="card-score text-3xl">{winner2['Score']:.1f}</div>
                 <div class="margin">+{margin2:.1f} over {runner_up2}</div>
             </div>
             """, unsafe_allow_html=True)
@@ -351,7 +350,7 @@ if total_weight > 0:
                     colorscale=[[0, '#1a5276'], [1, '#2980b9']],
                     showscale=False
                 ),
-                text=scores1['Score'].apply(lambda x: f"{x:.1f}"),
+                text=np.char.mod('%.1f', scores1['Score'].to_numpy()),
                 textposition='outside'
             ))
             apply_plotly_theme(
@@ -376,7 +375,7 @@ if total_weight > 0:
                     colorscale=[[0, '#922b21'], [1, '#c0392b']],
                     showscale=False
                 ),
-                text=scores2['Score'].apply(lambda x: f"{x:.1f}"),
+                text=np.char.mod('%.1f', scores2['Score'].to_numpy()),
                 textposition='outside'
             ))
             apply_plotly_theme(
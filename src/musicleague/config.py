@@ -52,6 +52,7 @@ class PathConfig:
     DATA_DIR = Path(os.environ.get("MUSICLEAGUE_DATA_DIR", PROJECT_ROOT / "data"))
     CACHE_DIR = Path(os.environ.get("MUSICLEAGUE_CACHE_DIR", PROJECT_ROOT / "cache"))
     OUTPUT_DIR = Path(os.environ.get("MUSICLEAGUE_OUTPUT_DIR", PROJECT_ROOT / "outputs"))
+    STATIC_DIR = Path(os.environ.get("MUSICLEAGUE_STATIC_DIR", PROJECT_ROOT / "static"))
     
     @classmethod
     def ensure_directories(cls) -> None:
@@ -22,10 +22,14 @@ from musicleague.dashboard.helpers import (
     calculate_weighted_score,
     get_league_champion,
     get_player_champion,
+    get_player_scorecard_metrics,
     # Comment helpers
     get_wordsmith_rankings,
     get_critic_rankings,
     get_best_comments,
+    get_comment_vs_points,
+    get_comment_length_correlation,
+    get_comment_engagement,
     # Trends helpers
     get_round_by_round_performance,
     get_momentum_rankings,
@@ -87,10 +91,14 @@ __all__ = [
     "calculate_weighted_score",
     "get_league_champion",
     "get_player_champion",
+    "get_player_scorecard_metrics",
     # Comment helpers
     "get_wordsmith_rankings",
     "get_critic_rankings",
     "get_best_comments",
+    "get_comment_vs_points",
+    "get_comment_length_correlation",
+    "get_comment_engagement",
     # Trends helpers
     "get_round_by_round_performance",
     "get_momentum_rankings",
@@ -3,8 +3,10 @@ Helper functions for the Soundwave Smackdown dashboard.
 Provides data loading, processing, and utility functions.
 """
 
+import numpy as np
 import streamlit as st
 import pandas as pd
+from types import SimpleNamespace
 from typing import Dict, List, Optional, Any
 
 from musicleague.config import PathConfig, get_available_leagues
@@ -14,6 +16,15 @@ from musicleague.metrics.songs import SongMetrics
 from musicleague.metrics.voters import VoterMetrics
 from musicleague.metrics.submitters import SubmitterMetrics
 from musicleague.metrics.network import NetworkMetrics
+from musicleague.metrics.comparisons import CrossRoundMetrics
+
+
+# Leagues are immutable once loaded, so the league name is a sufficient
+# cache key and avoids hashing every submission and vote on each call.
+_MLD_HASH = {MusicLeagueData: lambda d: d.league_name}
+
+# Song metric columns with few distinct values; group with observed=True
+_CATEGORICAL_SONG_COLUMNS = ['submitter', 'submitter_id', 'round_id', 'artist']
 
 
 @st.cache_data
@@ -51,12 +62,15 @@ def load_preprocessed_data(league_name: str) -> Dict[str, Any]:
     return data
 
 
-@st.cache_data
+@st.cache_resource
 def load_league_data(league_name: str) -> MusicLeagueData:
     """
     Load league data from preprocessed cache.
     Reconstructs a MusicLeagueData-like object from cached data.
 
+    The object is shared across reruns and sessions rather than copied on
+    every call, so callers must treat it as read-only.
+
     Args:
         league_name: Name of the league directory
 
@@ -69,15 +83,257 @@ def load_league_data(league_name: str) -> MusicLeagueData:
     data = MusicLeagueData.__new__(MusicLeagueData)
     data.league_name = league_name
     data.competitors = preprocessed['raw_data']['competitors']
-    data.submissions = preprocessed['raw_data']['submissions']
-    data.votes = preprocessed['raw_data']['votes']
     data.rounds = preprocessed['raw_data']['rounds']
     data.spotify_data = preprocessed['raw_data']['spotify_data']
     data._spotify = None  # Don't fetch new data
+    data._spotify_prefetched = True
+
+    # Newer caches store submissions and votes as frames only; older ones
+    # store record lists, from which the frames are built on first access
+    for frame_key, records_key in (('submissions_df', 'submissions'), ('votes_df', 'votes')):
+        if frame_key in preprocessed['raw_data']:
+            setattr(data, frame_key, preprocessed['raw_data'][frame_key])
+        else:
+            setattr(data, records_key, preprocessed['raw_data'][records_key])
+
+    # Materialize records and lookup indexes once so they are cached with the object
+    data.submissions
+    data.votes
+    data.name_to_id
+    data.submitter_index
+    data.vote_indices_by_uri
+    data.vote_indices_by_voter
+    data.submission_indices_by_submitter
+    data.submissions_df
+    data.votes_df
+    data.song_points
 
     return data
 
 
+def _display_frame(
+    source_df: pd.DataFrame,
+    columns: Dict[str, str],
+    rank_column: Optional[str] = None
+) -> pd.DataFrame:
+    """
+    Build a renamed display table straight from source columns.
+
+    Constructing the frame from the column arrays avoids the defensive
+    copy of a column subset that is only made so it can be renamed.
+
+    Args:
+        source_df: DataFrame to take columns from (its index is kept)
+        columns: Mapping of source column name to display name, in order
+        rank_column: Optional name of a leading 1..N rank column
+
+    Returns:
+        DataFrame with the display columns
+    """
+    display = {}
+    if rank_column is not None:
+        display[rank_column] = np.arange(1, len(source_df) + 1)
+    for source_name, display_name in columns.items():
+        display[display_name] = source_df[source_name].to_numpy()
+    return pd.DataFrame(display, index=source_df.index)
+
+
+def _top_n_indices(values: np.ndarray, n: int) -> np.ndarray:
+    """
+    Get positions of the n largest values, matching DataFrame.nlargest.
+
+    Uses np.partition to find the cutoff in O(N) instead of sorting every
+    row; ties at the cutoff keep their first occurrences, and the result is
+    ordered by value descending with ties in original order.
+
+    Args:
+        values: 1-D array of numeric values (NaNs rank last)
+        n: Number of positions to return
+
+    Returns:
+        Array of integer positions into values
+    """
+    is_nan = np.isnan(values)
+    valid = np.flatnonzero(~is_nan)
+    n_valid = min(n, len(valid))
+    if n_valid <= 0:
+        return np.flatnonzero(is_nan)[:max(n, 0)]
+
+    valid_values = values[valid]
+    cutoff = np.partition(valid_values, len(valid_values) - n_valid)[len(valid_values) - n_valid]
+    above = valid[valid_values > cutoff]
+    ties = valid[valid_values == cutoff][:n_valid - len(above)]
+
+    idx = np.sort(np.concatenate([above, ties]))
+    idx = idx[np.argsort(-values[idx], kind='stable')]
+    return np.concatenate([idx, np.flatnonzero(is_nan)[:n - n_valid]])
+
+
+@st.cache_data(hash_funcs=_MLD_HASH)
+def _song_metrics(data: MusicLeagueData) -> pd.DataFrame:
+    """
+    Get per-song metrics for a league, computed once and shared by helpers.
+
+    Args:
+        data: MusicLeagueData object
+
+    Returns:
+        DataFrame from SongMetrics.get_all_song_metrics, with the highly
+        repeated string columns stored as categoricals
+    """
+    song_df = SongMetrics.get_all_song_metrics(data)
+    for col in _CATEGORICAL_SONG_COLUMNS:
+        if col in song_df.columns:
+            song_df[col] = song_df[col].astype('category')
+    return song_df
+
+
+@st.cache_data(hash_funcs=_MLD_HASH)
+def _influence(data: MusicLeagueData) -> Dict[str, float]:
+    """
+    Get PageRank influence scores for a league, computed once per league.
+
+    Args:
+        data: MusicLeagueData object
+
+    Returns:
+        Dictionary mapping voter names to influence scores
+    """
+    return NetworkMetrics.influence_score(data)
+
+
+@st.cache_data(hash_funcs=_MLD_HASH)
+def _average_points(data: MusicLeagueData) -> pd.Series:
+    """
+    Get each competitor's average points per submission, once per league.
+
+    Args:
+        data: MusicLeagueData object
+
+    Returns:
+        Series of average points indexed by submitter ID, in competitor order
+    """
+    return SubmitterMetrics.all_average_points(data)
+
+
+@st.cache_data(hash_funcs=_MLD_HASH)
+def _hipster_scores(data: MusicLeagueData) -> Dict[str, float]:
+    """
+    Get hipster scores for every competitor, computed once per league.
+
+    Args:
+        data: MusicLeagueData object
+
+    Returns:
+        Dictionary mapping voter ID to hipster score
+    """
+    return {
+        voter_id: VoterMetrics.hipster_score(data, voter_id)
+        for voter_id in data.competitors
+    }
+
+
+@st.cache_data(hash_funcs=_MLD_HASH)
+def _all_golden_ears(data: MusicLeagueData) -> Dict[str, float]:
+    """
+    Get golden ear scores for every competitor, computed once per league.
+
+    Args:
+        data: MusicLeagueData object
+
+    Returns:
+        Dictionary mapping voter ID to golden ear score
+    """
+    return VoterMetrics.all_golden_ear_scores(data)
+
+
+def _cumulative_points_frame(data: MusicLeagueData) -> pd.DataFrame:
+    """
+    Build the long-form cumulative points table used by the trend charts.
+
+    Args:
+        data: MusicLeagueData object
+
+    Returns:
+        DataFrame with columns: round_id, round_index, submitter_id,
+        submitter, cumulative_points
+    """
+    submitter_ids = list(data.competitors.keys())
+    n_players, n_rounds = len(submitter_ids), len(data.rounds)
+
+    if n_players == 0 or n_rounds == 0:
+        return pd.DataFrame()
+
+    # Pivot points into a (player x round) matrix and accumulate across rounds
+    song_df = _song_metrics(data)
+    if len(song_df) > 0:
+        round_points = song_df.pivot_table(
+            index='submitter_id', columns='round_id', values='total_points',
+            aggfunc='sum', fill_value=0, observed=True,
+        )
+    else:
+        round_points = pd.DataFrame()
+    cumulative = round_points.reindex(
+        index=submitter_ids, columns=data.rounds, fill_value=0
+    ).cumsum(axis=1)
+
+    return pd.DataFrame({
+        'round_id': np.tile(data.rounds, n_players),
+        'round_index': np.tile(np.arange(1, n_rounds + 1), n_players),
+        'submitter_id': np.repeat(submitter_ids, n_rounds),
+        'submitter': np.repeat(
+            [data.competitors[sid]['name'] for sid in submitter_ids], n_rounds
+        ),
+        'cumulative_points': cumulative.to_numpy().ravel(),
+    })
+
+
+@st.cache_data(hash_funcs=_MLD_HASH)
+def _cross_round_bundle(data: MusicLeagueData) -> SimpleNamespace:
+    """
+    Compute every cross-round view of a league in one place.
+
+    Round rankings are built once and shared by the momentum streaks, so
+    the trend helpers slice from this bundle instead of each re-walking
+    submissions and votes.
+
+    Args:
+        data: MusicLeagueData object
+
+    Returns:
+        SimpleNamespace with rankings, momentum, arcs and cumulative DataFrames,
+        plus round_wins_by_submitter (submitter name -> rounds won) and
+        round_podiums (round ID -> winner and runner-up ranking records)
+    """
+    rankings = CrossRoundMetrics.round_rankings(data)
+
+    round_wins_by_submitter: Dict[str, int] = {}
+    round_podiums: Dict[str, List[Dict]] = {}
+    if len(rankings) > 0:
+        # Rankings are ordered by points within each round
+        for record in rankings[rankings['rank'] <= 2].to_dict('records'):
+            round_podiums.setdefault(record['round_id'], []).append(record)
+
+        # Integer category codes make the per-player filters and groupbys
+        # below compare ints rather than strings
+        for col in ('submitter', 'submitter_id'):
+            rankings[col] = rankings[col].astype('category')
+        round_wins_by_submitter = (
+            rankings[rankings['rank'] == 1]
+            .groupby('submitter', observed=True).size().to_dict()
+        )
+
+    return SimpleNamespace(
+        rankings=rankings,
+        round_wins_by_submitter=round_wins_by_submitter,
+        round_podiums=round_podiums,
+        momentum=CrossRoundMetrics.get_all_momentum_scores(data, rankings_df=rankings),
+        arcs=CrossRoundMetrics.get_all_player_arcs(data),
+        cumulative=_cumulative_points_frame(data),
+    )
+
+
+@st.cache_data(hash_funcs=_MLD_HASH)
 def get_league_summary_stats(data: MusicLeagueData) -> Dict[str, Any]:
     """
     Get high-level summary statistics for a league.
@@ -88,20 +344,24 @@ def get_league_summary_stats(data: MusicLeagueData) -> Dict[str, Any]:
     Returns:
         Dictionary of summary statistics
     """
-    song_df = SongMetrics.get_all_song_metrics(data)
+    song_df = _song_metrics(data)
 
     return {
         'total_competitors': len(data.competitors),
         'total_submissions': len(data.submissions),
-        'total_votes': len([v for v in data.votes if v['points'] > 0]),
+        'total_votes': int(data.votes_df['points'].gt(0).sum()),
         'total_rounds': len(data.rounds),
         'avg_controversy': song_df['controversy_score'].mean() if len(song_df) > 0 else 0,
         'avg_spotify_popularity': song_df['spotify_popularity'].mean() if len(song_df) > 0 else 0,
         'avg_points_per_song': song_df['total_points'].mean() if len(song_df) > 0 else 0,
-        'top_song': song_df.iloc[0] if len(song_df) > 0 else None,
+        'top_song': (
+            song_df.iloc[0][['song_name', 'artist', 'submitter', 'total_points']].to_dict()
+            if len(song_df) > 0 else None
+        ),
     }
 
 
+@st.cache_data(hash_funcs=_MLD_HASH)
 def get_top_songs(data: MusicLeagueData, n: int = 20) -> pd.DataFrame:
     """
     Get top N songs formatted for display.
@@ -113,22 +373,23 @@ def get_top_songs(data: MusicLeagueData, n: int = 20) -> pd.DataFrame:
     Returns:
         DataFrame with top songs
     """
-    song_df = SongMetrics.get_all_song_metrics(data)
+    # The shared song frame is already sorted by total points
+    song_df = _song_metrics(data).head(n)
 
     if len(song_df) == 0:
         return pd.DataFrame()
 
-    display_df = song_df.head(n)[[
-        'song_name', 'artist', 'submitter', 'total_points',
-        'controversy_score', 'spotify_popularity'
-    ]].copy()
-    display_df.columns = ['Song', 'Artist', 'Submitted By', 'Points', 'Controversy', 'Spotify Pop']
-    display_df['Rank'] = range(1, len(display_df) + 1)
-    display_df = display_df[['Rank', 'Song', 'Artist', 'Submitted By', 'Points', 'Controversy', 'Spotify Pop']]
-
-    return display_df
+    return _display_frame(song_df, {
+        'song_name': 'Song',
+        'artist': 'Artist',
+        'submitter': 'Submitted By',
+        'total_points': 'Points',
+        'controversy_score': 'Controversy',
+        'spotify_popularity': 'Spotify Pop',
+    }, rank_column='Rank')
 
 
+@st.cache_data(hash_funcs=_MLD_HASH)
 def get_most_controversial_songs(data: MusicLeagueData, n: int = 10) -> pd.DataFrame:
     """
     Get most controversial songs formatted for display.
@@ -140,18 +401,22 @@ def get_most_controversial_songs(data: MusicLeagueData, n: int = 10) -> pd.DataF
     Returns:
         DataFrame with most controversial songs
     """
-    song_df = SongMetrics.get_all_song_metrics(data)
+    song_df = _song_metrics(data)
 
     if len(song_df) == 0:
         return pd.DataFrame()
 
-    controversial = song_df.nlargest(n, 'controversy_score')
-    display_df = controversial[['song_name', 'artist', 'submitter', 'total_points', 'controversy_score']].copy()
-    display_df.columns = ['Song', 'Artist', 'Submitted By', 'Points', 'Controversy σ']
-
-    return display_df
+    idx = _top_n_indices(song_df['controversy_score'].to_numpy(dtype=np.float64), n)
+    return _display_frame(song_df.iloc[idx], {
+        'song_name': 'Song',
+        'artist': 'Artist',
+        'submitter': 'Submitted By',
+        'total_points': 'Points',
+        'controversy_score': 'Controversy σ',
+    })
 
 
+@st.cache_data(hash_funcs=_MLD_HASH)
 def get_hidden_gems(data: MusicLeagueData, n: int = 10) -> pd.DataFrame:
     """
     Get hidden gems (high obscurity score) formatted for display.
@@ -163,21 +428,23 @@ def get_hidden_gems(data: MusicLeagueData, n: int = 10) -> pd.DataFrame:
     Returns:
         DataFrame with hidden gems
     """
-    song_df = SongMetrics.get_all_song_metrics(data)
+    song_df = _song_metrics(data)
 
     if len(song_df) == 0:
         return pd.DataFrame()
 
-    gems = song_df.nlargest(n, 'obscurity_score')
-    display_df = gems[[
-        'song_name', 'artist', 'submitter', 'total_points',
-        'spotify_popularity', 'obscurity_score'
-    ]].copy()
-    display_df.columns = ['Song', 'Artist', 'Submitted By', 'Points', 'Spotify Pop', 'Deep Cut Cred']
-
-    return display_df
+    idx = _top_n_indices(song_df['obscurity_score'].to_numpy(dtype=np.float64), n)
+    return _display_frame(song_df.iloc[idx], {
+        'song_name': 'Song',
+        'artist': 'Artist',
+        'submitter': 'Submitted By',
+        'total_points': 'Points',
+        'spotify_popularity': 'Spotify Pop',
+        'obscurity_score': 'Deep Cut Cred',
+    })
 
 
+@st.cache_data(hash_funcs=_MLD_HASH)
 def get_submitter_rankings(data: MusicLeagueData) -> pd.DataFrame:
     """
     Get submitter rankings formatted for display.
@@ -188,30 +455,32 @@ def get_submitter_rankings(data: MusicLeagueData) -> pd.DataFrame:
     Returns:
         DataFrame with submitter rankings
     """
-    submitter_stats = []
+    stats = SubmitterMetrics.get_all_stats(data).set_index('submitter_id')
+    stats = stats.reindex(list(data.competitors.keys()))
+    has_points = (stats['avg_points'] > 0).to_numpy()
 
-    for submitter_id, submitter_data in data.competitors.items():
-        avg_points = SubmitterMetrics.average_points_per_submission(data, submitter_id)
-        if avg_points > 0:
-            avg, std = SubmitterMetrics.consistency_score(data, submitter_id)
-            underdog = SubmitterMetrics.underdog_factor(data, submitter_id)
+    names = np.array([info['name'] for info in data.competitors.values()], dtype=object)
+    scores = np.array([round(v, 2) for v in stats['avg_points'].tolist()])
+    consistency = np.array([round(v, 2) for v in stats['std_points'].tolist()])
+    deep_cuts = np.array([round(v, 2) for v in stats['underdog_factor'].tolist()])
 
-            submitter_stats.append({
-                'Submitter': submitter_data['name'],
-                'A&R Score': round(avg_points, 2),
-                'Consistency': round(std, 2),
-                'Deep Cut Cred': round(underdog, 2),
-            })
+    if not has_points.any():
+        return pd.DataFrame()
 
-    df = pd.DataFrame(submitter_stats)
-    if len(df) > 0:
-        df = df.sort_values('A&R Score', ascending=False)
-        df['Rank'] = range(1, len(df) + 1)
-        df = df[['Rank', 'Submitter', 'A&R Score', 'Consistency', 'Deep Cut Cred']]
+    df = pd.DataFrame({
+        'Submitter': names[has_points],
+        'A&R Score': scores[has_points],
+        'Consistency': consistency[has_points],
+        'Deep Cut Cred': deep_cuts[has_points],
+    })
+    df = df.sort_values('A&R Score', ascending=False)
+    df['Rank'] = range(1, len(df) + 1)
+    df = df[['Rank', 'Submitter', 'A&R Score', 'Consistency', 'Deep Cut Cred']]
 
     return df
 
 
+@st.cache_data(hash_funcs=_MLD_HASH)
 def get_voter_rankings(data: MusicLeagueData) -> pd.DataFrame:
     """
     Get voter rankings formatted for display.
@@ -222,27 +491,35 @@ def get_voter_rankings(data: MusicLeagueData) -> pd.DataFrame:
     Returns:
         DataFrame with voter rankings
     """
-    voter_stats = []
-
-    for voter_id, voter_data in data.competitors.items():
-        golden_ear = VoterMetrics.golden_ear_score(data, voter_id)
-        hipster = VoterMetrics.hipster_score(data, voter_id)
-        generosity, _ = VoterMetrics.generosity_score(data, voter_id)
-
-        voter_stats.append({
-            'Voter': voter_data['name'],
-            'Trendsetter': round(golden_ear, 3),
-            'Obscurity Cred': round(hipster, 2),
-            'Generosity': round(generosity, 2),
-        })
+    n = len(data.competitors)
+    names = np.empty(n, dtype=object)
+    trendsetter = np.empty(n, dtype=np.float64)
+    obscurity = np.empty(n, dtype=np.float64)
+    generosity = np.empty(n, dtype=np.float64)
+    golden_ears = _all_golden_ears(data)
+    hipster_scores = _hipster_scores(data)
+
+    for i, (voter_id, voter_data) in enumerate(data.competitors.items()):
+        names[i] = voter_data['name']
+        trendsetter[i] = round(golden_ears[voter_id], 3)
+        obscurity[i] = round(hipster_scores[voter_id], 2)
+        generosity[i] = round(VoterMetrics.generosity_score(data, voter_id)[0], 2)
+
+    if n == 0:
+        return pd.DataFrame()
 
-    df = pd.DataFrame(voter_stats)
-    if len(df) > 0:
-        df = df.sort_values('Trendsetter', ascending=False)
+    df = pd.DataFrame({
+        'Voter': names,
+        'Trendsetter': trendsetter,
+        'Obscurity Cred': obscurity,
+        'Generosity': generosity,
+    })
+    df = df.sort_values('Trendsetter', ascending=False)
 
     return df
 
 
+@st.cache_data(hash_funcs=_MLD_HASH)
 def get_influence_rankings(data: MusicLeagueData, n: int = 15) -> pd.DataFrame:
     """
     Get influence (PageRank) rankings formatted for display.
@@ -254,7 +531,7 @@ def get_influence_rankings(data: MusicLeagueData, n: int = 15) -> pd.DataFrame:
     Returns:
         DataFrame with influence rankings
     """
-    influence = NetworkMetrics.influence_score(data)
+    influence = _influence(data)
 
     influence_list = [
         {'Voter': name, 'Clout Score': round(score, 4)}
@@ -324,22 +601,15 @@ def calculate_weighted_score(data: MusicLeagueData, weights: Dict[str, float]) -
     Returns:
         Weighted score (0-100 scale)
     """
-    import numpy as np
-    from musicleague.metrics.voters import VoterMetrics
-    from musicleague.metrics.network import NetworkMetrics
-
     stats = get_league_summary_stats(data)
 
     # Calculate real taste score (avg golden ear)
-    golden_ears = [
-        VoterMetrics.golden_ear_score(data, vid)
-        for vid in data.competitors.keys()
-    ]
-    avg_golden_ear = np.mean(golden_ears) if golden_ears else 0
+    golden_ears = np.fromiter(_all_golden_ears(data).values(), dtype=np.float64)
+    avg_golden_ear = np.mean(golden_ears) if len(golden_ears) > 0 else 0
     taste_score = (avg_golden_ear + 1) / 2 * 100  # Normalize -1 to 1 → 0 to 100
 
     # Calculate real clout score (network balance)
-    influence = NetworkMetrics.influence_score(data)
+    influence = _influence(data)
     var_influence = np.var(list(influence.values())) if influence else 0
     clout_score = max(0, 100 - var_influence * 10000)
 
@@ -363,6 +633,7 @@ def calculate_weighted_score(data: MusicLeagueData, weights: Dict[str, float]) -
     return score
 
 
+@st.cache_data(hash_funcs=_MLD_HASH)
 def get_league_champion(data: MusicLeagueData) -> Optional[Dict]:
     """
     Get the top song (champion) of a league.
@@ -373,7 +644,7 @@ def get_league_champion(data: MusicLeagueData) -> Optional[Dict]:
     Returns:
         Dictionary with champion info or None
     """
-    song_df = SongMetrics.get_all_song_metrics(data)
+    song_df = _song_metrics(data)
 
     if len(song_df) == 0:
         return None
@@ -389,6 +660,7 @@ def get_league_champion(data: MusicLeagueData) -> Optional[Dict]:
     }
 
 
+@st.cache_data(hash_funcs=_MLD_HASH)
 def get_player_champion(data: MusicLeagueData) -> Optional[Dict]:
     """
     Get the winning player (most total points) of a league.
@@ -399,15 +671,13 @@ def get_player_champion(data: MusicLeagueData) -> Optional[Dict]:
     Returns:
         Dictionary with player champion info or None
     """
-    from musicleague.metrics.comparisons import CrossRoundMetrics
-
-    song_df = SongMetrics.get_all_song_metrics(data)
+    song_df = _song_metrics(data)
 
     if len(song_df) == 0:
         return None
 
     # Calculate total points per submitter
-    submitter_points = song_df.groupby('submitter').agg({
+    submitter_points = song_df.groupby('submitter', observed=True).agg({
         'total_points': 'sum',
         'song_name': 'count'  # number of submissions
     }).reset_index()
@@ -420,11 +690,9 @@ def get_player_champion(data: MusicLeagueData) -> Optional[Dict]:
     champion = submitter_points.iloc[0]
 
     # Count round wins for this player
-    rankings_df = CrossRoundMetrics.round_rankings(data)
-    round_wins = 0
-    if len(rankings_df) > 0:
-        wins = rankings_df[(rankings_df['submitter'] == champion['submitter']) & (rankings_df['rank'] == 1)]
-        round_wins = len(wins)
+    round_wins = int(
+        _cross_round_bundle(data).round_wins_by_submitter.get(champion['submitter'], 0)
+    )
 
     avg_points = champion['total_points'] / champion['submissions'] if champion['submissions'] > 0 else 0
 
@@ -437,8 +705,64 @@ def get_player_champion(data: MusicLeagueData) -> Optional[Dict]:
     }
 
 
+@st.cache_data(hash_funcs=_MLD_HASH)
+def get_player_scorecard_metrics(data: MusicLeagueData) -> pd.DataFrame:
+    """
+    Get the raw, unweighted scorecard metrics for each player.
+
+    Args:
+        data: MusicLeagueData object
+
+    Returns:
+        DataFrame with columns: player_name, avg_points, underdog,
+        golden_ear, avg_controversy, influence (one row per competitor,
+        in competitor order)
+    """
+    song_df = _song_metrics(data)
+    influence_scores = _influence(data)
+    underdog_scores = SubmitterMetrics.all_underdog_factors(data)
+    average_points = _average_points(data)
+    golden_ears = _all_golden_ears(data)
+
+    rows = []
+    for player_id, player_info in data.competitors.items():
+        player_name = player_info['name']
+
+        player_songs = song_df[song_df['submitter'] == player_name]
+        avg_controversy = player_songs['controversy_score'].mean() if len(player_songs) > 0 else 0
+
+        rows.append({
+            'player_name': player_name,
+            'avg_points': average_points.get(player_id, 0.0),
+            'underdog': underdog_scores.get(player_id, 0.0),
+            'golden_ear': golden_ears.get(player_id, 0.0),
+            'avg_controversy': avg_controversy,
+            'influence': influence_scores.get(player_name, 0),
+        })
+
+    return pd.DataFrame(rows, columns=[
+        'player_name', 'avg_points', 'underdog', 'golden_ear', 'avg_controversy', 'influence',
+    ])
+
+
 # Comment-related helpers
 
+@st.cache_data(hash_funcs=_MLD_HASH)
+def _submitter_comment_stats(data: MusicLeagueData) -> pd.DataFrame:
+    """
+    Get submitter comment stats for a league, computed once per league.
+
+    Args:
+        data: MusicLeagueData object
+
+    Returns:
+        DataFrame from CommentMetrics.get_all_submitter_comment_stats
+    """
+    from musicleague.metrics.comments import CommentMetrics
+
+    return CommentMetrics.get_all_submitter_comment_stats(data)
+
+
 def get_wordsmith_rankings(data: MusicLeagueData) -> pd.DataFrame:
     """
     Get submitters ranked by comment engagement.
@@ -449,21 +773,33 @@ def get_wordsmith_rankings(data: MusicLeagueData) -> pd.DataFrame:
     Returns:
         DataFrame with submitter comment stats
     """
-    from musicleague.metrics.comments import CommentMetrics
-
-    stats_df = CommentMetrics.get_all_submitter_comment_stats(data)
+    stats_df = _submitter_comment_stats(data)
 
     if len(stats_df) == 0:
         return pd.DataFrame()
 
-    display_df = stats_df[[
-        'submitter_name', 'avg_length', 'comment_rate', 'total_comments'
-    ]].copy()
-    display_df.columns = ['Submitter', 'Avg Length', 'Comment Rate %', 'Total Comments']
-    display_df['Rank'] = range(1, len(display_df) + 1)
-    display_df = display_df[['Rank', 'Submitter', 'Avg Length', 'Comment Rate %', 'Total Comments']]
+    return _display_frame(stats_df, {
+        'submitter_name': 'Submitter',
+        'avg_length': 'Avg Length',
+        'comment_rate': 'Comment Rate %',
+        'total_comments': 'Total Comments',
+    }, rank_column='Rank')
+
 
-    return display_df
+@st.cache_data(hash_funcs=_MLD_HASH)
+def _voter_comment_stats(data: MusicLeagueData) -> pd.DataFrame:
+    """
+    Get voter comment stats for a league, computed once per league.
+
+    Args:
+        data: MusicLeagueData object
+
+    Returns:
+        DataFrame from CommentMetrics.get_all_voter_comment_stats
+    """
+    from musicleague.metrics.comments import CommentMetrics
+
+    return CommentMetrics.get_all_voter_comment_stats(data)
 
 
 def get_critic_rankings(data: MusicLeagueData) -> pd.DataFrame:
@@ -476,23 +812,20 @@ def get_critic_rankings(data: MusicLeagueData) -> pd.DataFrame:
     Returns:
         DataFrame with voter comment stats
     """
-    from musicleague.metrics.comments import CommentMetrics
-
-    stats_df = CommentMetrics.get_all_voter_comment_stats(data)
+    stats_df = _voter_comment_stats(data)
 
     if len(stats_df) == 0:
         return pd.DataFrame()
 
-    display_df = stats_df[[
-        'voter_name', 'avg_length', 'comment_rate', 'total_comments'
-    ]].copy()
-    display_df.columns = ['Voter', 'Avg Length', 'Comment Rate %', 'Total Comments']
-    display_df['Rank'] = range(1, len(display_df) + 1)
-    display_df = display_df[['Rank', 'Voter', 'Avg Length', 'Comment Rate %', 'Total Comments']]
-
-    return display_df
+    return _display_frame(stats_df, {
+        'voter_name': 'Voter',
+        'avg_length': 'Avg Length',
+        'comment_rate': 'Comment Rate %',
+        'total_comments': 'Total Comments',
+    }, rank_column='Rank')
 
 
+@st.cache_data(hash_funcs=_MLD_HASH)
 def get_best_comments(data: MusicLeagueData, n: int = 10) -> pd.DataFrame:
     """
     Get top N most notable comments.
@@ -509,37 +842,71 @@ def get_best_comments(data: MusicLeagueData, n: int = 10) -> pd.DataFrame:
     return CommentMetrics.get_notable_comments(data, min_length=20, top_n=n)
 
 
-# Trends-related helpers
+@st.cache_data(hash_funcs=_MLD_HASH)
+def get_comment_vs_points(data: MusicLeagueData) -> pd.DataFrame:
+    """
+    Get submission comment length against points received.
 
-def get_round_by_round_performance(data: MusicLeagueData) -> pd.DataFrame:
+    Args:
+        data: MusicLeagueData object
+
+    Returns:
+        DataFrame from CommentMetrics.submission_comment_vs_points
     """
-    Get performance data formatted for trend charts.
+    from musicleague.metrics.comments import CommentMetrics
+
+    return CommentMetrics.submission_comment_vs_points(data)
+
+
+@st.cache_data(hash_funcs=_MLD_HASH)
+def get_comment_length_correlation(data: MusicLeagueData) -> Dict[str, float]:
+    """
+    Get correlation stats between submission comment length and points.
 
     Args:
         data: MusicLeagueData object
 
     Returns:
-        DataFrame with columns: round_id, round_index, submitter, cumulative_points
+        Dictionary from CommentMetrics.comment_length_correlation
     """
-    from musicleague.metrics.comparisons import CrossRoundMetrics
+    from musicleague.metrics.comments import CommentMetrics
+
+    return CommentMetrics.comment_length_correlation(data)
+
+
+@st.cache_data(hash_funcs=_MLD_HASH)
+def get_comment_engagement(data: MusicLeagueData) -> pd.DataFrame:
+    """
+    Get vote comment engagement for each point value.
+
+    Args:
+        data: MusicLeagueData object
+
+    Returns:
+        DataFrame from CommentMetrics.comment_engagement_by_points
+    """
+    from musicleague.metrics.comments import CommentMetrics
+
+    return CommentMetrics.comment_engagement_by_points(data)
 
-    rows = []
 
-    for submitter_id, submitter_info in data.competitors.items():
-        cumulative = CrossRoundMetrics.cumulative_points_by_round(data, submitter_id)
+# Trends-related helpers
 
-        for i, round_id in enumerate(data.rounds):
-            rows.append({
-                'round_id': round_id,
-                'round_index': i + 1,
-                'submitter_id': submitter_id,
-                'submitter': submitter_info['name'],
-                'cumulative_points': cumulative.get(round_id, 0),
-            })
+@st.cache_data(hash_funcs=_MLD_HASH)
+def get_round_by_round_performance(data: MusicLeagueData) -> pd.DataFrame:
+    """
+    Get performance data formatted for trend charts.
 
-    return pd.DataFrame(rows)
+    Args:
+        data: MusicLeagueData object
+
+    Returns:
+        DataFrame with columns: round_id, round_index, submitter, cumulative_points
+    """
+    return _cross_round_bundle(data).cumulative
 
 
+@st.cache_data(hash_funcs=_MLD_HASH)
 def get_momentum_rankings(data: MusicLeagueData) -> pd.DataFrame:
     """
     Get players ranked by momentum (improving vs declining).
@@ -550,21 +917,18 @@ def get_momentum_rankings(data: MusicLeagueData) -> pd.DataFrame:
     Returns:
         DataFrame with momentum rankings
     """
-    from musicleague.metrics.comparisons import CrossRoundMetrics
-
-    momentum_df = CrossRoundMetrics.get_all_momentum_scores(data)
+    momentum_df = _cross_round_bundle(data).momentum
 
     if len(momentum_df) == 0:
         return pd.DataFrame()
 
-    display_df = momentum_df[[
-        'submitter', 'momentum', 'trend', 'current_streak', 'max_streak'
-    ]].copy()
-    display_df.columns = ['Player', 'Momentum', 'Trend', 'Current Streak', 'Best Streak']
-    display_df['Rank'] = range(1, len(display_df) + 1)
-    display_df = display_df[['Rank', 'Player', 'Momentum', 'Trend', 'Current Streak', 'Best Streak']]
-
-    return display_df
+    return _display_frame(momentum_df, {
+        'submitter': 'Player',
+        'momentum': 'Momentum',
+        'trend': 'Trend',
+        'current_streak': 'Current Streak',
+        'max_streak': 'Best Streak',
+    }, rank_column='Rank')
 
 
 def get_player_round_scores(data: MusicLeagueData, player_name: str) -> pd.DataFrame:
@@ -578,50 +942,38 @@ def get_player_round_scores(data: MusicLeagueData, player_name: str) -> pd.DataF
     Returns:
         DataFrame with columns: round_num, points, cumulative_points
     """
-    from musicleague.metrics.songs import SongMetrics
+    submitter_id = data.name_to_id.get(player_name)
+    if submitter_id is None:
+        return pd.DataFrame()
+
+    # Sum song points per round in one groupby, then restore round order
+    song_df = _song_metrics(data)
+    if len(song_df) == 0:
+        return pd.DataFrame()
 
-    # Find submitter_id by name
-    submitter_id = None
-    for sid, info in data.competitors.items():
-        if info['name'] == player_name:
-            submitter_id = sid
-            break
+    player_songs = song_df[song_df['submitter_id'] == submitter_id]
+    round_points = player_songs.groupby('round_id', observed=True)['total_points'].sum()
+    round_order = pd.Series(range(1, len(data.rounds) + 1), index=data.rounds)
+    round_order = round_order[round_order.index.isin(round_points.index)]
 
-    if submitter_id is None:
+    if len(round_order) == 0:
         return pd.DataFrame()
 
-    rows = []
-    cumulative = 0
-
-    for i, round_id in enumerate(data.rounds):
-        submissions = [
-            s for s in data.submissions
-            if s['submitter_id'] == submitter_id and s['round_id'] == round_id
-        ]
-
-        if submissions:
-            points = sum(
-                SongMetrics.total_points(data, s['spotify_uri'], round_id)
-                for s in submissions
-            )
-            cumulative += points
-            rows.append({
-                'round_num': i + 1,
-                'round_id': round_id,
-                'points': points,
-                'cumulative_points': cumulative,
-            })
-
-    df = pd.DataFrame(rows)
+    df = pd.DataFrame({
+        'round_num': round_order.to_numpy(),
+        'round_id': round_order.index.to_numpy(),
+        'points': round_points.reindex(round_order.index).to_numpy(),
+    })
+    df['cumulative_points'] = df['points'].cumsum()
 
-    if len(df) > 0:
-        # Add first/second half markers
-        midpoint = len(df) // 2
-        df['half'] = ['First Half' if i < midpoint else 'Second Half' for i in range(len(df))]
+    # Add first/second half markers
+    midpoint = len(df) // 2
+    df['half'] = ['First Half' if i < midpoint else 'Second Half' for i in range(len(df))]
 
     return df
 
 
+@st.cache_data(hash_funcs=_MLD_HASH)
 def get_player_arcs(data: MusicLeagueData) -> pd.DataFrame:
     """
     Get player arc data formatted for display.
@@ -641,25 +993,23 @@ def get_player_arcs(data: MusicLeagueData) -> pd.DataFrame:
     Returns:
         DataFrame with player arc data
     """
-    from musicleague.metrics.comparisons import CrossRoundMetrics
-
-    arcs_df = CrossRoundMetrics.get_all_player_arcs(data)
+    arcs_df = _cross_round_bundle(data).arcs
 
     if len(arcs_df) == 0:
         return pd.DataFrame()
 
-    display_df = arcs_df[[
-        'submitter', 'arc_type', 'avg_points', 'consistency',
-        'finishing_strength', 'peak_round', 'peak_points'
-    ]].copy()
-    display_df.columns = [
-        'Player', 'Arc', 'Avg Points', 'Consistency',
-        'Finish Strength', 'Peak Round', 'Peak Points'
-    ]
-
-    return display_df
+    return _display_frame(arcs_df, {
+        'submitter': 'Player',
+        'arc_type': 'Arc',
+        'avg_points': 'Avg Points',
+        'consistency': 'Consistency',
+        'finishing_strength': 'Finish Strength',
+        'peak_round': 'Peak Round',
+        'peak_points': 'Peak Points',
+    })
 
 
+@st.cache_data(hash_funcs=_MLD_HASH)
 def get_round_champions(data: MusicLeagueData) -> pd.DataFrame:
     """
     Get the winner of each round.
@@ -670,20 +1020,18 @@ def get_round_champions(data: MusicLeagueData) -> pd.DataFrame:
     Returns:
         DataFrame with round winners
     """
-    from musicleague.metrics.comparisons import CrossRoundMetrics
-
-    rankings_df = CrossRoundMetrics.round_rankings(data)
+    rankings_df = _cross_round_bundle(data).rankings
 
     if len(rankings_df) == 0:
         return pd.DataFrame()
 
     # Filter to rank 1 only
-    winners = rankings_df[rankings_df['rank'] == 1].copy()
-    winners['Round'] = range(1, len(winners) + 1)
-    winners = winners[['Round', 'submitter', 'song', 'artist', 'points']]
-    winners.columns = ['Round', 'Winner', 'Song', 'Artist', 'Points']
-
-    return winners
+    return _display_frame(rankings_df[rankings_df['rank'] == 1], {
+        'submitter': 'Winner',
+        'song': 'Song',
+        'artist': 'Artist',
+        'points': 'Points',
+    }, rank_column='Round')
 
 
 # Re-export get_available_leagues for convenience
@@ -706,6 +1054,9 @@ __all__ = [
     "get_wordsmith_rankings",
     "get_critic_rankings",
     "get_best_comments",
+    "get_comment_vs_points",
+    "get_comment_length_correlation",
+    "get_comment_engagement",
     # Trends helpers
     "get_round_by_round_performance",
     "get_momentum_rankings",
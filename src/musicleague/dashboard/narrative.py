@@ -3,54 +3,85 @@ Narrative generation for the dashboard.
 Generates colorful, engaging commentary with personality.
 """
 
+import heapq
+import itertools
+from operator import itemgetter
+
 import pandas as pd
-from typing import Dict, Optional, TYPE_CHECKING
+from typing import Dict, Iterator, Optional, Sequence, Tuple, TYPE_CHECKING
 import random
 
+from musicleague.dashboard.helpers import (
+    get_player_champion,
+    _average_points,
+    _cross_round_bundle,
+    _hipster_scores,
+    _influence,
+    _submitter_comment_stats,
+)
+
 if TYPE_CHECKING:
     from musicleague.data.loader import MusicLeagueData
 
 
 # Phrase banks for variety
-CLOSE_MATCH_PHRASES = [
+CLOSE_MATCH_PHRASES = (
     "A photo finish—these two couldn't be more evenly matched.",
     "Separated by a hair. This one came down to the wire.",
     "Too close to call without a recount.",
     "The musical equivalent of a tie-breaker.",
-]
+)
 
-BLOWOUT_PHRASES = [
+BLOWOUT_PHRASES = (
     "Not even close. One league ran away with it.",
     "A commanding lead that was never in doubt.",
     "Complete domination from start to finish.",
     "The kind of gap that makes you double-check the math.",
-]
+)
 
-CONTROVERSY_PHRASES = [
+CONTROVERSY_PHRASES = (
     "This one split the room right down the middle.",
     "Love it or hate it—there was no middle ground.",
     "A polarizing pick that sparked debate.",
     "The votes were scattered like confetti.",
-]
+)
 
-RISING_PLAYER_PHRASES = [
+RISING_PLAYER_PHRASES = (
     "catching fire lately",
     "hitting their stride",
     "building serious momentum",
     "on a hot streak",
-]
+)
 
-FALLING_PLAYER_PHRASES = [
+FALLING_PLAYER_PHRASES = (
     "cooling off after a strong start",
     "losing steam in recent rounds",
     "struggling to recapture early magic",
     "in a bit of a slump",
-]
+)
+
+
+# Private generator so picks don't contend on the module-level random lock
+_rng = random.Random()
+
+# One endless, pre-shuffled cycle per phrase bank
+_cyclers: Dict[Tuple[str, ...], Iterator[str]] = {}
+
+
+def _make_cycler(phrases: Tuple[str, ...]) -> Iterator[str]:
+    """Shuffle a phrase bank once and cycle through it forever."""
+    shuffled = list(phrases)
+    _rng.shuffle(shuffled)
+    return itertools.cycle(shuffled)
 
 
-def _pick(phrases: list) -> str:
-    """Pick a random phrase from a list for variety."""
-    return random.choice(phrases)
+def _pick(phrases: Sequence[str]) -> str:
+    """Pick the next phrase from a bank for variety."""
+    key = tuple(phrases)
+    cycler = _cyclers.get(key)
+    if cycler is None:
+        cycler = _cyclers.setdefault(key, _make_cycler(key))
+    return next(cycler)
 
 
 def generate_champion_commentary(
@@ -62,8 +93,6 @@ def generate_champion_commentary(
     """
     Generate colorful commentary comparing winning players from both leagues.
     """
-    from musicleague.dashboard.helpers import get_player_champion
-
     champ1 = get_player_champion(data1)
     champ2 = get_player_champion(data2)
 
@@ -110,28 +139,16 @@ def generate_submitter_commentary(
     """
     Generate commentary about top submitters with personality.
     """
-    from musicleague.metrics.submitters import SubmitterMetrics
-
-    submitters1 = []
-    for sid, sdata in data1.competitors.items():
-        avg = SubmitterMetrics.average_points_per_submission(data1, sid)
-        if avg > 0:
-            submitters1.append((sdata['name'], avg))
-
-    submitters2 = []
-    for sid, sdata in data2.competitors.items():
-        avg = SubmitterMetrics.average_points_per_submission(data2, sid)
-        if avg > 0:
-            submitters2.append((sdata['name'], avg))
-
-    submitters1.sort(key=lambda x: x[1], reverse=True)
-    submitters2.sort(key=lambda x: x[1], reverse=True)
+    avgs1 = _average_points(data1)
+    avgs2 = _average_points(data2)
+    avgs1 = avgs1[avgs1 > 0]
+    avgs2 = avgs2[avgs2 > 0]
 
-    if not submitters1 or not submitters2:
+    if avgs1.empty or avgs2.empty:
         return "The submitter data is still warming up."
 
-    top1_name, top1_score = submitters1[0]
-    top2_name, top2_score = submitters2[0]
+    top1_name, top1_score = data1.competitors[avgs1.idxmax()]['name'], avgs1.max()
+    top2_name, top2_score = data2.competitors[avgs2.idxmax()]['name'], avgs2.max()
 
     lines = []
     lines.append(f"**{league1_name}**'s top curator: **{top1_name}** averaging {top1_score:.1f} pts per submission")
@@ -159,42 +176,44 @@ def generate_voter_shift_commentary(
     """
     Generate commentary about shifts in voter behavior between leagues.
     """
-    from musicleague.metrics.voters import VoterMetrics
-
     if metric == 'hipster':
-        scores1 = {
-            data1.competitors[vid]['name']: VoterMetrics.hipster_score(data1, vid)
-            for vid in data1.competitors.keys()
-        }
-        scores2 = {
-            data2.competitors[vid]['name']: VoterMetrics.hipster_score(data2, vid)
-            for vid in data2.competitors.keys()
-        }
-
-        common_voters = set(scores1.keys()) & set(scores2.keys())
-
-        if not common_voters:
+        # Only score voters who appear in both leagues
+        if data1.competitors.keys().isdisjoint(data2.competitors):
             return "Different crowds, different vibes—no voters in common."
 
-        changes = {
-            voter: scores2[voter] - scores1[voter]
-            for voter in common_voters if scores1[voter] > 0
-        }
+        hipster1 = _hipster_scores(data1)
+        hipster2 = _hipster_scores(data2)
+
+        changes = {}
+        for vid, voter_info in data1.competitors.items():
+            if vid not in data2.competitors:
+                continue
+            s1 = hipster1[vid]
+            if s1 <= 0:
+                continue
+            changes[voter_info['name']] = hipster2[vid] - s1
 
         if not changes:
             return "Not enough overlap to track the evolution."
 
-        biggest_drop = min(changes.items(), key=lambda x: x[1])
-        biggest_gain = max(changes.items(), key=lambda x: x[1])
+        # Track the extremes and the total in a single pass
+        biggest_drop = biggest_gain = None
+        total_change = 0.0
+        for name, change in changes.items():
+            if biggest_drop is None or change < biggest_drop[1]:
+                biggest_drop = (name, change)
+            if biggest_gain is None or change > biggest_gain[1]:
+                biggest_gain = (name, change)
+            total_change += change
 
         lines = []
-        if abs(biggest_drop[1]) > 10:
-            lines.append(f"**{biggest_drop[0]}** discovered the Top 40—their hipster cred dropped {abs(biggest_drop[1]):.0f} pts")
+        if biggest_drop[1] < -10:
+            lines.append(f"**{biggest_drop[0]}** discovered the Top 40—their hipster cred dropped {-biggest_drop[1]:.0f} pts")
 
         if biggest_gain[1] > 10:
             lines.append(f"**{biggest_gain[0]}** went full crate-digger (+{biggest_gain[1]:.0f} pts into the obscure)")
 
-        avg_change = sum(changes.values()) / len(changes)
+        avg_change = total_change / len(changes)
         if abs(avg_change) > 5:
             if avg_change < 0:
                 lines.append(f"The group is drifting toward the mainstream (avg shift: {avg_change:+.1f})")
@@ -210,43 +229,44 @@ def generate_controversy_commentary(songs_df: pd.DataFrame, league_name: str) ->
     """
     Generate colorful commentary about controversial songs.
     """
-    if len(songs_df) == 0:
+    if songs_df.empty:
         return "Surprisingly, no songs caused a stir. Everyone's getting along."
 
-    top = songs_df.iloc[0]
+    sigma = songs_df['Controversy σ'].iat[0]
 
-    song_desc = f"'{top['Song']}' by {top['Artist']}"
+    song_desc = f"'{songs_df['Song'].iat[0]}' by {songs_df['Artist'].iat[0]}"
 
-    if top['Controversy σ'] > 3.5:
-        return f"The lightning rod: {song_desc} (σ = {top['Controversy σ']:.2f}). Voters couldn't agree if this was genius or garbage—the ultimate love-it-or-leave-it pick."
-    elif top['Controversy σ'] > 2.5:
-        return f"Most divisive: {song_desc} (σ = {top['Controversy σ']:.2f}). {_pick(CONTROVERSY_PHRASES)}"
-    elif top['Controversy σ'] > 1.5:
-        return f"The mild provocateur: {song_desc} (σ = {top['Controversy σ']:.2f}). Enough disagreement to keep things interesting."
+    if sigma > 3.5:
+        return f"The lightning rod: {song_desc} (σ = {sigma:.2f}). Voters couldn't agree if this was genius or garbage—the ultimate love-it-or-leave-it pick."
+    elif sigma > 2.5:
+        return f"Most divisive: {song_desc} (σ = {sigma:.2f}). {_pick(CONTROVERSY_PHRASES)}"
+    elif sigma > 1.5:
+        return f"The mild provocateur: {song_desc} (σ = {sigma:.2f}). Enough disagreement to keep things interesting."
     else:
-        return f"Even the 'controversial' pick, {song_desc}, barely raised an eyebrow (σ = {top['Controversy σ']:.2f}). This league votes as a bloc."
+        return f"Even the 'controversial' pick, {song_desc}, barely raised an eyebrow (σ = {sigma:.2f}). This league votes as a bloc."
 
 
 def generate_hidden_gem_commentary(gems_df: pd.DataFrame, league_name: str) -> str:
     """
     Generate commentary about hidden gems that feels like a discovery.
     """
-    if len(gems_df) == 0:
+    if gems_df.empty:
         return "No hidden gems surfaced—the league stuck to familiar territory."
 
-    top = gems_df.iloc[0]
+    popularity = gems_df['Spotify Pop'].iat[0]
+    points = gems_df['Points'].iat[0]
 
     lines = []
-    lines.append(f"**The Find**: '{top['Song']}' by {top['Artist']}")
+    lines.append(f"**The Find**: '{gems_df['Song'].iat[0]}' by {gems_df['Artist'].iat[0]}")
 
-    if top['Spotify Pop'] < 10:
-        lines.append(f"With just **{top['Spotify Pop']}** Spotify popularity, this was practically unknown to the algorithm—yet it pulled in **{top['Points']} pts**.")
-    elif top['Spotify Pop'] < 30:
-        lines.append(f"Flying under the radar at **{top['Spotify Pop']}** popularity, it earned **{top['Points']} pts** from voters who knew quality when they heard it.")
+    if popularity < 10:
+        lines.append(f"With just **{popularity}** Spotify popularity, this was practically unknown to the algorithm—yet it pulled in **{points} pts**.")
+    elif popularity < 30:
+        lines.append(f"Flying under the radar at **{popularity}** popularity, it earned **{points} pts** from voters who knew quality when they heard it.")
     else:
-        lines.append(f"Not exactly obscure ({top['Spotify Pop']} popularity), but still outperformed expectations with **{top['Points']} pts**.")
+        lines.append(f"Not exactly obscure ({popularity} popularity), but still outperformed expectations with **{points} pts**.")
 
-    lines.append(f"Credit to **{top['Submitted By']}** for digging this one up.")
+    lines.append(f"Credit to **{gems_df['Submitted By'].iat[0]}** for digging this one up.")
 
     return " ".join(lines)
 
@@ -268,57 +288,65 @@ def generate_final_verdict(
 
     margin = winner_score - loser_score
 
-    top_metric = max(weights.items(), key=lambda x: x[1])
+    top_metric = max(weights.items(), key=itemgetter(1))
     metric_name = top_metric[0].replace('_', ' ').title()
 
-    lines = []
+    score_str = f"({winner_score:.1f} to {loser_score:.1f})"
 
     # The headline
     if margin > 25:
-        lines.append(f"**{winner} takes it decisively** ({winner_score:.1f} to {loser_score:.1f})")
-        lines.append("This wasn't close. One league simply brought more heat.")
+        parts = [
+            f"**{winner} takes it decisively** {score_str}",
+            "This wasn't close. One league simply brought more heat.",
+        ]
     elif margin > 15:
-        lines.append(f"**{winner} pulls ahead** ({winner_score:.1f} to {loser_score:.1f})")
-        lines.append("A comfortable margin, though not a runaway.")
+        parts = [
+            f"**{winner} pulls ahead** {score_str}",
+            "A comfortable margin, though not a runaway.",
+        ]
     elif margin > 5:
-        lines.append(f"**{winner} edges out {loser}** ({winner_score:.1f} to {loser_score:.1f})")
-        lines.append("A competitive showing from both sides.")
+        parts = [
+            f"**{winner} edges out {loser}** {score_str}",
+            "A competitive showing from both sides.",
+        ]
     else:
-        lines.append(f"**{winner} by a whisker** ({winner_score:.1f} to {loser_score:.1f})")
-        lines.append("This could've gone either way. Adjust those weights and the story might change.")
-
-    lines.append(f"The deciding factor: **{metric_name}** (weighted at {top_metric[1]}%)")
+        parts = [
+            f"**{winner} by a whisker** {score_str}",
+            "This could've gone either way. Adjust those weights and the story might change.",
+        ]
 
     # Weight breakdown
     active_weights = [(k.replace('_', ' ').title(), v) for k, v in weights.items() if v > 0]
-    active_weights.sort(key=lambda x: x[1], reverse=True)
+    active_weights.sort(key=itemgetter(1), reverse=True)
+    weight_str = ", ".join(f"{name}: {val}%" for name, val in active_weights)
 
-    weight_str = ", ".join([f"{name}: {val}%" for name, val in active_weights])
-    lines.append(f"*Your scoring breakdown: {weight_str}*")
+    parts.append(f"The deciding factor: **{metric_name}** (weighted at {top_metric[1]}%)")
+    parts.append(f"*Your scoring breakdown: {weight_str}*")
 
-    return "\n\n".join(lines)
+    return "\n\n".join(parts)
 
 
 def generate_network_commentary(data: "MusicLeagueData", league_name: str) -> str:
     """
     Generate commentary about network/influence dynamics.
     """
-    from musicleague.metrics.network import NetworkMetrics
-
-    influence = NetworkMetrics.influence_score(data)
+    influence = _influence(data)
 
     if not influence:
         return "The influence web hasn't formed yet—need more voting data."
 
-    top_influencers = sorted(influence.items(), key=lambda x: x[1], reverse=True)[:3]
+    top_influencers = heapq.nlargest(3, influence.items(), key=itemgetter(1))
+
+    # Format each score once up front
+    formatted = [(name, f"{score:.4f}") for name, score in top_influencers]
 
     lines = [f"**Who shapes the vote in {league_name}?**"]
 
-    top_name, top_score = top_influencers[0]
-    lines.append(f"**{top_name}** leads the influence rankings ({top_score:.4f})—when they vote high, others tend to follow.")
+    top_name, top_score = formatted[0]
+    lines.append(f"**{top_name}** leads the influence rankings ({top_score})—when they vote high, others tend to follow.")
 
-    if len(top_influencers) > 1:
-        others = [f"{name} ({score:.4f})" for name, score in top_influencers[1:]]
+    if len(formatted) > 1:
+        others = [f"{name} ({score})" for name, score in formatted[1:]]
         lines.append(f"Also wielding influence: {', '.join(others)}")
 
     return " ".join(lines)
@@ -333,19 +361,15 @@ def generate_wordsmith_commentary(
     """
     Generate commentary comparing comment engagement between leagues.
     """
-    from musicleague.metrics.comments import CommentMetrics
-
-    stats1 = CommentMetrics.get_all_submitter_comment_stats(data1)
-    stats2 = CommentMetrics.get_all_submitter_comment_stats(data2)
+    stats1 = _submitter_comment_stats(data1)
+    stats2 = _submitter_comment_stats(data2)
 
-    if len(stats1) == 0 or len(stats2) == 0:
+    if stats1.empty or stats2.empty:
         return "Comment data is too sparse for a proper comparison."
 
     # Calculate league-wide averages
-    avg_len1 = stats1['avg_length'].mean()
-    avg_len2 = stats2['avg_length'].mean()
-    avg_rate1 = stats1['comment_rate'].mean()
-    avg_rate2 = stats2['comment_rate'].mean()
+    avg_len1, avg_rate1 = stats1[['avg_length', 'comment_rate']].mean()
+    avg_len2, avg_rate2 = stats2[['avg_length', 'comment_rate']].mean()
 
     lines = []
 
@@ -371,13 +395,13 @@ def generate_wordsmith_commentary(
     elif avg_rate2 > avg_rate1 + 5:
         lines.append(f"**{league2_name}** is a touch more engaged ({avg_rate2:.0f}% vs {avg_rate1:.0f}%)")
 
-    # Find top wordsmith in each league
-    if len(stats1) > 0:
-        top1 = stats1.iloc[0]
-        lines.append(f"**{league1_name}**'s wordsmith: **{top1['submitter_name']}** ({top1['avg_length']:.0f} avg chars)")
-    if len(stats2) > 0:
-        top2 = stats2.iloc[0]
-        lines.append(f"**{league2_name}**'s wordsmith: **{top2['submitter_name']}** ({top2['avg_length']:.0f} avg chars)")
+    # Find top wordsmith in each league (without relying on the stats order)
+    if not stats1.empty:
+        top1 = next(stats1.nlargest(1, 'avg_length').itertuples(index=False))
+        lines.append(f"**{league1_name}**'s wordsmith: **{top1.submitter_name}** ({top1.avg_length:.0f} avg chars)")
+    if not stats2.empty:
+        top2 = next(stats2.nlargest(1, 'avg_length').itertuples(index=False))
+        lines.append(f"**{league2_name}**'s wordsmith: **{top2.submitter_name}** ({top2.avg_length:.0f} avg chars)")
 
     return " · ".join(lines) if lines else "Both leagues keep their thoughts to themselves."
 
@@ -390,14 +414,17 @@ def generate_best_comment_showcase(data: "MusicLeagueData", league_name: str) ->
 
     notable = CommentMetrics.get_notable_comments(data, min_length=50, top_n=3)
 
-    if len(notable) == 0:
+    if notable.empty:
         return f"**{league_name}** kept it brief—no standout comments to feature."
 
     lines = [f"**Quotable moments from {league_name}:**"]
 
-    for i, (_, row) in enumerate(notable.iterrows()):
-        truncated = row['comment'][:150] + "..." if len(row['comment']) > 150 else row['comment']
-        lines.append(f"**{row['person']}** on '{row['song']}': \"{truncated}\"")
+    # Truncate long comments in one vectorized pass
+    comments = notable['comment']
+    excerpts = comments.where(comments.str.len() <= 150, comments.str[:150] + "...")
+
+    for row in notable.assign(excerpt=excerpts).itertuples(index=False):
+        lines.append(f"**{row.person}** on '{row.song}': \"{row.excerpt}\"")
 
     return "\n\n".join(lines)
 
@@ -411,21 +438,21 @@ def generate_momentum_commentary(
     """
     Generate commentary comparing momentum between leagues with narrative flair.
     """
-    from musicleague.metrics.comparisons import CrossRoundMetrics
+    momentum1 = _cross_round_bundle(data1).momentum
+    momentum2 = _cross_round_bundle(data2).momentum
 
-    momentum1 = CrossRoundMetrics.get_all_momentum_scores(data1)
-    momentum2 = CrossRoundMetrics.get_all_momentum_scores(data2)
-
-    if len(momentum1) == 0 or len(momentum2) == 0:
+    if momentum1.empty or momentum2.empty:
         return "Need more rounds to spot the trends."
 
     lines = []
 
     # Count rising vs falling players
-    rising1 = len(momentum1[momentum1['trend'] == 'Rising'])
-    falling1 = len(momentum1[momentum1['trend'] == 'Falling'])
-    rising2 = len(momentum2[momentum2['trend'] == 'Rising'])
-    falling2 = len(momentum2[momentum2['trend'] == 'Falling'])
+    trends1 = momentum1['trend'].value_counts()
+    trends2 = momentum2['trend'].value_counts()
+    rising1 = int(trends1.get('Rising', 0))
+    falling1 = int(trends1.get('Falling', 0))
+    rising2 = int(trends2.get('Rising', 0))
+    falling2 = int(trends2.get('Falling', 0))
 
     # Characterize each league's vibe
     if rising1 > falling1 * 2:
@@ -443,14 +470,14 @@ def generate_momentum_commentary(
         lines.append(f"**{league2_name}**: {rising2} rising, {falling2} falling—holding steady")
 
     # Find hottest player in each
-    if len(momentum1) > 0:
-        hot1 = momentum1.iloc[0]
-        if hot1['momentum'] > 0:
-            lines.append(f"**{hot1['submitter']}** is {_pick(RISING_PLAYER_PHRASES)} in {league1_name} (+{hot1['momentum']:.2f})")
-    if len(momentum2) > 0:
-        hot2 = momentum2.iloc[0]
-        if hot2['momentum'] > 0:
-            lines.append(f"**{hot2['submitter']}** is {_pick(RISING_PLAYER_PHRASES)} in {league2_name} (+{hot2['momentum']:.2f})")
+    if not momentum1.empty:
+        hot1 = next(momentum1.itertuples(index=False))
+        if hot1.momentum > 0:
+            lines.append(f"**{hot1.submitter}** is {_pick(RISING_PLAYER_PHRASES)} in {league1_name} (+{hot1.momentum:.2f})")
+    if not momentum2.empty:
+        hot2 = next(momentum2.itertuples(index=False))
+        if hot2.momentum > 0:
+            lines.append(f"**{hot2.submitter}** is {_pick(RISING_PLAYER_PHRASES)} in {league2_name} (+{hot2.momentum:.2f})")
 
     return " · ".join(lines)
 
@@ -467,14 +494,17 @@ ARC_ICONS = {
 
 # Arc type descriptions for narrative
 ARC_DESCRIPTIONS = {
-    "Headliner": ["dominated the stage", "commanded the spotlight", "owned every round"],
-    "Opening Act": ["started hot but faded", "peaked early", "couldn't maintain the heat"],
-    "Encore": ["saved the best for last", "finished on fire", "came back strong"],
-    "Crowd Favorite": ["stayed in the pocket", "delivered consistency", "never missed a beat"],
-    "One-Hit Wonder": ["had that one magic moment", "struck gold once", "caught lightning in a bottle"],
-    "Wild Card": ["kept everyone guessing", "defied prediction", "rode the rollercoaster"],
+    "Headliner": ("dominated the stage", "commanded the spotlight", "owned every round"),
+    "Opening Act": ("started hot but faded", "peaked early", "couldn't maintain the heat"),
+    "Encore": ("saved the best for last", "finished on fire", "came back strong"),
+    "Crowd Favorite": ("stayed in the pocket", "delivered consistency", "never missed a beat"),
+    "One-Hit Wonder": ("had that one magic moment", "struck gold once", "caught lightning in a bottle"),
+    "Wild Card": ("kept everyone guessing", "defied prediction", "rode the rollercoaster"),
 }
 
+# Fallback description for unknown arc types
+_DEFAULT_ARC_DESC = ("performed",)
+
 
 def generate_arc_commentary(
     data1: "MusicLeagueData",
@@ -485,34 +515,28 @@ def generate_arc_commentary(
     """
     Generate commentary comparing player arcs between leagues.
     """
-    from musicleague.metrics.comparisons import CrossRoundMetrics
+    arcs1 = _cross_round_bundle(data1).arcs
+    arcs2 = _cross_round_bundle(data2).arcs
 
-    arcs1 = CrossRoundMetrics.get_all_player_arcs(data1)
-    arcs2 = CrossRoundMetrics.get_all_player_arcs(data2)
-
-    if len(arcs1) == 0 or len(arcs2) == 0:
+    if arcs1.empty or arcs2.empty:
         return "Need more data to analyze player arcs."
 
     lines = []
 
-    # Count arc types per league
-    arc_counts1 = arcs1['arc_type'].value_counts().to_dict()
-    arc_counts2 = arcs2['arc_type'].value_counts().to_dict()
-
-    # Find dominant arc type for each league
-    dominant1 = max(arc_counts1, key=arc_counts1.get) if arc_counts1 else None
-    dominant2 = max(arc_counts2, key=arc_counts2.get) if arc_counts2 else None
+    # Count arc types per league (value_counts is sorted, so the dominant arc comes first)
+    arc_counts1 = arcs1['arc_type'].value_counts()
+    arc_counts2 = arcs2['arc_type'].value_counts()
 
-    if dominant1:
-        count1 = arc_counts1[dominant1]
+    if not arc_counts1.empty:
+        dominant1, count1 = arc_counts1.index[0], arc_counts1.iat[0]
         icon1 = ARC_ICONS.get(dominant1, "")
         lines.append(
             f"**{league1_name}** is a league of {icon1} **{dominant1}s** "
             f"({count1} players)"
         )
 
-    if dominant2:
-        count2 = arc_counts2[dominant2]
+    if not arc_counts2.empty:
+        dominant2, count2 = arc_counts2.index[0], arc_counts2.iat[0]
         icon2 = ARC_ICONS.get(dominant2, "")
         lines.append(
             f"**{league2_name}** skews toward {icon2} **{dominant2}s** "
@@ -520,31 +544,30 @@ def generate_arc_commentary(
         )
 
     # Highlight the top player from each league with their arc
-    if len(arcs1) > 0:
-        top1 = arcs1.iloc[0]
-        desc1 = _pick(ARC_DESCRIPTIONS.get(top1['arc_type'], ["performed"]))
+    if not arcs1.empty:
+        top1 = next(arcs1.itertuples(index=False))
+        desc1 = _pick(ARC_DESCRIPTIONS.get(top1.arc_type, _DEFAULT_ARC_DESC))
         lines.append(
-            f"**{top1['submitter']}** ({top1['arc_type']}) {desc1} in {league1_name}"
+            f"**{top1.submitter}** ({top1.arc_type}) {desc1} in {league1_name}"
         )
 
-    if len(arcs2) > 0:
-        top2 = arcs2.iloc[0]
-        desc2 = _pick(ARC_DESCRIPTIONS.get(top2['arc_type'], ["performed"]))
+    if not arcs2.empty:
+        top2 = next(arcs2.itertuples(index=False))
+        desc2 = _pick(ARC_DESCRIPTIONS.get(top2.arc_type, _DEFAULT_ARC_DESC))
         lines.append(
-            f"**{top2['submitter']}** ({top2['arc_type']}) {desc2} in {league2_name}"
+            f"**{top2.submitter}** ({top2.arc_type}) {desc2} in {league2_name}"
         )
 
     # Look for interesting Encore stories (biggest comeback)
     encores1 = arcs1[arcs1['arc_type'] == 'Encore']
-    encores2 = arcs2[arcs2['arc_type'] == 'Encore']
+    strengths1 = encores1['finishing_strength'].to_numpy()
 
-    if len(encores1) > 0:
-        best_encore1 = encores1.loc[encores1['finishing_strength'].idxmax()]
-        if best_encore1['finishing_strength'] > 0:
-            lines.append(
-                f"Comeback story: **{best_encore1['submitter']}** improved by "
-                f"+{best_encore1['finishing_strength']:.0f} pts/round in the second half"
-            )
+    if strengths1.size and strengths1.max() > 0:
+        best = int(strengths1.argmax())
+        lines.append(
+            f"Comeback story: **{encores1['submitter'].iat[best]}** improved by "
+            f"+{strengths1[best]:.0f} pts/round in the second half"
+        )
 
     return " · ".join(lines)
 
@@ -553,25 +576,22 @@ def generate_round_highlight(data: "MusicLeagueData", round_index: int) -> str:
     """
     Generate commentary for a specific round's results.
     """
-    from musicleague.metrics.comparisons import CrossRoundMetrics
-
-    rankings_df = CrossRoundMetrics.round_rankings(data)
+    bundle = _cross_round_bundle(data)
 
-    if len(rankings_df) == 0:
+    if bundle.rankings.empty:
         return "Round data hasn't loaded yet."
 
     round_ids = data.rounds
     if round_index < 0 or round_index >= len(round_ids):
         return "That round doesn't exist."
 
-    round_id = round_ids[round_index]
-    round_data = rankings_df[rankings_df['round_id'] == round_id]
+    podium = bundle.round_podiums.get(round_ids[round_index])
 
-    if len(round_data) == 0:
+    if not podium:
         return "No submissions recorded for this round."
 
-    winner = round_data.iloc[0]
-    runner_up = round_data.iloc[1] if len(round_data) > 1 else None
+    winner = podium[0]
+    runner_up = podium[1] if len(podium) > 1 else None
 
     lines = []
     lines.append(f"**Round {round_index + 1}**: '{winner['song']}' by {winner['artist']} took the crown")
@@ -3,30 +3,32 @@ Theme configuration for the Soundwave Smackdown dashboard.
 Defines colors, styling, and branding for consistent visual identity.
 """
 
+import hashlib
+import re
+from string import Template
+from types import MappingProxyType
+
 import streamlit as st
-from typing import Optional
+from typing import Dict, Mapping, Optional, Tuple
 
-from musicleague.config import VisualizationConfig
+from musicleague.config import PathConfig, VisualizationConfig
 
-# Page configuration constants
-PAGE_CONFIG = {
+# Page configuration constants (passed to st.set_page_config in streamlit_app.py)
+PAGE_CONFIG = MappingProxyType({
     "page_title": "Music League Dashboard",
     "page_icon": "🎵",
     "layout": "wide",
     "initial_sidebar_state": "expanded",
-}
+})
 
-# Re-export from config for backwards compatibility and convenience
-LEAGUE_COLORS = VisualizationConfig.LEAGUE_COLORS
-ACCENT_COLORS = VisualizationConfig.COLORS_DICT
-METRIC_NAMES = VisualizationConfig.METRIC_NAMES
-COLORS = VisualizationConfig.COLORS_DICT
-COLORS_DARK = VisualizationConfig.COLORS_DARK
-BG_COLORS = VisualizationConfig.BG_COLORS
-SEMANTIC = VisualizationConfig.SEMANTIC
+# Re-export from config for backwards compatibility and convenience.
+# Read-only views, so pages cannot mutate the shared config by accident.
+LEAGUE_COLORS = MappingProxyType(VisualizationConfig.LEAGUE_COLORS)
+ACCENT_COLORS = MappingProxyType(VisualizationConfig.COLORS_DICT)
+METRIC_NAMES = MappingProxyType(VisualizationConfig.METRIC_NAMES)
 
 # Tooltip descriptions for metrics
-METRIC_TOOLTIPS = {
+METRIC_TOOLTIPS = MappingProxyType({
     'total_votes': "How many fans showed up to the gig? This is pure crowd energy.",
     'total_competitors': "How deep is the bench? More players means more variety... or more duds.",
     'total_submissions': "The total number of songs thrown into the ring. A sheer wall of sound!",
@@ -37,73 +39,95 @@ METRIC_TOOLTIPS = {
     'hipster_score': "Who only votes for tracks nobody's ever heard of? This is their badge of honor.",
     'influence_score': "Who's the real MVP? This score shows who's the most influential player in the league's voting network.",
     'generosity_score': "How freely does this voter hand out points? Generous or stingy?",
-}
-
-
-def load_custom_css():
-    """Load custom CSS for dashboard styling.
-
-    This is the single source of truth for all dashboard CSS.
-    All pages should use setup_page() which calls this function.
-    Do NOT add inline CSS to individual page files.
-    """
-    # Get colors from config
-    blue = VisualizationConfig.COLORS_DICT['blue']          # #2980b9
-    blue_dark = VisualizationConfig.COLORS_DARK['blue']     # #1a5276
-    red = VisualizationConfig.COLORS_DICT['red']            # #c0392b
-    red_dark = VisualizationConfig.COLORS_DARK['red']       # #922b21
-    green = VisualizationConfig.COLORS_DICT['green']        # #16a085
-    green_dark = VisualizationConfig.COLORS_DARK['green']   # #0e6655
-    purple = VisualizationConfig.COLORS_DICT['purple']      # #8e44ad
-    purple_dark = VisualizationConfig.COLORS_DARK['purple'] # #6c3483
-    orange = VisualizationConfig.COLORS_DICT['orange']      # #d35400
-    orange_dark = VisualizationConfig.COLORS_DARK['orange'] # #a04000
-    gray = VisualizationConfig.COLORS_DICT['gray']          # #7f8c8d
-    gray_dark = VisualizationConfig.COLORS_DARK['gray']     # #566573
-    white = VisualizationConfig.COLORS_DICT['white']        # #ecf0f1
-    gold = VisualizationConfig.COLORS_DICT['gold']          # #FFC864
-
-    bg_dark = VisualizationConfig.BG_COLORS['dark']         # #1f1f1f
-    bg_card = VisualizationConfig.BG_COLORS['card']         # #2a2a2a
-
-    # Semantic background colors for positive/negative states
-    bg_positive = '#1a3a2a'
-    bg_positive_end = '#1f2f1f'
-    bg_negative = '#3a1a1a'
-    bg_negative_end = '#2f1f1f'
-
-    st.markdown(f"""
-    <style>
+})
+
+# Bound lookups for the getter helpers below
+_league_color = LEAGUE_COLORS.get
+_metric_name = METRIC_NAMES.get
+_metric_tooltip = METRIC_TOOLTIPS.get
+_DEFAULT_LEAGUE_COLOR = ACCENT_COLORS['gray']
+
+
+# File name of the generated stylesheet in the static folder
+_STYLESHEET_NAME = "theme.css"
+
+# Stylesheet palette (token name -> color), read once from config
+_PALETTE = MappingProxyType({
+    'blue': VisualizationConfig.COLORS_DICT['blue'],              # #2980b9
+    'blue_dark': VisualizationConfig.COLORS_DARK['blue'],         # #1a5276
+    'red': VisualizationConfig.COLORS_DICT['red'],                # #c0392b
+    'red_dark': VisualizationConfig.COLORS_DARK['red'],           # #922b21
+    'green': VisualizationConfig.COLORS_DICT['green'],            # #16a085
+    'green_dark': VisualizationConfig.COLORS_DARK['green'],       # #0e6655
+    'purple': VisualizationConfig.COLORS_DICT['purple'],          # #8e44ad
+    'purple_dark': VisualizationConfig.COLORS_DARK['purple'],     # #6c3483
+    'orange': VisualizationConfig.COLORS_DICT['orange'],          # #d35400
+    'orange_dark': VisualizationConfig.COLORS_DARK['orange'],     # #a04000
+    'gray': VisualizationConfig.COLORS_DICT['gray'],              # #7f8c8d
+    'gray_dark': VisualizationConfig.COLORS_DARK['gray'],         # #566573
+    'white': VisualizationConfig.COLORS_DICT['white'],            # #ecf0f1
+    'gold': VisualizationConfig.COLORS_DICT['gold'],              # #FFC864
+    'bg_dark': VisualizationConfig.BG_COLORS['dark'],             # #1f1f1f
+    'bg_card': VisualizationConfig.BG_COLORS['card'],             # #2a2a2a
+    # Semantic backgrounds for positive/negative states
+    'bg_positive': '#1a3a2a',
+    'bg_positive_end': '#1f2f1f',
+    'bg_negative': '#3a1a1a',
+    'bg_negative_end': '#2f1f1f',
+})
+
+
+def _hex_to_rgba(hex_color: str, alpha: float) -> str:
+    """Convert a '#rrggbb' color to an rgba() string with the given alpha."""
+    h = hex_color.lstrip('#')
+    return f"rgba({int(h[0:2], 16)}, {int(h[2:4], 16)}, {int(h[4:6], 16)}, {alpha})"
+
+
+def _linear_gradient(stops: Tuple[str, ...]) -> str:
+    """Build a 135deg linear-gradient with evenly spaced color stops."""
+    last = len(stops) - 1
+    return "linear-gradient(135deg, {})".format(", ".join(
+        f"{color} {round(100 * i / last)}%" for i, color in enumerate(stops)
+    ))
+
+
+# Design tokens: the only part of the stylesheet that depends on the palette.
+# Every other rule reads the palette through var(), so it stays a literal.
+_ROOT_TEMPLATE = Template("""
     /* ==========================================================================
        CSS CUSTOM PROPERTIES (Design Tokens)
        Centralized color and spacing values for consistency
        ========================================================================== */
-    :root {{
+    :root {
         /* Primary colors */
-        --color-blue: {blue};
-        --color-blue-dark: {blue_dark};
-        --color-red: {red};
-        --color-red-dark: {red_dark};
-        --color-green: {green};
-        --color-green-dark: {green_dark};
-        --color-purple: {purple};
-        --color-purple-dark: {purple_dark};
-        --color-orange: {orange};
-        --color-orange-dark: {orange_dark};
-        --color-gray: {gray};
-        --color-gray-dark: {gray_dark};
-        --color-gold: {gold};
-        --color-white: {white};
+        --color-blue: $blue;
+        --color-blue-dark: $blue_dark;
+        --color-red: $red;
+        --color-red-dark: $red_dark;
+        --color-green: $green;
+        --color-green-dark: $green_dark;
+        --color-purple: $purple;
+        --color-purple-dark: $purple_dark;
+        --color-orange: $orange;
+        --color-orange-dark: $orange_dark;
+        --color-gray: $gray;
+        --color-gray-dark: $gray_dark;
+        --color-gold: $gold;
+        --color-white: $white;
 
         /* Background colors */
-        --bg-dark: {bg_dark};
-        --bg-card: {bg_card};
+        --bg-dark: $bg_dark;
+        --bg-card: $bg_card;
 
         /* Semantic backgrounds */
-        --bg-positive: {bg_positive};
-        --bg-positive-end: {bg_positive_end};
-        --bg-negative: {bg_negative};
-        --bg-negative-end: {bg_negative_end};
+        --bg-positive: $bg_positive;
+        --bg-positive-end: $bg_positive_end;
+        --bg-negative: $bg_negative;
+        --bg-negative-end: $bg_negative_end;
+
+        /* Shadows */
+        --shadow-blue: $shadow_blue;
+        --shadow-red: $shadow_red;
 
         /* Common gradients */
         --gradient-dark: linear-gradient(135deg, var(--bg-dark) 0%, var(--bg-card) 100%);
@@ -130,194 +154,170 @@ def load_custom_css():
         --radius-lg: 16px;
         --radius-pill: 20px;
         --radius-round: 50%;
-    }}
-
+    }
+""")
+
+# Page-specific header gradients: (page class, gradient stops). The h1 also
+# carries .gradient-text, so these set background-image: the background
+# shorthand would reset background-clip.
+_HEADER_GRADIENTS = (
+    ("songs", ("var(--color-green)", "var(--bg-dark)")),
+    ("players", ("var(--color-orange)", "var(--color-red)")),
+    ("commentary", ("var(--color-blue)", "var(--color-purple)")),
+    ("trends", ("var(--color-green)", "var(--color-green-dark)")),
+    ("connections", ("var(--color-purple)", "var(--color-blue)")),
+    ("scorecard", ("var(--color-gold)", "var(--color-orange)")),
+    ("home", ("var(--color-blue)", "var(--color-purple)", "var(--color-red)")),
+)
+_HEADER_CSS = "\n".join(
+    f"    .page-header.{page} h1 {{ background-image: {_linear_gradient(stops)}; }}"
+    for page, stops in _HEADER_GRADIENTS
+)
+
+# Shared components and utilities used across pages
+_BASE_CSS = """
     /* ==========================================================================
        BASE UTILITY CLASSES
        Reusable patterns to reduce duplication
        ========================================================================== */
 
     /* Gradient text effect - apply to any element needing gradient text */
-    .gradient-text {{
+    .gradient-text {
         -webkit-background-clip: text;
         -webkit-text-fill-color: transparent;
         background-clip: text;
-    }}
+    }
 
     /* Card base - common card styling */
-    .card-base {{
+    .card-base {
         color: white;
         padding: var(--spacing-lg);
         border-radius: var(--radius-md);
         margin-bottom: var(--spacing-md);
-    }}
+    }
 
     /* Left-border accent card base */
-    .accent-card {{
+    .accent-card {
         background: var(--gradient-dark-reverse);
         border-left: 4px solid var(--color-blue);
         padding: var(--spacing-md) 1.25rem;
         border-radius: 0 var(--radius-sm) var(--radius-sm) 0;
         margin-bottom: 0.75rem;
-    }}
-    .accent-card.positive {{ border-color: var(--color-green); background: var(--gradient-positive); }}
-    .accent-card.negative {{ border-color: var(--color-red); background: var(--gradient-negative); }}
-    .accent-card.neutral {{ border-color: var(--color-gray); }}
-    .accent-card.purple {{ border-color: var(--color-purple); }}
-    .accent-card.green {{ border-color: var(--color-green); }}
+    }
+    .accent-card.positive { border-color: var(--color-green); background: var(--gradient-positive); }
+    .accent-card.negative { border-color: var(--color-red); background: var(--gradient-negative); }
+    .accent-card.neutral { border-color: var(--color-gray); }
+    .accent-card.purple { border-color: var(--color-purple); }
+    .accent-card.green { border-color: var(--color-green); }
 
     /* Common child element patterns */
-    .card-name {{
+    .card-name {
         font-size: 1.3rem;
         font-weight: 700;
         margin-bottom: var(--spacing-sm);
-    }}
-    .card-score {{
+    }
+    .card-score {
         font-size: 2rem;
         font-weight: 900;
         color: var(--color-gold);
-    }}
-    .card-label {{
+    }
+    .card-label {
         font-size: 0.75rem;
         text-transform: uppercase;
         letter-spacing: 1px;
         opacity: 0.8;
-    }}
-    .card-stats {{
+    }
+    .card-stats {
         display: flex;
         gap: var(--spacing-lg);
-    }}
+    }
 
     /* Color modifier classes for gradients */
-    .bg-gradient-blue {{ background: var(--gradient-blue); }}
-    .bg-gradient-red {{ background: var(--gradient-red); }}
-    .bg-gradient-green {{ background: var(--gradient-green); }}
-    .bg-gradient-purple {{ background: var(--gradient-purple); }}
-    .bg-gradient-orange {{ background: var(--gradient-orange); }}
-    .bg-gradient-gold {{ background: var(--gradient-gold); color: var(--bg-dark); }}
-    .bg-gradient-dark {{ background: var(--gradient-dark); }}
-    .bg-gradient-dark-reverse {{ background: var(--gradient-dark-reverse); }}
+    .bg-gradient-blue { background: var(--gradient-blue); }
+    .bg-gradient-red { background: var(--gradient-red); }
+    .bg-gradient-green { background: var(--gradient-green); }
+    .bg-gradient-purple { background: var(--gradient-purple); }
+    .bg-gradient-orange { background: var(--gradient-orange); }
+    .bg-gradient-gold { background: var(--gradient-gold); color: var(--bg-dark); }
+    .bg-gradient-dark { background: var(--gradient-dark); }
+    .bg-gradient-dark-reverse { background: var(--gradient-dark-reverse); }
 
     /* ==========================================================================
        MAIN CONTAINER
        ========================================================================== */
-    .main {{
+    .main {
         padding: 0rem 1rem;
-    }}
+    }
 
     /* ==========================================================================
        PAGE HEADERS - Gradient titles for each page
        ========================================================================== */
-    .page-header {{
+    .page-header {
         text-align: center;
         margin-bottom: var(--spacing-xl);
-    }}
-    .page-header h1 {{
+    }
+    .page-header h1 {
         font-size: 2.5rem;
         font-weight: 900;
         margin-bottom: var(--spacing-sm);
-    }}
-    .page-header p {{
+    }
+    .page-header p {
         color: var(--color-gray);
         font-size: 1.1rem;
-    }}
-
-    /* Page-specific header gradients - background-clip must be with background */
-    .page-header.songs h1 {{
-        background: linear-gradient(135deg, {green} 0%, {bg_dark} 100%);
-        -webkit-background-clip: text;
-        -webkit-text-fill-color: transparent;
-        background-clip: text;
-    }}
-    .page-header.players h1 {{
-        background: linear-gradient(135deg, {orange} 0%, {red} 100%);
-        -webkit-background-clip: text;
-        -webkit-text-fill-color: transparent;
-        background-clip: text;
-    }}
-    .page-header.commentary h1 {{
-        background: linear-gradient(135deg, {blue} 0%, {purple} 100%);
-        -webkit-background-clip: text;
-        -webkit-text-fill-color: transparent;
-        background-clip: text;
-    }}
-    .page-header.trends h1 {{
-        background: linear-gradient(135deg, {green} 0%, {green_dark} 100%);
-        -webkit-background-clip: text;
-        -webkit-text-fill-color: transparent;
-        background-clip: text;
-    }}
-    .page-header.connections h1 {{
-        background: linear-gradient(135deg, {purple} 0%, {blue} 100%);
-        -webkit-background-clip: text;
-        -webkit-text-fill-color: transparent;
-        background-clip: text;
-    }}
-    .page-header.scorecard h1 {{
-        background: linear-gradient(135deg, {gold} 0%, {orange} 100%);
-        -webkit-background-clip: text;
-        -webkit-text-fill-color: transparent;
-        background-clip: text;
-    }}
-    .page-header.home h1 {{
-        background: linear-gradient(135deg, {blue} 0%, {purple} 50%, {red} 100%);
-        -webkit-background-clip: text;
-        -webkit-text-fill-color: transparent;
-        background-clip: text;
-    }}
+    }
 
     /* ==========================================================================
        STAT HIGHLIGHTS - Big number cards
        ========================================================================== */
-    .stat-highlight {{
-        background: linear-gradient(135deg, {blue} 0%, {purple} 100%);
+    .stat-highlight {
+        background: linear-gradient(135deg, var(--color-blue) 0%, var(--color-purple) 100%);
         color: white;
         padding: 1.5rem;
         border-radius: 12px;
         text-align: center;
-    }}
-    .stat-highlight .number {{
+    }
+    .stat-highlight .number {
         font-size: 2.5rem;
         font-weight: 900;
-    }}
-    .stat-highlight .label {{
+    }
+    .stat-highlight .label {
         font-size: 0.85rem;
         opacity: 0.9;
         text-transform: uppercase;
         letter-spacing: 1px;
-    }}
+    }
 
     /* Stat highlight color variants */
-    .stat-highlight.blue {{ background: linear-gradient(135deg, {blue} 0%, {blue_dark} 100%); }}
-    .stat-highlight.red {{ background: linear-gradient(135deg, {red} 0%, {red_dark} 100%); }}
-    .stat-highlight.green {{ background: linear-gradient(135deg, {green} 0%, {green_dark} 100%); }}
-    .stat-highlight.purple {{ background: linear-gradient(135deg, {purple} 0%, {purple_dark} 100%); }}
-    .stat-highlight.orange {{ background: linear-gradient(135deg, {orange} 0%, {orange_dark} 100%); }}
-    .stat-highlight.gold {{ background: linear-gradient(135deg, {gold} 0%, {orange} 100%); color: {bg_dark}; }}
-    .stat-highlight.dark {{ background: linear-gradient(135deg, {bg_dark} 0%, {bg_card} 100%); }}
+    .stat-highlight.blue { background: var(--gradient-blue); }
+    .stat-highlight.red { background: var(--gradient-red); }
+    .stat-highlight.green { background: var(--gradient-green); }
+    .stat-highlight.purple { background: var(--gradient-purple); }
+    .stat-highlight.orange { background: var(--gradient-orange); }
+    .stat-highlight.gold { background: var(--gradient-gold); color: var(--bg-dark); }
+    .stat-highlight.dark { background: var(--gradient-dark); }
 
     /* ==========================================================================
        SECTION HEADERS - Icon + title combos
        ========================================================================== */
-    .section-header {{
+    .section-header {
         display: flex;
         align-items: center;
         gap: 0.75rem;
         margin: 2rem 0 1rem 0;
-    }}
-    .section-header .icon {{
+    }
+    .section-header .icon {
         font-size: 2rem;
-    }}
-    .section-header h2 {{
+    }
+    .section-header h2 {
         margin: 0;
         font-size: 1.5rem;
         font-weight: 700;
-    }}
+    }
 
     /* ==========================================================================
        LEAGUE BADGES - Small colored pills
        ========================================================================== */
-    .league-badge {{
+    .league-badge {
         display: inline-block;
         padding: 0.5rem 1rem;
         border-radius: 20px;
@@ -325,58 +325,14 @@ def load_custom_css():
         font-size: 0.9rem;
         margin-bottom: 1rem;
         color: white;
-    }}
-    .league-badge.blue {{ background: linear-gradient(135deg, {blue} 0%, {blue_dark} 100%); }}
-    .league-badge.red {{ background: linear-gradient(135deg, {red} 0%, {red_dark} 100%); }}
-
-    /* ==========================================================================
-       PLAYER CARDS - Individual player stat cards
-       ========================================================================== */
-    .player-card {{
-        background: linear-gradient(135deg, {bg_dark} 0%, {bg_card} 100%);
-        color: white;
-        padding: 1.5rem;
-        border-radius: 12px;
-        margin-bottom: 1rem;
-        position: relative;
-        overflow: hidden;
-    }}
-    .player-card .rank {{
-        position: absolute;
-        top: 0.75rem;
-        right: 1rem;
-        font-size: 2rem;
-        font-weight: 900;
-        color: rgba(255, 200, 100, 0.3);
-    }}
-    .player-card .name {{
-        font-size: 1.3rem;
-        font-weight: 700;
-        margin-bottom: 0.75rem;
-    }}
-    .player-card .stats {{
-        display: flex;
-        gap: 1.5rem;
-    }}
-    .player-card .stat {{
-        text-align: center;
-    }}
-    .player-card .stat-value {{
-        font-size: 1.5rem;
-        font-weight: 900;
-        color: {gold};
-    }}
-    .player-card .stat-label {{
-        font-size: 0.7rem;
-        text-transform: uppercase;
-        letter-spacing: 1px;
-        opacity: 0.7;
-    }}
+    }
+    .league-badge.blue { background: var(--gradient-blue); }
+    .league-badge.red { background: var(--gradient-red); }
 
     /* ==========================================================================
        TRAIT BADGES - Small colored pills for player traits
        ========================================================================== */
-    .trait-badge {{
+    .trait-badge {
         display: inline-block;
         padding: 0.3rem 0.75rem;
         border-radius: 15px;
@@ -384,148 +340,113 @@ def load_custom_css():
         font-weight: 600;
         margin-right: 0.5rem;
         margin-bottom: 0.5rem;
-    }}
-    .trait-badge.gold {{ background: {gold}; color: {bg_dark}; }}
-    .trait-badge.green {{ background: {green}; color: white; }}
-    .trait-badge.purple {{ background: {purple}; color: white; }}
-    .trait-badge.orange {{ background: {orange}; color: white; }}
-    .trait-badge.blue {{ background: {blue}; color: white; }}
-    .trait-badge.red {{ background: {red}; color: white; }}
+        background: var(--badge-bg, var(--color-gray));
+        color: var(--badge-fg, white);
+    }
+    /* Color variants only set the badge variables */
+    .trait-badge.gold { --badge-bg: var(--color-gold); --badge-fg: var(--bg-dark); }
+    .trait-badge.green { --badge-bg: var(--color-green); }
+    .trait-badge.purple { --badge-bg: var(--color-purple); }
+    .trait-badge.orange { --badge-bg: var(--color-orange); }
+    .trait-badge.blue { --badge-bg: var(--color-blue); }
+    .trait-badge.red { --badge-bg: var(--color-red); }
 
     /* ==========================================================================
        INSIGHT CARDS - Bordered info cards
        ========================================================================== */
-    .insight-card {{
-        background: linear-gradient(135deg, {bg_card} 0%, {bg_dark} 100%);
-        border-left: 4px solid {blue};
+    .insight-card {
+        background: var(--gradient-dark-reverse);
+        border-left: 4px solid var(--color-blue);
         padding: 1.25rem;
         border-radius: 0 12px 12px 0;
         margin-bottom: 1rem;
-    }}
-    .insight-card h4 {{
+    }
+    .insight-card h4 {
         margin: 0 0 0.5rem 0;
         color: white;
-    }}
-    .insight-card p {{
+    }
+    .insight-card p {
         margin: 0;
-        color: {gray};
+        color: var(--color-gray);
         font-size: 0.95rem;
-    }}
-    .insight-card.positive {{ border-color: var(--color-green); background: var(--gradient-positive); }}
-    .insight-card.negative {{ border-color: var(--color-red); background: var(--gradient-negative); }}
-    .insight-card.neutral {{ border-color: {gray}; }}
+    }
+    .insight-card.positive { border-color: var(--color-green); background: var(--gradient-positive); }
+    .insight-card.negative { border-color: var(--color-red); background: var(--gradient-negative); }
+    .insight-card.neutral { border-color: var(--color-gray); }
 
     /* ==========================================================================
        COMMENT CARDS - For commentary booth
        ========================================================================== */
-    .comment-card {{
-        background: linear-gradient(135deg, {bg_card} 0%, {bg_dark} 100%);
-        border-left: 4px solid {blue};
+    .comment-card {
+        background: var(--gradient-dark-reverse);
+        border-left: 4px solid var(--color-blue);
         padding: 1rem;
         border-radius: 0 8px 8px 0;
         margin-bottom: 0.75rem;
-    }}
-    .comment-card .author {{
+    }
+    .comment-card .author {
         color: white;
         font-weight: 600;
-    }}
-    .comment-card .text {{
+    }
+    .comment-card .text {
         color: white;
         margin-top: 0.5rem;
-    }}
-    .comment-card.positive {{ border-color: var(--color-green); background: var(--gradient-positive); }}
-    .comment-card.negative {{ border-color: var(--color-red); background: var(--gradient-negative); }}
-
-    /* ==========================================================================
-       WORDSMITH CARDS - For commentary stats
-       ========================================================================== */
-    .wordsmith-card {{
-        background: linear-gradient(135deg, {blue} 0%, {blue_dark} 100%);
-        color: white;
-        padding: 1.5rem;
-        border-radius: 12px;
-        margin-bottom: 1rem;
-    }}
-    .wordsmith-card.blue {{ background: linear-gradient(135deg, {blue} 0%, {blue_dark} 100%); }}
-    .wordsmith-card.red {{ background: linear-gradient(135deg, {red} 0%, {red_dark} 100%); }}
-    .wordsmith-card .top-label {{
-        font-size: 0.75rem;
-        text-transform: uppercase;
-        opacity: 0.8;
-        letter-spacing: 1px;
-    }}
-    .wordsmith-card .name {{
-        font-size: 1.3rem;
-        font-weight: 700;
-        margin-bottom: 0.5rem;
-    }}
-    .wordsmith-card .stats {{
-        display: flex;
-        gap: 1.5rem;
-        margin-top: 0.75rem;
-    }}
-    .wordsmith-card .stat-value {{
-        font-size: 1.5rem;
-        font-weight: 900;
-    }}
-    .wordsmith-card .stat-label {{
-        font-size: 0.7rem;
-        text-transform: uppercase;
-        opacity: 0.8;
-    }}
+    }
+    .comment-card.positive { border-color: var(--color-green); background: var(--gradient-positive); }
+    .comment-card.negative { border-color: var(--color-red); background: var(--gradient-negative); }
 
     /* ==========================================================================
        MATCHUP CARDS - For league comparisons
        ========================================================================== */
-    .matchup-box {{
+    .matchup-box {
         text-align: center;
         padding: 0.5rem;
-    }}
-    .matchup-box .league-name {{
+    }
+    .matchup-box .league-name {
         padding: 0.75rem;
         border-radius: 8px;
         text-align: center;
         font-weight: 600;
         color: white;
         margin-bottom: 0.5rem;
-    }}
-    .matchup-box .league-name.blue {{ background: linear-gradient(135deg, {blue} 0%, {blue_dark} 100%); }}
-    .matchup-box .league-name.red {{ background: linear-gradient(135deg, {red} 0%, {red_dark} 100%); }}
-    .matchup-box .vs {{
+    }
+    .matchup-box .league-name.blue { background: var(--gradient-blue); }
+    .matchup-box .league-name.red { background: var(--gradient-red); }
+    .matchup-box .vs {
         font-weight: 900;
-        color: {gray};
+        color: var(--color-gray);
         margin: 0.25rem 0;
-    }}
+    }
 
     /* ==========================================================================
        METRIC CARDS - General purpose
        ========================================================================== */
-    .metric-card {{
-        background: linear-gradient(135deg, {blue} 0%, {purple} 100%);
+    .metric-card {
+        background: linear-gradient(135deg, var(--color-blue) 0%, var(--color-purple) 100%);
         padding: 20px;
         border-radius: 10px;
         color: white;
         text-align: center;
         box-shadow: 0 4px 6px rgba(0, 0, 0, 0.3);
-    }}
+    }
 
     /* ==========================================================================
        VS STYLING - For comparison dividers
        ========================================================================== */
-    .vs-text {{
+    .vs-text {
         text-align: center;
         font-size: 4rem;
         font-weight: 900;
-        color: {gold};
+        color: var(--color-gold);
         text-shadow: 2px 2px 4px rgba(0, 0, 0, 0.4);
         padding: 2rem 0;
-    }}
+    }
 
     /* ==========================================================================
        LEAGUE HEADERS - Large titled boxes
        ========================================================================== */
-    .league-header-blue {{
-        background: linear-gradient(135deg, {blue} 0%, {blue_dark} 100%);
+    .league-header {
+        background: var(--header-bg);
         color: white;
         padding: 1.5rem;
         border-radius: 10px;
@@ -533,348 +454,550 @@ def load_custom_css():
         font-size: 1.5rem;
         font-weight: 700;
         margin-bottom: 1rem;
-        box-shadow: 0 4px 6px rgba(41, 128, 185, 0.3);
-    }}
-    .league-header-red {{
-        background: linear-gradient(135deg, {red} 0%, {red_dark} 100%);
-        color: white;
-        padding: 1.5rem;
+        box-shadow: 0 4px 6px var(--header-shadow);
+    }
+    .league-header.blue {
+        --header-bg: var(--gradient-blue);
+        --header-shadow: var(--shadow-blue);
+    }
+    .league-header.red {
+        --header-bg: var(--gradient-red);
+        --header-shadow: var(--shadow-red);
+    }
+
+    /* ==========================================================================
+       TREND INDICATORS
+       ========================================================================== */
+    .trend-up { color: var(--color-green); }
+    .trend-down { color: var(--color-red); }
+    .trend-neutral { color: var(--color-gray); }
+
+    /* ==========================================================================
+       STREAMLIT COMPONENT OVERRIDES
+       ========================================================================== */
+    /* Info box styling */
+    .stAlert {
         border-radius: 10px;
+    }
+
+    /* Dataframe styling */
+    .dataframe {
+        font-size: 0.9rem;
+    }
+
+    /* Tab styling */
+    .stTabs [data-baseweb="tab-list"] {
+        gap: 8px;
+    }
+    .stTabs [data-baseweb="tab"] {
+        height: 50px;
+        padding: 0px 24px;
+        border-radius: 8px 8px 0px 0px;
+        font-weight: 600;
+    }
+    .stTabs [aria-selected="true"] {
+        border-bottom: 3px solid var(--color-blue);
+    }
+
+    /* Button styling */
+    .stButton > button {
+        border-radius: 8px;
+        font-weight: 600;
+        padding: 0.5rem 1.5rem;
+    }
+
+    /* ==========================================================================
+       UTILITY CLASSES
+       ========================================================================== */
+    .text-gold { color: var(--color-gold); }
+    .text-green { color: var(--color-green); }
+    .text-red { color: var(--color-red); }
+    .text-blue { color: var(--color-blue); }
+    .text-purple { color: var(--color-purple); }
+    .text-gray { color: var(--color-gray); }
+    .text-white { color: white; }
+
+    .bg-dark { background: var(--bg-dark); }
+    .bg-card { background: var(--bg-card); }
+
+    /* Size modifiers for the shared card classes */
+    .text-sm { font-size: 0.7rem; }
+    .text-lg { font-size: 1.5rem; }
+    .text-2xl { font-size: 2rem; }
+    .text-3xl { font-size: 3.5rem; }
+"""
+
+# Components that only one page renders, keyed by page name
+_PAGE_CSS = {
+    "home": """
+    /* ==========================================================================
+       HOME PAGE - Hero and navigation
+       ========================================================================== */
+    .hero-title {
         text-align: center;
-        font-size: 1.5rem;
-        font-weight: 700;
+        font-size: 3.5rem;
+        font-weight: 900;
+        background: linear-gradient(135deg, var(--color-blue) 0%, var(--color-purple) 50%, var(--color-red) 100%);
+        -webkit-background-clip: text;
+        -webkit-text-fill-color: transparent;
+        background-clip: text;
+        margin-bottom: 0.5rem;
+        letter-spacing: -2px;
+    }
+    .hero-subtitle {
+        text-align: center;
+        font-size: 1.3rem;
+        color: var(--color-gray);
+        margin-bottom: 2rem;
+    }
+    .vs-badge {
+        display: inline-block;
+        background: var(--gradient-dark);
+        color: var(--color-gold);
+        font-size: 1.8rem;
+        font-weight: 900;
+        padding: 0.5rem 1.5rem;
+        border-radius: 50px;
+        box-shadow: 0 4px 15px rgba(0,0,0,0.3);
+        letter-spacing: 3px;
+    }
+    .league-card {
+        background: linear-gradient(135deg, var(--bg-start) 0%, var(--bg-end) 100%);
+        color: white;
+        padding: 2rem;
+        border-radius: 16px;
+        text-align: center;
+        box-shadow: 0 8px 24px rgba(0,0,0,0.15);
+        transition: transform 0.2s ease;
+    }
+    .league-card:hover {
+        transform: translateY(-4px);
+    }
+    .league-card h2 {
+        margin: 0 0 0.5rem 0;
+        font-size: 1.8rem;
+        color: white !important;
+        border: none !important;
+    }
+    .league-card .stat-big {
+        font-size: 3rem;
+        font-weight: 900;
+        margin: 0.5rem 0;
+    }
+    .league-card .stat-label {
+        font-size: 0.9rem;
+        opacity: 0.85;
+        text-transform: uppercase;
+        letter-spacing: 1px;
+    }
+    .champion-spotlight {
+        background: var(--gradient-dark);
+        color: white;
+        padding: 2rem;
+        border-radius: 16px;
+        position: relative;
+        overflow: hidden;
+    }
+    .champion-spotlight::before {
+        content: "🏆";
+        position: absolute;
+        right: 1rem;
+        top: 1rem;
+        font-size: 4rem;
+        opacity: 0.15;
+    }
+    .champion-spotlight h3 {
+        color: var(--color-gold) !important;
+        margin-top: 0;
+        border: none !important;
+    }
+    .teaser-card {
+        background: var(--gradient-dark-reverse);
+        border-left: 4px solid var(--accent);
+        padding: 1.5rem;
+        border-radius: 0 12px 12px 0;
         margin-bottom: 1rem;
-        box-shadow: 0 4px 6px rgba(192, 57, 43, 0.3);
-    }}
-
+    }
+    .teaser-card h4 {
+        margin: 0 0 0.5rem 0;
+        color: white;
+    }
+    .teaser-card p {
+        margin: 0;
+        color: var(--color-gray);
+        font-size: 0.95rem;
+    }
+    """,
+    "songs": """
     /* ==========================================================================
        SONG CARDS - For songs page
        ========================================================================== */
-    .song-card {{
-        background: linear-gradient(135deg, {bg_dark} 0%, {bg_card} 100%);
+    .song-card {
+        background: var(--gradient-dark);
         color: white;
         padding: 1.5rem;
         border-radius: 12px;
         margin-bottom: 1rem;
-    }}
-    .song-card .title {{
+    }
+    .song-card .title {
         font-size: 1.2rem;
         font-weight: 700;
         margin-bottom: 0.5rem;
-    }}
-    .song-card .artist {{
-        color: {gray};
+    }
+    .song-card .artist {
+        color: var(--color-gray);
         font-size: 0.9rem;
-    }}
-    .song-card .points {{
+    }
+    .song-card .points {
         font-size: 2rem;
         font-weight: 900;
-        color: {gold};
-    }}
+        color: var(--color-gold);
+    }
 
     /* ==========================================================================
-       NETWORK/CONNECTION STYLES
+       CONTROVERSIAL CARDS - Most divisive songs
        ========================================================================== */
-    .connection-card {{
-        background: linear-gradient(135deg, {bg_card} 0%, {bg_dark} 100%);
-        padding: 1rem;
-        border-radius: 8px;
-        margin-bottom: 0.5rem;
-    }}
-    .connection-card .voter {{
-        font-weight: 600;
+    .controversial-card {
+        background: var(--gradient-red);
         color: white;
-    }}
-    .connection-card .change {{
+        padding: 1.5rem;
+        border-radius: 12px;
+        margin-bottom: 1rem;
+    }
+    .controversial-card .label {
+        font-size: 0.8rem;
+        text-transform: uppercase;
+        opacity: 0.8;
+        letter-spacing: 1px;
+    }
+    .controversial-card .song-name {
+        font-size: 1.3rem;
         font-weight: 700;
-    }}
-    .connection-card .change.positive {{ color: {green}; }}
-    .connection-card .change.negative {{ color: {red}; }}
+        margin: 0.5rem 0;
+    }
+    .controversial-card .artist {
+        opacity: 0.85;
+    }
+    .controversial-card .score {
+        margin-top: 1rem;
+        font-size: 2rem;
+        font-weight: 900;
+    }
 
     /* ==========================================================================
-       MOMENTUM CARDS - Trends page player momentum display
+       GEM CARDS - Hidden gems display
        ========================================================================== */
-    .momentum-card {{
-        background: linear-gradient(135deg, {bg_dark} 0%, {bg_card} 100%);
+    .gem-card {
+        background: var(--gradient-dark);
         color: white;
         padding: 1.25rem;
-        border-radius: 12px;
+        border-radius: 10px;
         margin-bottom: 0.75rem;
-        display: flex;
-        justify-content: space-between;
-        align-items: center;
-    }}
-    .momentum-card .player-info {{
-        display: flex;
-        align-items: center;
-        gap: 1rem;
-    }}
-    .momentum-card .trend-icon {{
-        font-size: 1.5rem;
-    }}
-    .momentum-card .name {{
+        border-left: 4px solid var(--color-green);
+    }
+    .gem-card .song-name {
         font-weight: 700;
-        font-size: 1.1rem;
-    }}
-    .momentum-card .streak {{
+        font-size: 1.05rem;
+        margin-bottom: 0.5rem;
+    }
+    .gem-card .meta {
         font-size: 0.85rem;
-        opacity: 0.7;
-    }}
-    .momentum-card .score {{
-        font-size: 1.5rem;
+        color: var(--color-gray);
+    }
+    """,
+    "players": """
+    /* ==========================================================================
+       PLAYER CARDS - Individual player stat cards
+       ========================================================================== */
+    .player-card {
+        background: var(--gradient-dark);
+        color: white;
+        padding: 1.5rem;
+        border-radius: 12px;
+        margin-bottom: 1rem;
+        position: relative;
+        overflow: hidden;
+    }
+    .player-card .rank {
+        position: absolute;
+        top: 0.75rem;
+        right: 1rem;
+        font-size: 2rem;
         font-weight: 900;
-    }}
-    .momentum-card .score.rising {{ color: {green}; }}
-    .momentum-card .score.falling {{ color: {red}; }}
-    .momentum-card .score.steady {{ color: {gray}; }}
+        color: rgba(255, 200, 100, 0.3);
+    }
+    .player-card .stat {
+        text-align: center;
+    }
 
     /* ==========================================================================
-       CHAMPION ROWS - Round-by-round winners
+       NETWORK/CONNECTION STYLES
        ========================================================================== */
-    .champion-row {{
-        background: linear-gradient(135deg, {bg_card} 0%, {bg_dark} 100%);
-        padding: 1rem 1.25rem;
+    .connection-card {
+        background: var(--gradient-dark-reverse);
+        padding: 1rem;
         border-radius: 8px;
         margin-bottom: 0.5rem;
-        display: flex;
-        justify-content: space-between;
-        align-items: center;
-    }}
-    .champion-row .round-num {{
-        background: {gold};
-        color: {bg_dark};
-        width: 32px;
-        height: 32px;
-        border-radius: 50%;
-        display: flex;
-        align-items: center;
-        justify-content: center;
-        font-weight: 700;
-        font-size: 0.9rem;
-    }}
-    .champion-row .song-info {{
-        flex: 1;
-        margin-left: 1rem;
-    }}
-    .champion-row .song-name {{
+    }
+    .connection-card .voter {
+        font-weight: 600;
+        color: white;
+    }
+    .connection-card .change {
         font-weight: 700;
+    }
+    .connection-card .change.positive { color: var(--color-green); }
+    .connection-card .change.negative { color: var(--color-red); }
+    """,
+    "commentary": """
+    /* ==========================================================================
+       WORDSMITH CARDS - For commentary stats
+       ========================================================================== */
+    .wordsmith-card {
+        background: var(--gradient-blue);
         color: white;
-    }}
-    .champion-row .winner-name {{
-        font-size: 0.85rem;
-        color: #a0a0a0;
-    }}
-    .champion-row .points {{
-        font-weight: 900;
-        color: {green};
-    }}
+        padding: 1.5rem;
+        border-radius: 12px;
+        margin-bottom: 1rem;
+    }
+    .wordsmith-card.blue { background: var(--gradient-blue); }
+    .wordsmith-card.red { background: var(--gradient-red); }
 
     /* ==========================================================================
-       CHAMPION CARDS - Final Scorecard winner display
+       CRITIC CARDS - For top critic display
        ========================================================================== */
-    .champion-card {{
-        background: linear-gradient(135deg, {bg_dark} 0%, {bg_card} 100%);
+    .critic-card {
+        background: var(--gradient-purple);
         color: white;
-        padding: 2rem;
-        border-radius: 16px;
-        text-align: center;
-        position: relative;
-        overflow: hidden;
-    }}
-    .champion-card::before {{
-        content: "👑";
-        position: absolute;
-        top: 1rem;
-        right: 1rem;
-        font-size: 3rem;
-        opacity: 0.2;
-    }}
-    .champion-card .league {{
-        font-size: 0.85rem;
+        padding: 1.5rem;
+        border-radius: 12px;
+        margin-bottom: 1rem;
+    }
+    .critic-card .top-label {
+        font-size: 0.75rem;
         text-transform: uppercase;
-        letter-spacing: 2px;
-        opacity: 0.7;
-        margin-bottom: 0.5rem;
-    }}
-    .champion-card .name {{
+        opacity: 0.8;
+        letter-spacing: 1px;
+    }
+    .critic-card .name {
+        font-size: 1.3rem;
+        font-weight: 700;
+        margin: 0.5rem 0;
+    }
+    .critic-card .score {
         font-size: 2rem;
         font-weight: 900;
-        margin-bottom: 0.5rem;
-    }}
-    .champion-card .score {{
-        font-size: 3.5rem;
-        font-weight: 900;
-        color: {gold};
-    }}
-    .champion-card .margin {{
+    }
+    .critic-card .unit {
         font-size: 0.9rem;
-        opacity: 0.7;
-        margin-top: 0.5rem;
-    }}
-    .champion-card.blue {{ background: linear-gradient(135deg, {blue} 0%, {blue_dark} 100%); }}
-    .champion-card.red {{ background: linear-gradient(135deg, {red} 0%, {red_dark} 100%); }}
-
-    /* ==========================================================================
-       WEIGHT CARDS - Scorecard weight sliders
-       ========================================================================== */
-    .weight-card {{
-        background: linear-gradient(135deg, {bg_card} 0%, {bg_dark} 100%);
-        padding: 1rem 1.25rem;
-        border-radius: 8px;
-        margin-bottom: 0.5rem;
-        display: flex;
-        justify-content: space-between;
-        align-items: center;
-    }}
-    .weight-card .metric {{
-        font-weight: 600;
-        color: white;
-    }}
-    .weight-card .value {{
-        font-size: 1.2rem;
-        font-weight: 900;
-        color: {gold};
-    }}
+        opacity: 0.8;
+    }
 
     /* ==========================================================================
-       VERDICT BOX - Final verdict display
+       QUOTE CARDS - Hall of Fame comments
        ========================================================================== */
-    .verdict-box {{
-        background: linear-gradient(135deg, {bg_dark} 0%, {bg_card} 100%);
+    .quote-card {
+        background: var(--gradient-dark);
         color: white;
-        padding: 2rem;
-        border-radius: 16px;
-        text-align: center;
-        margin: 2rem 0;
-    }}
-    .verdict-box .title {{
+        padding: 1.5rem;
+        border-radius: 12px;
+        margin-bottom: 1rem;
+        position: relative;
+    }
+    .quote-card::before {
+        content: '"';
+        font-size: 4rem;
+        position: absolute;
+        top: -0.5rem;
+        left: 0.5rem;
+        opacity: 0.15;
+        font-family: Georgia, serif;
+    }
+    .quote-card .quote-text {
+        font-style: italic;
+        font-size: 1.05rem;
+        line-height: 1.5;
+        margin-bottom: 1rem;
+        padding-left: 1rem;
+    }
+    .quote-card .quote-meta {
         font-size: 0.85rem;
-        text-transform: uppercase;
-        letter-spacing: 2px;
         opacity: 0.7;
-        margin-bottom: 1rem;
-    }}
-    .verdict-box .content {{
-        font-size: 1.1rem;
-        line-height: 1.6;
-    }}
+    }
+    .quote-card .quote-author {
+        font-weight: 700;
+        color: var(--color-gold);
+    }
 
     /* ==========================================================================
-       METRIC EXPLAINER - Scorecard metric descriptions
+       INSIGHT BOX - Commentary analysis
        ========================================================================== */
-    .metric-explainer {{
-        background: linear-gradient(135deg, {bg_card} 0%, {bg_dark} 100%);
-        border-left: 4px solid {purple};
+    .insight-box {
+        background: var(--gradient-dark-reverse);
+        border-left: 4px solid var(--color-blue);
         padding: 1rem 1.25rem;
         border-radius: 0 8px 8px 0;
-        margin-bottom: 0.75rem;
-    }}
-    .metric-explainer .name {{
-        font-weight: 700;
+        margin: 1rem 0;
         color: white;
-    }}
-    .metric-explainer .desc {{
-        color: #a0a0a0;
-        font-size: 0.9rem;
-    }}
-
+    }
+    .insight-box strong { color: white; }
+    .insight-box.positive {
+        border-color: var(--color-green);
+        background: var(--gradient-positive);
+    }
+    .insight-box.negative {
+        border-color: var(--color-red);
+        background: var(--gradient-negative);
+    }
+    .insight-box.neutral { border-color: var(--color-gray); }
+    """,
+    "trends": """
     /* ==========================================================================
-       INFLUENCE CARDS - Connections page
+       MOMENTUM CARDS - Trends page player momentum display
        ========================================================================== */
-    .influence-card {{
-        background: linear-gradient(135deg, {bg_dark} 0%, {bg_card} 100%);
+    .momentum-card {
+        background: var(--gradient-dark);
         color: white;
-        padding: 1.5rem;
+        padding: 1.25rem;
         border-radius: 12px;
-        text-align: center;
-        margin-bottom: 1rem;
-    }}
-    .influence-card .rank {{
+        margin-bottom: 0.75rem;
+        display: flex;
+        justify-content: space-between;
+        align-items: center;
+    }
+    .momentum-card .player-info {
+        display: flex;
+        align-items: center;
+        gap: 1rem;
+    }
+    .momentum-card .trend-icon {
+        font-size: 1.5rem;
+    }
+    .momentum-card .name {
+        font-weight: 700;
+        font-size: 1.1rem;
+    }
+    .momentum-card .streak {
         font-size: 0.85rem;
-        text-transform: uppercase;
-        letter-spacing: 1px;
         opacity: 0.7;
+    }
+    .momentum-card .score {
+        font-size: 1.5rem;
+        font-weight: 900;
+    }
+    .momentum-card .score.rising { color: var(--color-green); }
+    .momentum-card .score.falling { color: var(--color-red); }
+    .momentum-card .score.steady { color: var(--color-gray); }
+
+    /* ==========================================================================
+       CHAMPION ROWS - Round-by-round winners
+       ========================================================================== */
+    .champion-row {
+        background: var(--gradient-dark-reverse);
+        padding: 1rem 1.25rem;
+        border-radius: 8px;
         margin-bottom: 0.5rem;
-    }}
-    .influence-card .name {{
-        font-size: 1.3rem;
+        display: flex;
+        justify-content: space-between;
+        align-items: center;
+    }
+    .champion-row .round-num {
+        background: var(--color-gold);
+        color: var(--bg-dark);
+        width: 32px;
+        height: 32px;
+        border-radius: 50%;
+        display: flex;
+        align-items: center;
+        justify-content: center;
         font-weight: 700;
-        margin-bottom: 0.5rem;
-    }}
-    .influence-card .score {{
-        font-size: 2.5rem;
+        font-size: 0.9rem;
+    }
+    .champion-row .song-info {
+        flex: 1;
+        margin-left: 1rem;
+    }
+    .champion-row .song-name {
+        font-weight: 700;
+        color: white;
+    }
+    .champion-row .winner-name {
+        font-size: 0.85rem;
+        color: #a0a0a0;
+    }
+    .champion-row .points {
         font-weight: 900;
-        color: {gold};
-    }}
-    .influence-card .score-label {{
-        font-size: 0.75rem;
-        text-transform: uppercase;
-        letter-spacing: 1px;
-        opacity: 0.7;
-    }}
+        color: var(--color-green);
+    }
 
     /* ==========================================================================
-       CONTROVERSIAL CARDS - Most divisive songs
+       ROUND CHAMPION CARDS - For trends page champions
        ========================================================================== */
-    .controversial-card {{
-        background: linear-gradient(135deg, {red} 0%, {red_dark} 100%);
+    .round-champion-card {
         color: white;
         padding: 1.5rem;
         border-radius: 12px;
-        margin-bottom: 1rem;
-    }}
-    .controversial-card .label {{
+        text-align: center;
+    }
+    .round-champion-card.blue { background: var(--gradient-blue); }
+    .round-champion-card.red { background: var(--gradient-red); }
+    .round-champion-card .label {
         font-size: 0.8rem;
         text-transform: uppercase;
         opacity: 0.8;
         letter-spacing: 1px;
-    }}
-    .controversial-card .song-name {{
-        font-size: 1.3rem;
+    }
+    .round-champion-card .name {
+        font-size: 1.5rem;
         font-weight: 700;
         margin: 0.5rem 0;
-    }}
-    .controversial-card .artist {{
-        opacity: 0.85;
-    }}
-    .controversial-card .score {{
-        margin-top: 1rem;
-        font-size: 2rem;
+    }
+    .round-champion-card .wins {
+        font-size: 2.5rem;
         font-weight: 900;
-    }}
-
+        color: var(--color-gold);
+    }
+    """,
+    "connections": """
     /* ==========================================================================
-       ROUND CHAMPION CARDS - For trends page champions
+       INFLUENCE CARDS - Connections page
        ========================================================================== */
-    .round-champion-card {{
+    .influence-card {
+        background: var(--gradient-dark);
         color: white;
         padding: 1.5rem;
         border-radius: 12px;
         text-align: center;
-    }}
-    .round-champion-card.blue {{ background: linear-gradient(135deg, {blue} 0%, {blue_dark} 100%); }}
-    .round-champion-card.red {{ background: linear-gradient(135deg, {red} 0%, {red_dark} 100%); }}
-    .round-champion-card .label {{
-        font-size: 0.8rem;
+        margin-bottom: 1rem;
+    }
+    .influence-card .rank {
+        font-size: 0.85rem;
         text-transform: uppercase;
-        opacity: 0.8;
         letter-spacing: 1px;
-    }}
-    .round-champion-card .name {{
-        font-size: 1.5rem;
+        opacity: 0.7;
+        margin-bottom: 0.5rem;
+    }
+    .influence-card .name {
+        font-size: 1.3rem;
         font-weight: 700;
-        margin: 0.5rem 0;
-    }}
-    .round-champion-card .wins {{
+        margin-bottom: 0.5rem;
+    }
+    .influence-card .score {
         font-size: 2.5rem;
         font-weight: 900;
-        color: {gold};
-    }}
+        color: var(--color-gold);
+    }
+    .influence-card .score-label {
+        font-size: 0.75rem;
+        text-transform: uppercase;
+        letter-spacing: 1px;
+        opacity: 0.7;
+    }
 
     /* ==========================================================================
        INFLUENCE CHANGE ROWS - For connections page
        ========================================================================== */
-    .influence-change-row {{
+    .influence-change-row {
         padding: 0.75rem 1rem;
         border-radius: 8px;
         margin-bottom: 0.5rem;
@@ -882,347 +1005,282 @@ def load_custom_css():
         justify-content: space-between;
         align-items: center;
         border-left: 4px solid;
-    }}
-    .influence-change-row.positive {{
+    }
+    .influence-change-row.positive {
         background: var(--gradient-positive);
         border-color: var(--color-green);
-    }}
-    .influence-change-row.negative {{
+    }
+    .influence-change-row.negative {
         background: var(--gradient-negative);
         border-color: var(--color-red);
-    }}
-    .influence-change-row .name {{
+    }
+    .influence-change-row .name {
         font-weight: 600;
         color: white;
-    }}
-    .influence-change-row.positive .change {{ color: {green}; font-weight: 700; }}
-    .influence-change-row.negative .change {{ color: {red}; font-weight: 700; }}
-
-    /* ==========================================================================
-       CRITIC CARDS - For top critic display
-       ========================================================================== */
-    .critic-card {{
-        background: linear-gradient(135deg, {purple} 0%, {purple_dark} 100%);
-        color: white;
-        padding: 1.5rem;
-        border-radius: 12px;
-        margin-bottom: 1rem;
-    }}
-    .critic-card .top-label {{
-        font-size: 0.75rem;
-        text-transform: uppercase;
-        opacity: 0.8;
-        letter-spacing: 1px;
-    }}
-    .critic-card .name {{
-        font-size: 1.3rem;
-        font-weight: 700;
-        margin: 0.5rem 0;
-    }}
-    .critic-card .score {{
-        font-size: 2rem;
-        font-weight: 900;
-    }}
-    .critic-card .unit {{
-        font-size: 0.9rem;
-        opacity: 0.8;
-    }}
-
-    /* ==========================================================================
-       QUOTE CARDS - Hall of Fame comments
-       ========================================================================== */
-    .quote-card {{
-        background: linear-gradient(135deg, {bg_dark} 0%, {bg_card} 100%);
-        color: white;
-        padding: 1.5rem;
-        border-radius: 12px;
-        margin-bottom: 1rem;
-        position: relative;
-    }}
-    .quote-card::before {{
-        content: '"';
-        font-size: 4rem;
-        position: absolute;
-        top: -0.5rem;
-        left: 0.5rem;
-        opacity: 0.15;
-        font-family: Georgia, serif;
-    }}
-    .quote-card .quote-text {{
-        font-style: italic;
-        font-size: 1.05rem;
-        line-height: 1.5;
-        margin-bottom: 1rem;
-        padding-left: 1rem;
-    }}
-    .quote-card .quote-meta {{
-        font-size: 0.85rem;
-        opacity: 0.7;
-    }}
-    .quote-card .quote-author {{
-        font-weight: 700;
-        color: {gold};
-    }}
-
-    /* ==========================================================================
-       GEM CARDS - Hidden gems display
-       ========================================================================== */
-    .gem-card {{
-        background: linear-gradient(135deg, {bg_dark} 0%, {bg_card} 100%);
-        color: white;
-        padding: 1.25rem;
-        border-radius: 10px;
-        margin-bottom: 0.75rem;
-        border-left: 4px solid {green};
-    }}
-    .gem-card .song-name {{
-        font-weight: 700;
-        font-size: 1.05rem;
-        margin-bottom: 0.5rem;
-    }}
-    .gem-card .meta {{
-        font-size: 0.85rem;
-        color: {gray};
-    }}
-
-    /* ==========================================================================
-       INSIGHT BOX - Commentary analysis
-       ========================================================================== */
-    .insight-box {{
-        background: linear-gradient(135deg, {bg_card} 0%, {bg_dark} 100%);
-        border-left: 4px solid {blue};
-        padding: 1rem 1.25rem;
-        border-radius: 0 8px 8px 0;
-        margin: 1rem 0;
-        color: white;
-    }}
-    .insight-box strong {{ color: white; }}
-    .insight-box.positive {{
-        border-color: var(--color-green);
-        background: var(--gradient-positive);
-    }}
-    .insight-box.negative {{
-        border-color: var(--color-red);
-        background: var(--gradient-negative);
-    }}
-    .insight-box.neutral {{ border-color: {gray}; }}
+    }
+    .influence-change-row.positive .change { color: var(--color-green); font-weight: 700; }
+    .influence-change-row.negative .change { color: var(--color-red); font-weight: 700; }
 
     /* ==========================================================================
        RELATIONSHIP ROWS - Reciprocity display
        ========================================================================== */
-    .relationship-row {{
-        background: linear-gradient(135deg, {bg_card} 0%, {bg_dark} 100%);
+    .relationship-row {
+        background: var(--gradient-dark-reverse);
         padding: 1rem 1.25rem;
         border-radius: 8px;
         margin-bottom: 0.5rem;
         display: flex;
         justify-content: space-between;
         align-items: center;
-    }}
-    .relationship-row .pair {{
+    }
+    .relationship-row .pair {
         font-weight: 600;
         color: white;
-    }}
-    .relationship-row .stats {{
+    }
+    .relationship-row .stats {
         display: flex;
         gap: 1.5rem;
         font-size: 0.9rem;
-        color: {gray};
-    }}
-    .relationship-row .reciprocity {{
+        color: var(--color-gray);
+    }
+    .relationship-row .reciprocity {
         font-weight: 700;
-        color: {green};
-    }}
+        color: var(--color-green);
+    }
 
     /* ==========================================================================
        NETWORK STATS - Small stat boxes
        ========================================================================== */
-    .network-stat {{
-        background: linear-gradient(135deg, {bg_card} 0%, {bg_dark} 100%);
+    .network-stat {
+        background: var(--gradient-dark-reverse);
         padding: 1rem;
         border-radius: 8px;
         text-align: center;
-    }}
-    .network-stat .value {{
+    }
+    .network-stat .value {
         font-size: 1.8rem;
         font-weight: 900;
         color: white;
-    }}
-    .network-stat .label {{
+    }
+    .network-stat .label {
         font-size: 0.75rem;
         color: #a0a0a0;
         text-transform: uppercase;
-    }}
-
+    }
+    """,
+    "scorecard": """
     /* ==========================================================================
-       HOME PAGE - Hero and navigation
+       CHAMPION CARDS - Final Scorecard winner display
        ========================================================================== */
-    .hero-title {{
-        text-align: center;
-        font-size: 3.5rem;
-        font-weight: 900;
-        background: linear-gradient(135deg, {blue} 0%, {purple} 50%, {red} 100%);
-        -webkit-background-clip: text;
-        -webkit-text-fill-color: transparent;
-        background-clip: text;
-        margin-bottom: 0.5rem;
-        letter-spacing: -2px;
-    }}
-    .hero-subtitle {{
-        text-align: center;
-        font-size: 1.3rem;
-        color: {gray};
-        margin-bottom: 2rem;
-    }}
-    .vs-badge {{
-        display: inline-block;
-        background: linear-gradient(135deg, {bg_dark} 0%, {bg_card} 100%);
-        color: {gold};
-        font-size: 1.8rem;
-        font-weight: 900;
-        padding: 0.5rem 1.5rem;
-        border-radius: 50px;
-        box-shadow: 0 4px 15px rgba(0,0,0,0.3);
-        letter-spacing: 3px;
-    }}
-    .league-card {{
-        background: linear-gradient(135deg, var(--bg-start) 0%, var(--bg-end) 100%);
+    .champion-card {
+        background: var(--gradient-dark);
         color: white;
         padding: 2rem;
         border-radius: 16px;
         text-align: center;
-        box-shadow: 0 8px 24px rgba(0,0,0,0.15);
-        transition: transform 0.2s ease;
-    }}
-    .league-card:hover {{
-        transform: translateY(-4px);
-    }}
-    .league-card h2 {{
-        margin: 0 0 0.5rem 0;
-        font-size: 1.8rem;
-        color: white !important;
-        border: none !important;
-    }}
-    .league-card .stat-big {{
-        font-size: 3rem;
-        font-weight: 900;
-        margin: 0.5rem 0;
-    }}
-    .league-card .stat-label {{
-        font-size: 0.9rem;
-        opacity: 0.85;
-        text-transform: uppercase;
-        letter-spacing: 1px;
-    }}
-    .champion-spotlight {{
-        background: linear-gradient(135deg, {bg_dark} 0%, {bg_card} 100%);
-        color: white;
-        padding: 2rem;
-        border-radius: 16px;
         position: relative;
         overflow: hidden;
-    }}
-    .champion-spotlight::before {{
-        content: "🏆";
+    }
+    .champion-card::before {
+        content: "👑";
         position: absolute;
-        right: 1rem;
         top: 1rem;
-        font-size: 4rem;
-        opacity: 0.15;
-    }}
-    .champion-spotlight h3 {{
-        color: {gold} !important;
-        margin-top: 0;
-        border: none !important;
-    }}
-    .teaser-card {{
-        background: linear-gradient(135deg, {bg_card} 0%, {bg_dark} 100%);
-        border-left: 4px solid var(--accent);
-        padding: 1.5rem;
-        border-radius: 0 12px 12px 0;
-        margin-bottom: 1rem;
-    }}
-    .teaser-card h4 {{
-        margin: 0 0 0.5rem 0;
-        color: white;
-    }}
-    .teaser-card p {{
-        margin: 0;
-        color: {gray};
-        font-size: 0.95rem;
-    }}
+        right: 1rem;
+        font-size: 3rem;
+        opacity: 0.2;
+    }
+    .champion-card .margin {
+        font-size: 0.9rem;
+        opacity: 0.7;
+        margin-top: 0.5rem;
+    }
+    .champion-card.blue { background: var(--gradient-blue); }
+    .champion-card.red { background: var(--gradient-red); }
 
     /* ==========================================================================
-       TREND INDICATORS
+       WEIGHT CARDS - Scorecard weight sliders
        ========================================================================== */
-    .trend-up {{ color: {green}; }}
-    .trend-down {{ color: {red}; }}
-    .trend-neutral {{ color: {gray}; }}
+    .weight-card {
+        background: var(--gradient-dark-reverse);
+        padding: 1rem 1.25rem;
+        border-radius: 8px;
+        margin-bottom: 0.5rem;
+        display: flex;
+        justify-content: space-between;
+        align-items: center;
+    }
+    .weight-card .metric {
+        font-weight: 600;
+        color: white;
+    }
+    .weight-card .value {
+        font-size: 1.2rem;
+        font-weight: 900;
+        color: var(--color-gold);
+    }
 
     /* ==========================================================================
-       STREAMLIT COMPONENT OVERRIDES
+       VERDICT BOX - Final verdict display
        ========================================================================== */
-    /* Info box styling */
-    .stAlert {{
-        border-radius: 10px;
-    }}
+    .verdict-box {
+        background: var(--gradient-dark);
+        color: white;
+        padding: 2rem;
+        border-radius: 16px;
+        text-align: center;
+        margin: 2rem 0;
+    }
+    .verdict-box .title {
+        font-size: 0.85rem;
+        text-transform: uppercase;
+        letter-spacing: 2px;
+        opacity: 0.7;
+        margin-bottom: 1rem;
+    }
+    .verdict-box .content {
+        font-size: 1.1rem;
+        line-height: 1.6;
+    }
 
-    /* Dataframe styling */
-    .dataframe {{
+    /* ==========================================================================
+       METRIC EXPLAINER - Scorecard metric descriptions
+       ========================================================================== */
+    .metric-explainer {
+        background: var(--gradient-dark-reverse);
+        border-left: 4px solid var(--color-purple);
+        padding: 1rem 1.25rem;
+        border-radius: 0 8px 8px 0;
+        margin-bottom: 0.75rem;
+    }
+    .metric-explainer .name {
+        font-weight: 700;
+        color: white;
+    }
+    .metric-explainer .desc {
+        color: #a0a0a0;
         font-size: 0.9rem;
-    }}
+    }
+    """,
+}
 
-    /* Tab styling */
-    .stTabs [data-baseweb="tab-list"] {{
-        gap: 8px;
-    }}
-    .stTabs [data-baseweb="tab"] {{
-        height: 50px;
-        padding: 0px 24px;
-        border-radius: 8px 8px 0px 0px;
-        font-weight: 600;
-    }}
-    .stTabs [aria-selected="true"] {{
-        border-bottom: 3px solid {blue};
-    }}
 
-    /* Button styling */
-    .stButton > button {{
-        border-radius: 8px;
-        font-weight: 600;
-        padding: 0.5rem 1.5rem;
-    }}
+def _render_root_css(palette: Mapping[str, str]) -> str:
+    """Render the :root design tokens for a palette of '#rrggbb' colors."""
+    return _ROOT_TEMPLATE.substitute(
+        palette,
+        shadow_blue=_hex_to_rgba(palette['blue'], 0.3),
+        shadow_red=_hex_to_rgba(palette['red'], 0.3),
+    )
 
-    /* ==========================================================================
-       UTILITY CLASSES
-       ========================================================================== */
-    .text-gold {{ color: {gold}; }}
-    .text-green {{ color: {green}; }}
-    .text-red {{ color: {red}; }}
-    .text-blue {{ color: {blue}; }}
-    .text-purple {{ color: {purple}; }}
-    .text-gray {{ color: {gray}; }}
-    .text-white {{ color: white; }}
 
-    .bg-dark {{ background: {bg_dark}; }}
-    .bg-card {{ background: {bg_card}; }}
-    </style>
-    """, unsafe_allow_html=True)
+def _build_css(palette: Mapping[str, str] = _PALETTE) -> Tuple[str, Dict[str, str]]:
+    """Build the dashboard stylesheets.
+
+    This is the single source of truth for all dashboard CSS.
+    Do NOT add inline CSS to individual page files.
+
+    Args:
+        palette: Colors for the design tokens; only :root depends on them
+
+    Returns:
+        Tuple of (base stylesheet shared by every page, dictionary mapping
+        page name to the stylesheet for components only that page renders)
+    """
+    return _render_root_css(palette) + _BASE_CSS + _HEADER_CSS, dict(_PAGE_CSS)
+
+
+_CSS_COMMENT = re.compile(r"/\*.*?\*/", re.DOTALL)
+_CSS_WHITESPACE = re.compile(r"\s+")
+_CSS_PUNCTUATION_SPACE = re.compile(r"\s*([{};,>])\s*")
+
+
+def _minify_css(css: str) -> str:
+    """Strip comments and redundant whitespace from a stylesheet.
+
+    Colons are left alone because whitespace before one is significant in
+    selectors (``div :hover`` is not ``div:hover``).
+
+    Args:
+        css: Stylesheet source
+
+    Returns:
+        Minified stylesheet
+    """
+    css = _CSS_COMMENT.sub("", css)
+    css = _CSS_WHITESPACE.sub(" ", css)
+    css = _CSS_PUNCTUATION_SPACE.sub(r"\1", css)
+    return css.replace(";}", "}").strip()
+
+
+def _publish_css(css: str, name: str = _STYLESHEET_NAME) -> str:
+    """Get the HTML that applies the dashboard stylesheet.
+
+    With Streamlit static serving enabled, the stylesheet is written to the
+    static folder (only when its contents change) and referenced by a
+    <link> tag, so browsers download and cache it once rather than receiving
+    the whole stylesheet with every rerun. Otherwise it is inlined.
+
+    Args:
+        css: Stylesheet contents
+        name: File name to publish the stylesheet under
+
+    Returns:
+        HTML to emit with st.markdown
+    """
+    if st.get_option("server.enableStaticServing"):
+        path = PathConfig.STATIC_DIR / name
+        try:
+            if not path.exists() or path.read_text(encoding="utf-8") != css:
+                path.write_text(css, encoding="utf-8")
+        except OSError:
+            pass
+        else:
+            # Content hash in the URL busts the browser cache when styles change
+            version = hashlib.blake2b(css.encode("utf-8"), digest_size=6).hexdigest()
+            return f'<link rel="stylesheet" href="app/static/{name}?v={version}">'
+
+    return f"<style>{css}</style>"
+
+
+# All inputs are static config, so the stylesheets are built once at import.
+# Modules are imported once per server process, so every user session shares
+# these strings; st.cache_resource would only add a cache lookup per rerun.
+# The readable source is kept for debugging; only the minified form ships.
+_CSS_SOURCE, _PAGE_CSS_SOURCE = _build_css()
+_CSS_HTML = _publish_css(_minify_css(_CSS_SOURCE))
+_PAGE_CSS_HTML = MappingProxyType({
+    page: _CSS_HTML + _publish_css(_minify_css(css), f"theme-{page}.css")
+    for page, css in _PAGE_CSS_SOURCE.items()
+})
+
+
+def load_custom_css(page: Optional[str] = None):
+    """Load custom CSS for dashboard styling.
+
+    All pages should use setup_page() which calls this function.
+    The stylesheets are prebuilt, so each rerun only re-emits the string.
+
+    Args:
+        page: Optional page name (e.g. 'songs', 'scorecard') whose
+            page-specific styles are loaded along with the base styles
+    """
+    st.markdown(_PAGE_CSS_HTML.get(page, _CSS_HTML), unsafe_allow_html=True)
 
 
 def get_league_color(league_name: str) -> str:
     """Get the brand color for a specific league."""
-    return LEAGUE_COLORS.get(league_name, ACCENT_COLORS['gray'])
+    return _league_color(league_name, _DEFAULT_LEAGUE_COLOR)
 
 
 def get_metric_display_name(metric_key: str) -> str:
     """Get the branded display name for a metric."""
-    return METRIC_NAMES.get(metric_key, metric_key.replace('_', ' ').title())
+    name = _metric_name(metric_key)
+    return name if name is not None else metric_key.replace('_', ' ').title()
 
 
 def get_metric_tooltip(metric_key: str) -> str:
     """Get the tooltip description for a metric."""
-    return METRIC_TOOLTIPS.get(metric_key, '')
+    return _metric_tooltip(metric_key, '')
 
 
 def create_vs_divider():
@@ -1232,7 +1290,7 @@ def create_vs_divider():
 
 def create_league_header(league_name: str, is_blue: bool = True):
     """Create a styled header for a league."""
-    header_class = "league-header-blue" if is_blue else "league-header-red"
+    header_class = "league-header blue" if is_blue else "league-header red"
     corner_text = "In the Blue Corner..." if is_blue else "In the Red Corner..."
 
     st.markdown(
@@ -1241,16 +1299,39 @@ def create_league_header(league_name: str, is_blue: bool = True):
     )
 
 
-def setup_page():
+def setup_page(page: Optional[str] = None):
     """
     Common page setup for all dashboard pages.
 
     Call this at the top of each page file. It handles:
-    - Loading custom CSS
+    - Loading custom CSS (base styles plus the page's own components)
 
-    Note: st.set_page_config() is called only in streamlit_app.py.
-    In Streamlit multipage apps, set_page_config must be called exactly once
-    in the main entry point, not in individual pages.
-    """
-    load_custom_css()
+    Note: st.set_page_config() is called only in streamlit_app.py, with
+    PAGE_CONFIG. In Streamlit multipage apps, set_page_config must be called
+    exactly once in the main entry point, not in individual pages.
+
+    The CSS is re-emitted on every run rather than guarded per session:
+    Streamlit clears elements that a rerun does not emit again, so skipping
+    it would drop the styling.
 
+    Args:
+        page: Optional page name, matching the page-header class
+            (e.g. 'songs', 'scorecard')
+    """
+    load_custom_css(page)
+
+
+__all__ = [
+    "load_custom_css",
+    "get_league_color",
+    "get_metric_display_name",
+    "get_metric_tooltip",
+    "create_vs_divider",
+    "create_league_header",
+    "setup_page",
+    "LEAGUE_COLORS",
+    "ACCENT_COLORS",
+    "METRIC_NAMES",
+    "METRIC_TOOLTIPS",
+    "PAGE_CONFIG",
+]
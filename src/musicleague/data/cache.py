@@ -2,6 +2,8 @@
 Cache management for preprocessed league data.
 """
 
+import hashlib
+import os
 import pickle
 import json
 from pathlib import Path
@@ -10,6 +12,56 @@ from typing import Any, Dict, Optional
 from musicleague.config import PathConfig
 
 
+def _serialize(data: Any) -> bytes:
+    """Serialize cache contents with the newest pickle protocol."""
+    return pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def _deserialize(path: Path) -> Any:
+    """Read a cache file in a single call and unpickle it from memory."""
+    return pickle.loads(path.read_bytes())
+
+
+def _hash_path(path: Path) -> Path:
+    """Get the sidecar file holding the content digest of a cache file."""
+    return path.with_suffix('.hash')
+
+
+def _sidecar(path: Path, digest: str) -> str:
+    """Pair a payload digest with the size and mtime of the file holding it."""
+    stat = path.stat()
+    return f"{digest} {stat.st_size} {stat.st_mtime_ns}"
+
+
+def _write_bytes(path: Path, payload: bytes) -> None:
+    """
+    Atomically replace a cache file, skipping the write if it is unchanged.
+
+    A blake2b digest of the payload is kept in a ``.hash`` sidecar together
+    with the size and mtime of the file it was written to, so a no-op save
+    compares a few bytes instead of reading the old file. The digest is only
+    trusted while the file's size and mtime still match, so contents replaced
+    behind the cache's back (a git checkout, a manual copy) are rewritten.
+    Skipped saves still touch the file, so its mtime marks when its contents
+    were last confirmed current for staleness checks.
+
+    The payload is written to a temporary file and moved into place, so an
+    interrupted save never leaves a truncated cache behind.
+    """
+    digest = hashlib.blake2b(payload, digest_size=16).hexdigest()
+    hash_path = _hash_path(path)
+    if path.exists() and hash_path.exists() and hash_path.read_text() == _sidecar(path, digest):
+        os.utime(path)
+        hash_path.write_text(_sidecar(path, digest))
+        return
+    # Drop the old digest first so a crash mid-save can never vouch for stale contents
+    hash_path.unlink(missing_ok=True)
+    tmp_path = path.with_name(path.name + '.tmp')
+    tmp_path.write_bytes(payload)
+    os.replace(tmp_path, path)
+    hash_path.write_text(_sidecar(path, digest))
+
+
 class CacheManager:
     """
     Manages caching of preprocessed league data.
@@ -31,6 +83,16 @@ class CacheManager:
         """Get the summary JSON file path for a league."""
         return PathConfig.CACHE_DIR / f"{league_name}_summary.json"
     
+    @staticmethod
+    def get_normalized_metrics_path(league_name: str) -> Path:
+        """Get the normalized scorecard metrics file path for a league."""
+        return PathConfig.get_cache_file(league_name, "normalized_metrics.pkl")
+    
+    @staticmethod
+    def get_spotify_index_path() -> Path:
+        """Get the path of the Spotify track metadata index shared by all leagues."""
+        return PathConfig.CACHE_DIR / "spotify_index.json"
+    
     def exists(self, league_name: str) -> bool:
         """Check if cache exists for a league."""
         return self.get_cache_path(league_name).exists()
@@ -51,8 +113,7 @@ class CacheManager:
             return None
         
         try:
-            with open(cache_path, 'rb') as f:
-                return pickle.load(f)
+            return _deserialize(cache_path)
         except Exception as e:
             print(f"Error loading cache for {league_name}: {e}")
             return None
@@ -71,8 +132,7 @@ class CacheManager:
         cache_path = self.get_cache_path(league_name)
         
         try:
-            with open(cache_path, 'wb') as f:
-                pickle.dump(data, f)
+            _write_bytes(cache_path, _serialize(data))
             return True
         except Exception as e:
             print(f"Error saving cache for {league_name}: {e}")
@@ -92,8 +152,8 @@ class CacheManager:
         summary_path = self.get_summary_path(league_name)
         
         try:
-            with open(summary_path, 'w') as f:
-                json.dump(summary, f, indent=2, default=str)
+            # Encode in one call and write once; json.dump streams many small writes
+            _write_bytes(summary_path, json.dumps(summary, indent=2, default=str).encode('utf-8'))
             return True
         except Exception as e:
             print(f"Error saving summary for {league_name}: {e}")
@@ -121,6 +181,100 @@ class CacheManager:
             print(f"Error loading summary for {league_name}: {e}")
             return None
     
+    def load_spotify_index(self) -> Dict[str, Dict]:
+        """
+        Load persisted Spotify track metadata.
+        
+        Track metadata never changes, so lookups are shared across leagues
+        and runs to avoid repeat API calls.
+        
+        Returns:
+            Dictionary mapping Spotify URI to track metadata (empty if missing)
+        """
+        index_path = self.get_spotify_index_path()
+        
+        if not index_path.exists():
+            return {}
+        
+        try:
+            with open(index_path, 'r') as f:
+                return json.load(f)
+        except Exception as e:
+            print(f"Error loading Spotify index: {e}")
+            return {}
+    
+    def save_spotify_index(self, index: Dict[str, Dict]) -> bool:
+        """
+        Persist Spotify track metadata.
+        
+        Args:
+            index: Dictionary mapping Spotify URI to track metadata
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        index_path = self.get_spotify_index_path()
+        
+        try:
+            _write_bytes(index_path, json.dumps(index, separators=(',', ':')).encode('utf-8'))
+            return True
+        except Exception as e:
+            print(f"Error saving Spotify index: {e}")
+            return False
+    
+    def load_normalized_metrics(self, league_name: str, version: int) -> Optional[Any]:
+        """
+        Load normalized scorecard metrics from cache.
+        
+        The cached metrics are treated as stale when the league's
+        preprocessed cache has been rewritten since they were saved, or
+        when they were computed by a different version of the scoring code.
+        
+        Args:
+            league_name: Name of the league
+            version: Version of the scoring code the metrics must come from
+            
+        Returns:
+            Normalized metrics DataFrame or None if missing or stale
+        """
+        metrics_path = self.get_normalized_metrics_path(league_name)
+        cache_path = self.get_cache_path(league_name)
+        
+        if not metrics_path.exists():
+            return None
+        
+        try:
+            if cache_path.exists() and cache_path.stat().st_mtime > metrics_path.stat().st_mtime:
+                return None
+            payload = _deserialize(metrics_path)
+            if not isinstance(payload, dict) or payload.get('version') != version:
+                return None
+            return payload['metrics']
+        except Exception as e:
+            print(f"Error loading normalized metrics for {league_name}: {e}")
+            return None
+    
+    def save_normalized_metrics(self, league_name: str, metrics: Any, version: int) -> bool:
+        """
+        Save normalized scorecard metrics to cache.
+        
+        Args:
+            league_name: Name of the league
+            metrics: Normalized metrics DataFrame
+            version: Version of the scoring code that computed the metrics
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        metrics_path = self.get_normalized_metrics_path(league_name)
+        
+        try:
+            _write_bytes(metrics_path, _serialize({'version': version, 'metrics': metrics}))
+            return True
+        except Exception as e:
+            print(f"Error saving normalized metrics for {league_name}: {e}")
+            return False
+    
     def clear(self, league_name: str) -> bool:
         """
         Clear cache for a specific league.
@@ -133,12 +287,13 @@ class CacheManager:
         """
         cache_path = self.get_cache_path(league_name)
         summary_path = self.get_summary_path(league_name)
+        metrics_path = self.get_normalized_metrics_path(league_name)
         
         try:
-            if cache_path.exists():
-                cache_path.unlink()
-            if summary_path.exists():
-                summary_path.unlink()
+            for path in (cache_path, summary_path, metrics_path):
+                for file_path in (path, _hash_path(path)):
+                    if file_path.exists():
+                        file_path.unlink()
             return True
         except Exception as e:
             print(f"Error clearing cache for {league_name}: {e}")
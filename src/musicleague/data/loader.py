@@ -4,10 +4,17 @@ MusicLeague data loader.
 Loads and manages MusicLeague data from CSV files.
 """
 
-import csv
-from typing import Dict, List, Optional
+import os
+import sys
+from functools import cached_property
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
 
 from musicleague.config import PathConfig
+from musicleague.data.cache import CacheManager
 from musicleague.data.spotify import SpotifyClient
 
 
@@ -29,18 +36,19 @@ class MusicLeagueData:
 
     def __init__(self, league_name: str, fetch_spotify: bool = True):
         """
-        Initialize and load league data.
+        Initialize league data.
+
+        CSV files are read on first access of the corresponding attribute
+        (rounds, competitors, submissions, votes), so callers only pay for
+        the data they use.
         
         Args:
             league_name: Name of the league directory in data/
             fetch_spotify: Whether to initialize Spotify client for fetching metadata
         """
         self.league_name = league_name
-        self.rounds: List[str] = []
-        self.competitors: Dict[str, Dict] = {}
-        self.submissions: List[Dict] = []
-        self.votes: List[Dict] = []
         self.spotify_data: Dict[str, Dict] = {}
+        self._spotify_prefetched = False
         
         # Initialize Spotify client if needed
         self._spotify: Optional[SpotifyClient] = None
@@ -50,63 +58,416 @@ class MusicLeagueData:
             except ValueError as e:
                 print(f"Warning: Could not initialize Spotify client: {e}")
                 print("Spotify metadata will not be available.")
-        
-        self._load_data()
 
     @property
     def sp(self):
         """Get underlying spotipy client for backwards compatibility."""
         return self._spotify.client if self._spotify else None
 
-    def _load_data(self) -> None:
-        """Load all CSV data files for the league."""
-        data_path = PathConfig.get_league_data_path(self.league_name)
-        
-        # Load rounds
-        rounds_file = data_path / "rounds.csv"
-        if rounds_file.exists():
-            with open(rounds_file, newline='') as csvfile:
-                reader = csv.DictReader(csvfile)
-                for row in reader:
-                    self.rounds.append(row['ID'])
-        
-        # Load competitors
-        competitors_file = data_path / "competitors.csv"
-        if competitors_file.exists():
-            with open(competitors_file, newline='') as csvfile:
-                reader = csv.DictReader(csvfile)
-                for row in reader:
-                    self.competitors[row['ID']] = {
-                        'id': row['ID'],
-                        'name': row['Name']
-                    }
-        
-        # Load submissions
-        submissions_file = data_path / "submissions.csv"
-        if submissions_file.exists():
-            with open(submissions_file, newline='') as csvfile:
-                reader = csv.DictReader(csvfile)
-                for row in reader:
-                    self.submissions.append({
-                        'round_id': row['Round ID'],
-                        'submitter_id': row['Submitter ID'],
-                        'spotify_uri': row['Spotify URI'],
-                        'comment': row.get('Comment', ''),
-                    })
-        
-        # Load votes
-        votes_file = data_path / "votes.csv"
-        if votes_file.exists():
-            with open(votes_file, newline='') as csvfile:
-                reader = csv.DictReader(csvfile)
-                for row in reader:
-                    self.votes.append({
-                        'round_id': row['Round ID'],
-                        'voter_id': row['Voter ID'],
-                        'spotify_uri': row['Spotify URI'],
-                        'points': int(row['Points Assigned']),
-                        'comment': row.get('Comment', ''),
-                    })
+    @cached_property
+    def rounds(self) -> List[str]:
+        """Round IDs, read from rounds.csv on first access."""
+        return self._read_league_csv("rounds.csv", {'ID': 'id'})['id'].tolist()
+
+    @cached_property
+    def competitors(self) -> Dict[str, Dict]:
+        """Competitor records keyed by ID, read from competitors.csv on first access."""
+        competitors = self._read_league_csv("competitors.csv", {'ID': 'id', 'Name': 'name'})
+        return {record['id']: record for record in competitors.to_dict('records')}
+
+    @cached_property
+    def submissions(self) -> List[Dict]:
+        """Submission records, read from submissions.csv on first access."""
+        return self.submissions_df.to_dict('records')
+
+    @cached_property
+    def votes(self) -> List[Dict]:
+        """Vote records, read from votes.csv on first access."""
+        return self.votes_df.to_dict('records')
+
+    @cached_property
+    def name_to_id(self) -> Dict[str, str]:
+        """Reverse index from competitor name to competitor ID (first match wins)."""
+        index: Dict[str, str] = {}
+        for cid, info in self.competitors.items():
+            index.setdefault(info['name'], cid)
+        return index
+
+    @cached_property
+    def submitter_index(self) -> Dict[Tuple[str, str], str]:
+        """Index from (spotify_uri, round_id) to submitter ID (first match wins)."""
+        index: Dict[Tuple[str, str], str] = {}
+        for sub in self.submissions:
+            index.setdefault((sub['spotify_uri'], sub['round_id']), sub['submitter_id'])
+        return index
+
+    @cached_property
+    def submissions_df(self) -> pd.DataFrame:
+        """Submissions as a DataFrame, built once for vectorized queries."""
+        columns = {
+            'Round ID': 'round_id',
+            'Submitter ID': 'submitter_id',
+            'Spotify URI': 'spotify_uri',
+            'Comment': 'comment',
+        }
+        if 'submissions' in self.__dict__:
+            # Records were supplied directly (e.g. from the preprocessed cache)
+            return pd.DataFrame(self.submissions, columns=list(columns.values()))
+        return self._read_league_csv("submissions.csv", columns)
+
+    @cached_property
+    def votes_df(self) -> pd.DataFrame:
+        """Votes as a DataFrame, built once for vectorized queries."""
+        columns = {
+            'Round ID': 'round_id',
+            'Voter ID': 'voter_id',
+            'Spotify URI': 'spotify_uri',
+            'Points Assigned': 'points',
+            'Comment': 'comment',
+        }
+        if 'votes' in self.__dict__:
+            # Records were supplied directly (e.g. from the preprocessed cache)
+            return pd.DataFrame(self.votes, columns=list(columns.values()))
+        votes = self._read_league_csv("votes.csv", columns)
+        votes['points'] = votes['points'].astype(np.int64)
+        return votes
+
+    @staticmethod
+    def _read_csv(path: Path, columns: Dict[str, str]) -> pd.DataFrame:
+        """
+        Read the selected columns of a league CSV with the C parser, keeping
+        every field as a string.
+
+        Identifier fields are interned, so every record referring to the same
+        round, competitor or track shares one string object: rows take less
+        memory, pickle smaller, and ID comparisons short-circuit on identity.
+
+        Args:
+            path: CSV file path
+            columns: Mapping of CSV header to record key, in output order
+                (a missing 'Comment' column is filled with empty strings)
+
+        Returns:
+            DataFrame with the selected columns renamed to record keys
+        """
+        # Only the selected columns are parsed; the rest are skipped in C
+        df = pd.read_csv(
+            path, dtype=str, keep_default_na=False, usecols=lambda name: name in columns
+        )
+        if 'Comment' in columns and 'Comment' not in df.columns:
+            df['Comment'] = ''
+        for column in columns:
+            if column != 'Comment':
+                df[column] = pd.Series(
+                    [sys.intern(value) for value in df[column]], index=df.index, dtype=object
+                )
+        return df[list(columns)].rename(columns=columns)
+
+    @cached_property
+    def _league_files(self) -> Dict[str, Path]:
+        """Files in the league data directory by name, listed in one scan."""
+        try:
+            with os.scandir(PathConfig.get_league_data_path(self.league_name)) as entries:
+                return {entry.name: Path(entry.path) for entry in entries if entry.is_file()}
+        except OSError:
+            return {}
+
+    def _read_league_csv(self, file_name: str, columns: Dict[str, str]) -> pd.DataFrame:
+        """
+        Read one of the league's CSV files.
+
+        Args:
+            file_name: CSV file name within the league data directory
+            columns: Mapping of CSV header to record key, in output order
+
+        Returns:
+            DataFrame with the selected columns renamed to record keys
+            (empty if the file does not exist)
+        """
+        path = self._league_files.get(file_name)
+        if path is None:
+            return pd.DataFrame(columns=list(columns.values()))
+        return self._read_csv(path, columns)
+
+    # Column arrays over votes (one entry per vote, in vote order) for
+    # vectorized aggregation instead of looping over vote dicts
+
+    @cached_property
+    def vote_points(self) -> np.ndarray:
+        """Points assigned by each vote as an int64 array."""
+        return self.votes_df['points'].to_numpy(dtype=np.int64)
+
+    @cached_property
+    def vote_uris(self) -> np.ndarray:
+        """Spotify URI of each vote."""
+        return self.votes_df['spotify_uri'].to_numpy()
+
+    @cached_property
+    def vote_round_ids(self) -> np.ndarray:
+        """Round ID of each vote."""
+        return self.votes_df['round_id'].to_numpy()
+
+    @cached_property
+    def vote_voter_ids(self) -> np.ndarray:
+        """Voter ID of each vote."""
+        return self.votes_df['voter_id'].to_numpy()
+
+    @staticmethod
+    def _factorize(values: np.ndarray) -> Tuple[np.ndarray, Dict[str, int]]:
+        """Encode values as int32 codes in first-appearance order, with the value -> code lookup."""
+        codes, uniques = pd.factorize(values)
+        return codes.astype(np.int32), {value: code for code, value in enumerate(uniques.tolist())}
+
+    @cached_property
+    def vote_uri_codes(self) -> Tuple[np.ndarray, Dict[str, int]]:
+        """Integer code of each vote's spotify_uri, with the URI -> code lookup."""
+        return self._factorize(self.vote_uris)
+
+    @cached_property
+    def vote_round_codes(self) -> Tuple[np.ndarray, Dict[str, int]]:
+        """Integer code of each vote's round_id, with the round ID -> code lookup."""
+        return self._factorize(self.vote_round_ids)
+
+    @staticmethod
+    def _group_positions(codes: np.ndarray, lookup: Dict[str, int]) -> Dict[str, np.ndarray]:
+        """Map each value in lookup to the positions of its code in codes, in row order."""
+        order = np.argsort(codes, kind='stable')
+        counts = np.bincount(codes, minlength=len(lookup))
+        return dict(zip(lookup, np.split(order, np.cumsum(counts)[:-1])))
+
+    @cached_property
+    def vote_indices_by_uri(self) -> Dict[str, np.ndarray]:
+        """Positions of each spotify_uri's votes in the vote arrays, in vote order."""
+        return self._group_positions(*self.vote_uri_codes)
+
+    @cached_property
+    def vote_indices_by_voter(self) -> Dict[str, np.ndarray]:
+        """Positions of each voter's votes in the vote arrays, in vote order."""
+        return self._group_positions(*self._factorize(self.vote_voter_ids))
+
+    def vote_rows_for_voter(self, voter_id: str, round_id: Optional[str] = None) -> np.ndarray:
+        """
+        Get the positions of a voter's votes in the vote arrays.
+
+        Args:
+            voter_id: ID of the voter
+            round_id: Optional round ID to filter by
+
+        Returns:
+            Integer positions into vote_points and the other vote arrays
+        """
+        rows = self.vote_indices_by_voter.get(voter_id, np.empty(0, dtype=np.intp))
+        if round_id is not None:
+            rows = rows[self.vote_round_ids[rows] == round_id]
+        return rows
+
+    def votes_mask_for_song(self, spotify_uri: str, round_id: Optional[str] = None) -> np.ndarray:
+        """
+        Get a boolean mask over the vote arrays selecting votes for a song.
+
+        Args:
+            spotify_uri: Spotify URI of the song
+            round_id: Optional round ID to filter by
+
+        Returns:
+            Boolean array aligned with vote_points and the other vote arrays
+        """
+        # Compare integer codes rather than strings
+        uri_codes, uri_lookup = self.vote_uri_codes
+        mask = uri_codes == uri_lookup.get(spotify_uri, -1)
+        if round_id is not None:
+            round_codes, round_lookup = self.vote_round_codes
+            mask &= round_codes == round_lookup.get(round_id, -1)
+        return mask
+
+    @cached_property
+    def song_points(self) -> Dict[Tuple[str, str], int]:
+        """Total points per (spotify_uri, round_id), aggregated once over all votes."""
+        codes, uniques = pd.factorize(
+            pd.MultiIndex.from_arrays([self.vote_uris, self.vote_round_ids])
+        )
+        totals = np.bincount(codes, weights=self.vote_points, minlength=len(uniques))
+        return dict(zip(uniques, totals.astype(np.int64).tolist()))
+
+    @cached_property
+    def song_points_by_uri(self) -> Dict[str, int]:
+        """Total points per spotify_uri across all rounds."""
+        codes, lookup = self.vote_uri_codes
+        totals = np.bincount(codes, weights=self.vote_points, minlength=len(lookup))
+        return dict(zip(lookup, totals.astype(np.int64).tolist()))
+
+    # Column arrays over submissions (one entry per submission, in order)
+
+    @cached_property
+    def submission_uris(self) -> np.ndarray:
+        """Spotify URI of each submission."""
+        return self.submissions_df['spotify_uri'].to_numpy()
+
+    @cached_property
+    def submission_submitter_ids(self) -> np.ndarray:
+        """Submitter ID of each submission."""
+        return self.submissions_df['submitter_id'].to_numpy()
+
+    @cached_property
+    def submission_round_ids(self) -> np.ndarray:
+        """Round ID of each submission."""
+        return self.submissions_df['round_id'].to_numpy()
+
+    @cached_property
+    def submission_indices_by_submitter(self) -> Dict[str, np.ndarray]:
+        """Positions of each submitter's submissions in the submission arrays, in order."""
+        return self._group_positions(*self._factorize(self.submission_submitter_ids))
+
+    def submission_rows_for_submitter(
+        self,
+        submitter_id: str,
+        round_id: Optional[str] = None
+    ) -> np.ndarray:
+        """
+        Get the positions of a submitter's submissions in the submission arrays.
+
+        Args:
+            submitter_id: ID of the submitter
+            round_id: Optional round ID to filter by
+
+        Returns:
+            Integer positions into submission_comment_lengths and the other
+            submission arrays
+        """
+        rows = self.submission_indices_by_submitter.get(submitter_id, np.empty(0, dtype=np.intp))
+        if round_id is not None:
+            rows = rows[self.submission_round_ids[rows] == round_id]
+        return rows
+
+    @staticmethod
+    def _arrow_comments(comments: pd.Series) -> pd.Series:
+        """
+        View a comment column as Arrow-backed strings with missing comments empty.
+
+        String methods on Arrow-backed columns run as pyarrow compute kernels over
+        the UTF-8 buffer instead of calling str methods per row. Columns that are
+        already Arrow-backed (the pandas 3 default) are used as they are; others,
+        such as object columns from older pickles, are converted once. Without
+        pyarrow the column falls back to the default string dtype.
+
+        Args:
+            comments: Comment column from submissions_df or votes_df
+
+        Returns:
+            Comment column with an Arrow string dtype when pyarrow is available
+        """
+        dtype = comments.dtype
+        if not (isinstance(dtype, pd.StringDtype) and dtype.storage == 'pyarrow'):
+            try:
+                comments = comments.astype('string[pyarrow]')
+            except ImportError:
+                comments = comments.astype('string')
+        return comments.fillna('')
+
+    @cached_property
+    def submission_comments(self) -> pd.Series:
+        """Comment of each submission as strings (Arrow-backed when pyarrow is available)."""
+        return self._arrow_comments(self.submissions_df['comment'])
+
+    @cached_property
+    def vote_comments(self) -> pd.Series:
+        """Comment of each vote as strings (Arrow-backed when pyarrow is available)."""
+        return self._arrow_comments(self.votes_df['comment'])
+
+    @staticmethod
+    def _stripped_lengths(comments: pd.Series) -> np.ndarray:
+        """Character count of each comment without surrounding whitespace, as int64."""
+        return comments.str.strip().str.len().to_numpy(dtype=np.int64)
+
+    @staticmethod
+    def _comment_lengths(comments: pd.Series, stripped_lengths: np.ndarray) -> np.ndarray:
+        """Character count of each comment as int64, with blank comments counted as 0."""
+        lengths = comments.str.len().to_numpy(dtype=np.int64)
+        return np.where(stripped_lengths > 0, lengths, 0)
+
+    @cached_property
+    def submission_stripped_comment_lengths(self) -> np.ndarray:
+        """Stripped comment length of each submission."""
+        return self._stripped_lengths(self.submission_comments)
+
+    @cached_property
+    def vote_stripped_comment_lengths(self) -> np.ndarray:
+        """Stripped comment length of each vote."""
+        return self._stripped_lengths(self.vote_comments)
+
+    @cached_property
+    def submission_comment_lengths(self) -> np.ndarray:
+        """Comment length of each submission (0 when it has no comment)."""
+        return self._comment_lengths(
+            self.submission_comments, self.submission_stripped_comment_lengths
+        )
+
+    @cached_property
+    def vote_comment_lengths(self) -> np.ndarray:
+        """Comment length of each vote (0 when it has no comment)."""
+        return self._comment_lengths(self.vote_comments, self.vote_stripped_comment_lengths)
+
+    @staticmethod
+    def _track_metadata(uri: str, track: Optional[Dict]) -> Dict:
+        """Extract the metadata fields used by metrics from a Spotify track."""
+        if track is None:
+            # Placeholder when the track is unavailable
+            return {
+                'popularity': 0,
+                'name': 'Unknown',
+                'artist': 'Unknown',
+                'release_date': '1900-01-01',
+                'uri': uri
+            }
+        return {
+            'popularity': track['popularity'],
+            'name': track['name'],
+            'artist': track['artists'][0]['name'],
+            'release_date': track['album']['release_date'],
+            'uri': uri
+        }
+
+    def prefetch_spotify(self, uris: Iterable[str]) -> None:
+        """
+        Fetch Spotify metadata for many tracks using batched API requests.
+
+        URIs that are already cached are skipped, and tracks found in the
+        on-disk Spotify index are reused; newly fetched tracks are added to
+        it. Tracks that cannot be fetched here are left for
+        get_spotify_data to retry one at a time.
+
+        Args:
+            uris: Spotify URIs for the tracks
+        """
+        missing = [uri for uri in dict.fromkeys(uris) if uri not in self.spotify_data]
+        if len(missing) == 0:
+            return
+
+        cache_manager = CacheManager()
+        index = cache_manager.load_spotify_index()
+        for uri in missing:
+            if uri in index:
+                self.spotify_data[uri] = index[uri]
+        missing = [uri for uri in missing if uri not in index]
+
+        if self._spotify is None or len(missing) == 0:
+            return
+
+        try:
+            tracks = self._spotify.get_tracks(missing)
+        except Exception as e:
+            print(f"Error batch fetching Spotify data: {e}")
+            return
+
+        fetched = {
+            uri: self._track_metadata(uri, track)
+            for uri, track in zip(missing, tracks)
+            if track is not None
+        }
+        if fetched:
+            self.spotify_data.update(fetched)
+            index.update(fetched)
+            cache_manager.save_spotify_index(index)
 
     def get_spotify_data(self, uri: str) -> Dict:
         """
@@ -118,39 +479,29 @@ class MusicLeagueData:
         Returns:
             Dictionary with track metadata
         """
+        if uri not in self.spotify_data and not self._spotify_prefetched:
+            # On the first miss, load every track in the league in batched requests
+            self._spotify_prefetched = True
+            self.prefetch_spotify(
+                [s['spotify_uri'] for s in self.submissions]
+                + [v['spotify_uri'] for v in self.votes]
+            )
+
         if uri not in self.spotify_data:
             if self._spotify is None:
                 # Return placeholder if no Spotify client
-                self.spotify_data[uri] = {
-                    'popularity': 0,
-                    'name': 'Unknown',
-                    'artist': 'Unknown',
-                    'release_date': '1900-01-01',
-                    'uri': uri
-                }
+                self.spotify_data[uri] = self._track_metadata(uri, None)
             else:
                 try:
                     track = self._spotify.get_track(uri)
-                    self.spotify_data[uri] = {
-                        'popularity': track['popularity'],
-                        'name': track['name'],
-                        'artist': track['artists'][0]['name'],
-                        'release_date': track['album']['release_date'],
-                        'uri': uri
-                    }
+                    self.spotify_data[uri] = self._track_metadata(uri, track)
                 except Exception as e:
                     print(f"Error fetching Spotify data for {uri}: {e}")
-                    self.spotify_data[uri] = {
-                        'popularity': 0,
-                        'name': 'Unknown',
-                        'artist': 'Unknown',
-                        'release_date': '1900-01-01',
-                        'uri': uri
-                    }
+                    self.spotify_data[uri] = self._track_metadata(uri, None)
         
         return self.spotify_data[uri]
 
-    def get_votes_for_song(self, spotify_uri: str, round_id: Optional[str] = None) -> List[int]:
+    def get_votes_for_song(self, spotify_uri: str, round_id: Optional[str] = None) -> np.ndarray:
         """
         Get all vote values for a specific song.
         
@@ -159,13 +510,15 @@ class MusicLeagueData:
             round_id: Optional round ID to filter by
             
         Returns:
-            List of point values for votes on this song
+            Array of point values for votes on this song, in vote order
         """
-        return [
-            v['points'] for v in self.votes
-            if v['spotify_uri'] == spotify_uri
-            and (round_id is None or v['round_id'] == round_id)
-        ]
+        indices = self.vote_indices_by_uri.get(spotify_uri)
+        if indices is None:
+            return self.vote_points[:0]
+        if round_id is not None:
+            round_codes, round_lookup = self.vote_round_codes
+            indices = indices[round_codes[indices] == round_lookup.get(round_id, -1)]
+        return self.vote_points[indices]
 
     def get_submitter_for_song(self, spotify_uri: str, round_id: str) -> Optional[str]:
         """
@@ -178,18 +531,15 @@ class MusicLeagueData:
         Returns:
             Submitter ID or None if not found
         """
-        for sub in self.submissions:
-            if sub['spotify_uri'] == spotify_uri and sub['round_id'] == round_id:
-                return sub['submitter_id']
-        return None
+        return self.submitter_index.get((spotify_uri, round_id))
 
     def __repr__(self) -> str:
         """String representation of the data object."""
-        return (
-            f"MusicLeagueData(league='{self.league_name}', "
-            f"rounds={len(self.rounds)}, "
-            f"competitors={len(self.competitors)}, "
-            f"submissions={len(self.submissions)}, "
-            f"votes={len(self.votes)})"
+        # Report only what has been loaded rather than reading every CSV
+        counts = ''.join(
+            f", {name}={len(self.__dict__[name])}"
+            for name in ('rounds', 'competitors', 'submissions', 'votes')
+            if name in self.__dict__
         )
+        return f"MusicLeagueData(league='{self.league_name}'{counts})"
 
@@ -4,12 +4,20 @@ Spotify API client wrapper.
 Handles authentication and API calls to Spotify.
 """
 
-from typing import Dict, Optional
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
 import spotipy
 from spotipy.oauth2 import SpotifyClientCredentials
 
 from musicleague.config import SpotifyConfig
 
+# Maximum number of tracks Spotify's batch tracks endpoint accepts per request
+TRACKS_BATCH_SIZE = 50
+
+# Maximum number of batch requests in flight at once
+MAX_FETCH_WORKERS = 8
+
 
 class SpotifyClient:
     """
@@ -20,6 +28,7 @@ class SpotifyClient:
     """
     
     _instance: Optional["SpotifyClient"] = None
+    _instance_lock = threading.Lock()
     
     def __init__(self):
         """Initialize Spotify client with credentials from environment."""
@@ -38,12 +47,22 @@ class SpotifyClient:
                 f"Failed to initialize Spotify client: {e}\n"
                 "Make sure SPOTIFY_CLIENT_ID and SPOTIFY_CLIENT_SECRET are set."
             ) from e
+
+        # Tracks already fetched this process, keyed by URI
+        self._tracks: Dict[str, Optional[Dict]] = {}
     
     @classmethod
     def get_instance(cls) -> "SpotifyClient":
-        """Get singleton instance of SpotifyClient."""
+        """
+        Get singleton instance of SpotifyClient.
+
+        Safe to call from concurrent script runs: the client is created at
+        most once, and the lock is only taken until it exists.
+        """
         if cls._instance is None:
-            cls._instance = cls()
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = cls()
         return cls._instance
     
     @property
@@ -55,11 +74,41 @@ class SpotifyClient:
         """
         Fetch track metadata from Spotify.
 
+        Results are memoized, so repeated lookups of a URI make one request.
+
         Args:
             uri: Spotify URI (e.g., 'spotify:track:...' or just the track ID)
 
         Returns:
             Track metadata dictionary
         """
-        return self._client.track(uri)
+        if uri not in self._tracks:
+            self._tracks[uri] = self._client.track(uri)
+        return self._tracks[uri]
 
+    def get_tracks(self, uris: List[str]) -> List[Optional[Dict]]:
+        """
+        Fetch metadata for many tracks using the batch tracks endpoint.
+
+        Issues one request per TRACKS_BATCH_SIZE URIs instead of one per track,
+        skipping URIs already fetched by this client. Batches are requested
+        concurrently; rate-limited (429) responses are retried by spotipy,
+        which honors Spotify's Retry-After header.
+
+        Args:
+            uris: Spotify URIs (or track IDs)
+
+        Returns:
+            Track metadata dictionaries in the same order as uris
+            (None for tracks Spotify could not find)
+        """
+        missing = list(dict.fromkeys(uri for uri in uris if uri not in self._tracks))
+        batches = [
+            missing[start:start + TRACKS_BATCH_SIZE]
+            for start in range(0, len(missing), TRACKS_BATCH_SIZE)
+        ]
+        if batches:
+            with ThreadPoolExecutor(max_workers=min(MAX_FETCH_WORKERS, len(batches))) as executor:
+                for batch, response in zip(batches, executor.map(self._client.tracks, batches)):
+                    self._tracks.update(zip(batch, response['tracks']))
+        return [self._tracks.get(uri) for uri in uris]
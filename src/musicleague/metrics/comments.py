@@ -7,6 +7,7 @@ including wordiness, engagement, and notable quotes.
 
 from typing import Dict, List, Optional, Tuple, TYPE_CHECKING
 
+import numpy as np
 import pandas as pd
 
 if TYPE_CHECKING:
@@ -16,6 +17,106 @@ if TYPE_CHECKING:
 class CommentMetrics:
     """Metrics based on submission and vote comments."""
 
+    @staticmethod
+    def _length_stats(lengths: np.ndarray) -> Tuple[float, float]:
+        """
+        Summarize comment lengths (0 for rows without a comment).
+
+        Args:
+            lengths: Comment length of each submission or vote
+
+        Returns:
+            Tuple of (average length of non-empty comments, percentage of
+            rows with a comment), or (0.0, 0.0) if no row has a comment
+        """
+        non_empty = lengths[lengths > 0]
+
+        if len(non_empty) == 0:
+            return (0.0, 0.0)
+
+        avg_length = float(non_empty.sum() / len(non_empty))
+        comment_rate = (len(non_empty) / len(lengths)) * 100
+
+        return (avg_length, comment_rate)
+
+    @staticmethod
+    def _length_stats_by_competitor(
+        data: "MusicLeagueData",
+        person_ids: np.ndarray,
+        lengths: np.ndarray
+    ) -> Tuple[List[float], List[float], np.ndarray, np.ndarray]:
+        """
+        Summarize comment lengths for every competitor in a single pass.
+
+        Equivalent to calling _length_stats on each competitor's rows.
+
+        Args:
+            data: MusicLeagueData object
+            person_ids: Competitor ID of each submission or vote
+            lengths: Comment length of each row (0 for rows without a comment)
+
+        Returns:
+            Tuple of (avg_length, comment_rate, total_comments, total_rows),
+            each in competitor order; averages and rates are rounded to 1 decimal
+        """
+        codes = pd.Index(list(data.competitors)).get_indexer(person_ids)
+        known = codes >= 0
+        codes, lengths = codes[known], lengths[known]
+
+        n_competitors = len(data.competitors)
+        total_rows = np.bincount(codes, minlength=n_competitors)
+        total_comments = np.bincount(codes[lengths > 0], minlength=n_competitors)
+        total_length = np.bincount(codes, weights=lengths, minlength=n_competitors)
+
+        has_comments = total_comments > 0
+        avg_length = np.divide(
+            total_length, total_comments, out=np.zeros(n_competitors), where=has_comments
+        )
+        comment_rate = np.divide(
+            total_comments, total_rows, out=np.zeros(n_competitors), where=has_comments
+        ) * 100
+
+        return (
+            [round(value, 1) for value in avg_length.tolist()],
+            [round(value, 1) for value in comment_rate.tolist()],
+            total_comments,
+            total_rows,
+        )
+
+    @staticmethod
+    def _track_names(data: "MusicLeagueData", uris: pd.Series) -> Tuple[List[str], List[str]]:
+        """
+        Look up the song and artist name of each track.
+
+        Spotify metadata is read once per distinct URI and mapped onto rows.
+
+        Args:
+            data: MusicLeagueData object
+            uris: Spotify URI of each row
+
+        Returns:
+            Tuple of (song names, artist names) aligned with uris
+        """
+        tracks = {uri: data.get_spotify_data(uri) for uri in pd.unique(uris)}
+        songs = uris.map({uri: track['name'] for uri, track in tracks.items()})
+        artists = uris.map({uri: track['artist'] for uri, track in tracks.items()})
+        return songs.tolist(), artists.tolist()
+
+    @staticmethod
+    def _submission_points(data: "MusicLeagueData") -> List[int]:
+        """Look up the total points each submission received, in submission order."""
+        # Song totals are aggregated once on the data object
+        return [
+            data.song_points.get(key, 0)
+            for key in zip(data.submission_uris, data.submission_round_ids)
+        ]
+
+    @staticmethod
+    def _competitor_names(data: "MusicLeagueData", competitor_ids: pd.Series) -> List[str]:
+        """Look up each competitor's name ('Unknown' for IDs outside the league)."""
+        names = {cid: info['name'] for cid, info in data.competitors.items()}
+        return competitor_ids.map(names).fillna('Unknown').tolist()
+
     @staticmethod
     def submitter_wordsmith_score(
         data: "MusicLeagueData",
@@ -35,25 +136,8 @@ class CommentMetrics:
             - avg_comment_length: Average character count of non-empty comments
             - comment_rate: Percentage of submissions with comments (0-100)
         """
-        submissions = [
-            s for s in data.submissions
-            if s['submitter_id'] == submitter_id
-            and (round_id is None or s['round_id'] == round_id)
-        ]
-
-        if not submissions:
-            return (0.0, 0.0)
-
-        comments = [s.get('comment', '') for s in submissions]
-        non_empty = [c for c in comments if c and c.strip()]
-
-        if not non_empty:
-            return (0.0, 0.0)
-
-        avg_length = sum(len(c) for c in non_empty) / len(non_empty)
-        comment_rate = (len(non_empty) / len(submissions)) * 100
-
-        return (avg_length, comment_rate)
+        rows = data.submission_rows_for_submitter(submitter_id, round_id)
+        return CommentMetrics._length_stats(data.submission_comment_lengths[rows])
 
     @staticmethod
     def voter_critic_score(
@@ -74,26 +158,9 @@ class CommentMetrics:
             - avg_comment_length: Average character count of non-empty comments
             - comment_rate: Percentage of votes with comments (0-100)
         """
-        votes = [
-            v for v in data.votes
-            if v['voter_id'] == voter_id
-            and v['points'] > 0
-            and (round_id is None or v['round_id'] == round_id)
-        ]
-
-        if not votes:
-            return (0.0, 0.0)
-
-        comments = [v.get('comment', '') for v in votes]
-        non_empty = [c for c in comments if c and c.strip()]
-
-        if not non_empty:
-            return (0.0, 0.0)
-
-        avg_length = sum(len(c) for c in non_empty) / len(non_empty)
-        comment_rate = (len(non_empty) / len(votes)) * 100
-
-        return (avg_length, comment_rate)
+        rows = data.vote_rows_for_voter(voter_id, round_id)
+        rows = rows[data.vote_points[rows] > 0]
+        return CommentMetrics._length_stats(data.vote_comment_lengths[rows])
 
     @staticmethod
     def song_discussion_score(
@@ -112,18 +179,13 @@ class CommentMetrics:
         Returns:
             Tuple of (comment_count, avg_comment_length)
         """
-        votes = [
-            v for v in data.votes
-            if v['spotify_uri'] == spotify_uri
-            and (round_id is None or v['round_id'] == round_id)
-        ]
+        lengths = data.vote_comment_lengths[data.votes_mask_for_song(spotify_uri, round_id)]
+        lengths = lengths[lengths > 0]
 
-        comments = [v.get('comment', '') for v in votes if v.get('comment', '').strip()]
-
-        if not comments:
+        if len(lengths) == 0:
             return (0, 0.0)
 
-        return (len(comments), sum(len(c) for c in comments) / len(comments))
+        return (len(lengths), float(lengths.sum() / len(lengths)))
 
     @staticmethod
     def get_all_submitter_comment_stats(data: "MusicLeagueData") -> pd.DataFrame:
@@ -136,30 +198,29 @@ class CommentMetrics:
         Returns:
             DataFrame with columns: submitter_name, avg_length, comment_rate, total_comments
         """
-        stats = []
+        columns = [
+            'submitter_id', 'submitter_name', 'avg_length', 'comment_rate',
+            'total_comments', 'total_submissions',
+        ]
 
-        for submitter_id, submitter_info in data.competitors.items():
-            submissions = [s for s in data.submissions if s['submitter_id'] == submitter_id]
-            comments = [s.get('comment', '') for s in submissions]
-            non_empty = [c for c in comments if c and c.strip()]
+        if not data.competitors:
+            return pd.DataFrame(columns=columns)
 
-            avg_length, comment_rate = CommentMetrics.submitter_wordsmith_score(
-                data, submitter_id
+        avg_length, comment_rate, total_comments, total_submissions = (
+            CommentMetrics._length_stats_by_competitor(
+                data, data.submission_submitter_ids, data.submission_comment_lengths
             )
-
-            stats.append({
-                'submitter_id': submitter_id,
-                'submitter_name': submitter_info['name'],
-                'avg_length': round(avg_length, 1),
-                'comment_rate': round(comment_rate, 1),
-                'total_comments': len(non_empty),
-                'total_submissions': len(submissions),
-            })
-
-        df = pd.DataFrame(stats)
-        if len(df) > 0:
-            df = df.sort_values('avg_length', ascending=False)
-        return df
+        )
+
+        df = pd.DataFrame({
+            'submitter_id': list(data.competitors),
+            'submitter_name': [info['name'] for info in data.competitors.values()],
+            'avg_length': avg_length,
+            'comment_rate': comment_rate,
+            'total_comments': total_comments,
+            'total_submissions': total_submissions,
+        }, columns=columns)
+        return df.sort_values('avg_length', ascending=False)
 
     @staticmethod
     def get_all_voter_comment_stats(data: "MusicLeagueData") -> pd.DataFrame:
@@ -172,28 +233,29 @@ class CommentMetrics:
         Returns:
             DataFrame with columns: voter_name, avg_length, comment_rate, total_comments
         """
-        stats = []
-
-        for voter_id, voter_info in data.competitors.items():
-            votes = [v for v in data.votes if v['voter_id'] == voter_id and v['points'] > 0]
-            comments = [v.get('comment', '') for v in votes]
-            non_empty = [c for c in comments if c and c.strip()]
-
-            avg_length, comment_rate = CommentMetrics.voter_critic_score(data, voter_id)
+        columns = [
+            'voter_id', 'voter_name', 'avg_length', 'comment_rate', 'total_comments', 'total_votes',
+        ]
 
-            stats.append({
-                'voter_id': voter_id,
-                'voter_name': voter_info['name'],
-                'avg_length': round(avg_length, 1),
-                'comment_rate': round(comment_rate, 1),
-                'total_comments': len(non_empty),
-                'total_votes': len(votes),
-            })
+        if not data.competitors:
+            return pd.DataFrame(columns=columns)
 
-        df = pd.DataFrame(stats)
-        if len(df) > 0:
-            df = df.sort_values('avg_length', ascending=False)
-        return df
+        scored = data.vote_points > 0
+        avg_length, comment_rate, total_comments, total_votes = (
+            CommentMetrics._length_stats_by_competitor(
+                data, data.vote_voter_ids[scored], data.vote_comment_lengths[scored]
+            )
+        )
+
+        df = pd.DataFrame({
+            'voter_id': list(data.competitors),
+            'voter_name': [info['name'] for info in data.competitors.values()],
+            'avg_length': avg_length,
+            'comment_rate': comment_rate,
+            'total_comments': total_comments,
+            'total_votes': total_votes,
+        }, columns=columns)
+        return df.sort_values('avg_length', ascending=False)
 
     @staticmethod
     def get_notable_comments(
@@ -206,55 +268,67 @@ class CommentMetrics:
 
         Args:
             data: MusicLeagueData object
-            min_length: Minimum comment length to include
+            min_length: Minimum comment length to include (blank comments
+                are never included)
             top_n: Number of top comments to return
 
         Returns:
             DataFrame with columns: type, person, song, artist, comment, length
         """
-        notable = []
+        # Filter on precomputed stripped lengths; only the selected comments
+        # are stripped again for display
+        sub_lengths = data.submission_stripped_comment_lengths
+        vote_lengths = data.vote_stripped_comment_lengths
+        threshold = max(min_length, 1)
+
+        # Only the top_n longest comments (and ties at the cutoff) can make the
+        # final cut, so raise the threshold before building any rows
+        candidates = np.concatenate([sub_lengths, vote_lengths])
+        candidates = candidates[candidates >= threshold]
+        if 0 < top_n < len(candidates):
+            threshold = max(threshold, int(np.partition(candidates, -top_n)[-top_n]))
+
+        sub_rows = np.flatnonzero(sub_lengths >= threshold)
+        vote_rows = np.flatnonzero(vote_lengths >= threshold)
+        frames = []
 
         # Submission comments
-        for sub in data.submissions:
-            comment = sub.get('comment', '')
-            if comment and len(comment.strip()) >= min_length:
-                submitter = data.competitors.get(
-                    sub['submitter_id'], {'name': 'Unknown'}
-                )
-                spotify_data = data.get_spotify_data(sub['spotify_uri'])
-                notable.append({
-                    'type': 'submission',
-                    'person': submitter['name'],
-                    'song': spotify_data['name'],
-                    'artist': spotify_data['artist'],
-                    'comment': comment.strip(),
-                    'length': len(comment.strip()),
-                    'round_id': sub['round_id'],
-                })
+        if len(sub_rows) > 0:
+            subs = data.submissions_df.iloc[sub_rows]
+            songs, artists = CommentMetrics._track_names(data, subs['spotify_uri'])
+            frames.append(pd.DataFrame({
+                'type': 'submission',
+                'person': CommentMetrics._competitor_names(data, subs['submitter_id']),
+                'song': songs,
+                'artist': artists,
+                'comment': data.submission_comments.iloc[sub_rows].str.strip().tolist(),
+                'length': sub_lengths[sub_rows],
+                'round_id': subs['round_id'].tolist(),
+            }))
 
         # Vote comments
-        for vote in data.votes:
-            comment = vote.get('comment', '')
-            if comment and len(comment.strip()) >= min_length:
-                voter = data.competitors.get(
-                    vote['voter_id'], {'name': 'Unknown'}
-                )
-                spotify_data = data.get_spotify_data(vote['spotify_uri'])
-                notable.append({
-                    'type': 'vote',
-                    'person': voter['name'],
-                    'song': spotify_data['name'],
-                    'artist': spotify_data['artist'],
-                    'comment': comment.strip(),
-                    'length': len(comment.strip()),
-                    'points': vote['points'],
-                    'round_id': vote['round_id'],
-                })
-
-        df = pd.DataFrame(notable)
-        if len(df) > 0:
-            df = df.sort_values('length', ascending=False).head(top_n)
-        return df
+        if len(vote_rows) > 0:
+            votes = data.votes_df.iloc[vote_rows]
+            songs, artists = CommentMetrics._track_names(data, votes['spotify_uri'])
+            frames.append(pd.DataFrame({
+                'type': 'vote',
+                'person': CommentMetrics._competitor_names(data, votes['voter_id']),
+                'song': songs,
+                'artist': artists,
+                'comment': data.vote_comments.iloc[vote_rows].str.strip().tolist(),
+                'length': vote_lengths[vote_rows],
+                'points': data.vote_points[vote_rows],
+                'round_id': votes['round_id'].tolist(),
+            }))
+
+        if not frames:
+            return pd.DataFrame(columns=[
+                'type', 'person', 'song', 'artist', 'comment', 'length', 'round_id', 'points'
+            ])
+
+        # Partial selection; ties keep row order (submissions first)
+        df = pd.concat(frames, ignore_index=True)
+        return df.nlargest(top_n, 'length', keep='first')
 
     @staticmethod
     def comment_engagement_by_points(data: "MusicLeagueData") -> pd.DataFrame:
@@ -267,32 +341,30 @@ class CommentMetrics:
         Returns:
             DataFrame with columns: points, avg_comment_length, comment_rate, count
         """
-        # Group votes by points
-        from collections import defaultdict
-        point_groups: Dict[int, List[str]] = defaultdict(list)
-
-        for vote in data.votes:
-            if vote['points'] > 0:
-                comment = vote.get('comment', '')
-                point_groups[vote['points']].append(comment)
-
-        stats = []
-        for points, comments in sorted(point_groups.items()):
-            non_empty = [c for c in comments if c and c.strip()]
-            avg_length = (
-                sum(len(c) for c in non_empty) / len(non_empty)
-                if non_empty else 0
-            )
-            comment_rate = (len(non_empty) / len(comments) * 100) if comments else 0
-
-            stats.append({
-                'points': points,
-                'avg_comment_length': round(avg_length, 1),
-                'comment_rate': round(comment_rate, 1),
-                'count': len(comments),
-            })
-
-        return pd.DataFrame(stats)
+        columns = ['points', 'avg_comment_length', 'comment_rate', 'count']
+
+        scored = data.vote_points > 0
+        if not scored.any():
+            return pd.DataFrame(columns=columns)
+
+        # Group scored votes by point value and aggregate each group at once
+        points, codes = np.unique(data.vote_points[scored], return_inverse=True)
+        lengths = data.vote_comment_lengths[scored]
+        count = np.bincount(codes, minlength=len(points))
+        num_comments = np.bincount(codes[lengths > 0], minlength=len(points))
+        total_length = np.bincount(codes, weights=lengths, minlength=len(points))
+
+        avg_length = np.divide(
+            total_length, num_comments, out=np.zeros(len(points)), where=num_comments > 0
+        )
+        comment_rate = num_comments / count * 100
+
+        return pd.DataFrame({
+            'points': points,
+            'avg_comment_length': [round(value, 1) for value in avg_length.tolist()],
+            'comment_rate': [round(value, 1) for value in comment_rate.tolist()],
+            'count': count,
+        }, columns=columns)
 
     @staticmethod
     def submission_comment_vs_points(data: "MusicLeagueData") -> pd.DataFrame:
@@ -308,35 +380,26 @@ class CommentMetrics:
             DataFrame with columns: song, artist, submitter, comment_length,
                                    total_points, has_comment
         """
-        from musicleague.metrics.songs import SongMetrics
-
-        results = []
-
-        for sub in data.submissions:
-            comment = sub.get('comment', '')
-            comment_length = len(comment.strip()) if comment else 0
-
-            # Get total points for this submission
-            total_points = SongMetrics.total_points(
-                data, sub['spotify_uri'], sub['round_id']
-            )
+        columns = [
+            'song', 'artist', 'submitter', 'comment_length', 'total_points', 'has_comment', 'round_id',
+        ]
 
-            spotify_data = data.get_spotify_data(sub['spotify_uri'])
-            submitter = data.competitors.get(
-                sub['submitter_id'], {'name': 'Unknown'}
-            )
+        subs = data.submissions_df
+        if len(subs) == 0:
+            return pd.DataFrame(columns=columns)
 
-            results.append({
-                'song': spotify_data['name'],
-                'artist': spotify_data['artist'],
-                'submitter': submitter['name'],
-                'comment_length': comment_length,
-                'total_points': total_points,
-                'has_comment': comment_length > 0,
-                'round_id': sub['round_id'],
-            })
+        songs, artists = CommentMetrics._track_names(data, subs['spotify_uri'])
+        comment_lengths = data.submission_stripped_comment_lengths
 
-        return pd.DataFrame(results)
+        return pd.DataFrame({
+            'song': songs,
+            'artist': artists,
+            'submitter': CommentMetrics._competitor_names(data, subs['submitter_id']),
+            'comment_length': comment_lengths,
+            'total_points': CommentMetrics._submission_points(data),
+            'has_comment': comment_lengths > 0,
+            'round_id': subs['round_id'].tolist(),
+        }, columns=columns)
 
     @staticmethod
     def comment_length_correlation(data: "MusicLeagueData") -> Dict[str, float]:
@@ -349,30 +412,35 @@ class CommentMetrics:
         Returns:
             Dictionary with correlation stats
         """
-        import numpy as np
+        # Work on the cached length and point arrays; no display columns are needed
+        lengths = data.submission_stripped_comment_lengths.astype(np.float64)
 
-        df = CommentMetrics.submission_comment_vs_points(data)
-
-        if len(df) < 3:
+        if len(lengths) < 3:
             return {'correlation': 0.0, 'avg_points_with_comment': 0.0,
                     'avg_points_without_comment': 0.0, 'difference': 0.0}
 
-        # Calculate correlation
-        correlation = np.corrcoef(
-            df['comment_length'], df['total_points']
-        )[0, 1] if len(df) > 1 else 0.0
+        points = np.array(CommentMetrics._submission_points(data), dtype=np.int64)
+        has_comment = lengths > 0
+
+        # Pearson correlation from centered sums; zero variance means no correlation
+        length_dev = lengths - lengths.mean()
+        points_dev = points - points.mean()
+        denominator = np.sqrt((length_dev @ length_dev) * (points_dev @ points_dev))
+        correlation = 0.0
+        if denominator > 0:
+            correlation = float(np.clip(length_dev @ points_dev / denominator, -1.0, 1.0))
 
         # Compare averages
-        with_comment = df[df['has_comment']]
-        without_comment = df[~df['has_comment']]
+        num_with = int(has_comment.sum())
+        num_without = len(lengths) - num_with
 
-        avg_with = with_comment['total_points'].mean() if len(with_comment) > 0 else 0
-        avg_without = without_comment['total_points'].mean() if len(without_comment) > 0 else 0
+        avg_with = points[has_comment].mean() if num_with > 0 else 0
+        avg_without = points[~has_comment].mean() if num_without > 0 else 0
 
         return {
-            'correlation': float(correlation) if not np.isnan(correlation) else 0.0,
+            'correlation': correlation,
             'avg_points_with_comment': round(avg_with, 2),
             'avg_points_without_comment': round(avg_without, 2),
             'difference': round(avg_with - avg_without, 2),
-            'pct_with_comment': round(len(with_comment) / len(df) * 100, 1) if len(df) > 0 else 0,
+            'pct_with_comment': round(num_with / len(lengths) * 100, 1),
         }
@@ -246,7 +246,8 @@ class CrossRoundMetrics:
     def hot_streak_detection(
         data: "MusicLeagueData",
         submitter_id: str,
-        top_n: int = 3
+        top_n: int = 3,
+        rankings_df: Optional[pd.DataFrame] = None
     ) -> Dict:
         """
         Detect hot streaks (consecutive top-N finishes).
@@ -255,11 +256,13 @@ class CrossRoundMetrics:
             data: MusicLeagueData object
             submitter_id: ID of the submitter
             top_n: What counts as a "top" finish (default: top 3)
+            rankings_df: Optional pre-computed round_rankings DataFrame
 
         Returns:
             Dictionary with streak info: current_streak, max_streak, total_top_finishes
         """
-        rankings_df = CrossRoundMetrics.round_rankings(data)
+        if rankings_df is None:
+            rankings_df = CrossRoundMetrics.round_rankings(data)
 
         if len(rankings_df) == 0:
             return {'current_streak': 0, 'max_streak': 0, 'total_top_finishes': 0}
@@ -301,21 +304,118 @@ class CrossRoundMetrics:
         }
 
     @staticmethod
-    def get_all_momentum_scores(data: "MusicLeagueData") -> pd.DataFrame:
+    def _round_points_matrix(
+        data: "MusicLeagueData"
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Build a (submitter x round) matrix of points earned.
+
+        Rows follow data.competitors order and columns follow data.rounds,
+        so per-player round series can be read straight off the arrays.
+
+        Args:
+            data: MusicLeagueData object
+
+        Returns:
+            Tuple of (points, submitted) int64 and bool arrays; points sums
+            every submission a player made in a round and submitted marks
+            the rounds in which they submitted at all
+        """
+        row_of = {sid: i for i, sid in enumerate(data.competitors)}
+        col_of = {rid: j for j, rid in enumerate(data.rounds)}
+        shape = (len(row_of), len(col_of))
+
+        rows, cols, song_points = [], [], []
+        for sub in data.submissions:
+            i = row_of.get(sub['submitter_id'])
+            j = col_of.get(sub['round_id'])
+            if i is None or j is None:
+                continue
+            rows.append(i)
+            cols.append(j)
+            song_points.append(
+                SongMetrics.total_points(data, sub['spotify_uri'], sub['round_id'])
+            )
+
+        points = np.zeros(shape, dtype=np.int64)
+        submitted = np.zeros(shape, dtype=bool)
+        np.add.at(points, (rows, cols), np.array(song_points, dtype=np.int64))
+        submitted[rows, cols] = True
+        return points, submitted
+
+    @staticmethod
+    def _momentum_slopes(points: np.ndarray, submitted: np.ndarray) -> np.ndarray:
+        """
+        Compute momentum for every row of a round points matrix at once.
+
+        Vectorized form of momentum_score: the regression slope of each
+        player's min-max normalized round scores against round index, using
+        only the rounds they submitted in.
+
+        Args:
+            points: (submitter x round) points matrix
+            submitted: Matching mask of rounds each submitter played
+
+        Returns:
+            Array of momentum scores (0.0 where fewer than two rounds were
+            played or the player scored the same every round)
+        """
+        n = submitted.sum(axis=1)
+        x = np.broadcast_to(np.arange(points.shape[1], dtype=np.float64), points.shape)
+        y = points.astype(np.float64)
+
+        y_max = np.where(submitted, y, -np.inf).max(axis=1, initial=-np.inf)
+        y_min = np.where(submitted, y, np.inf).min(axis=1, initial=np.inf)
+        y_range = y_max - y_min
+
+        valid = (n >= 2) & (y_range > 0)
+        slopes = np.zeros(len(n), dtype=np.float64)
+        if not valid.any():
+            return slopes
+
+        x, y, mask = x[valid], y[valid], submitted[valid]
+        n = n[valid]
+        y_norm = (y - y_min[valid, None]) / y_range[valid, None]
+
+        # slope = cov(x, y) / var(x), with the same ddof as np.cov / np.var
+        x_dev = np.where(mask, x - (np.where(mask, x, 0).sum(axis=1) / n)[:, None], 0.0)
+        y_dev = np.where(mask, y_norm - (np.where(mask, y_norm, 0).sum(axis=1) / n)[:, None], 0.0)
+        cov = (x_dev * y_dev).sum(axis=1) / (n - 1)
+        var = (x_dev * x_dev).sum(axis=1) / n
+
+        slopes[valid] = cov / var
+        return slopes
+
+    @staticmethod
+    def get_all_momentum_scores(
+        data: "MusicLeagueData",
+        rankings_df: Optional[pd.DataFrame] = None
+    ) -> pd.DataFrame:
         """
         Get momentum scores for all submitters.
 
         Args:
             data: MusicLeagueData object
+            rankings_df: Optional pre-computed round_rankings DataFrame
 
         Returns:
             DataFrame with columns: submitter, momentum, trend
         """
         scores = []
 
-        for submitter_id, submitter_info in data.competitors.items():
-            momentum = CrossRoundMetrics.momentum_score(data, submitter_id)
-            streak_info = CrossRoundMetrics.hot_streak_detection(data, submitter_id)
+        # Rank every round once and share it across submitters' streaks
+        if rankings_df is None:
+            rankings_df = CrossRoundMetrics.round_rankings(data)
+
+        points, submitted = CrossRoundMetrics._round_points_matrix(data)
+        momentums = CrossRoundMetrics._momentum_slopes(points, submitted)
+
+        for (submitter_id, submitter_info), momentum in zip(
+            data.competitors.items(), momentums.tolist()
+        ):
+            streak_info = CrossRoundMetrics.hot_streak_detection(
+                data, submitter_id, rankings_df=rankings_df
+            )
 
             if momentum > 0.1:
                 trend = "Rising"
@@ -528,15 +628,41 @@ class CrossRoundMetrics:
                 all_avgs.append(avg)
                 all_consistencies.append(std)
 
-        if not all_avgs:
+        return CrossRoundMetrics._classify_arc(
+            avg_points, consistency, finish_strength, peak_points,
+            np.array(all_avgs), np.array(all_consistencies)
+        )
+
+    @staticmethod
+    def _classify_arc(
+        avg_points: float,
+        consistency: float,
+        finish_strength: float,
+        peak_points: float,
+        league_avgs: np.ndarray,
+        league_consistencies: np.ndarray
+    ) -> str:
+        """
+        Pick an arc type from a player's stats and the league-wide context.
+
+        Args:
+            avg_points: Player's average points per submission
+            consistency: Player's standard deviation of points
+            finish_strength: Second half avg minus first half avg
+            peak_points: Player's best single-round points
+            league_avgs: Average points of every active player
+            league_consistencies: Standard deviations of every active player
+
+        Returns:
+            Arc type string
+        """
+        if len(league_avgs) == 0:
             return "Wild Card"
 
-        avg_percentile = (
-            sum(1 for a in all_avgs if a < avg_points) / len(all_avgs)
-        )
+        avg_percentile = np.count_nonzero(league_avgs < avg_points) / len(league_avgs)
         consistency_percentile = (
-            sum(1 for c in all_consistencies if c < consistency)
-            / len(all_consistencies)
+            np.count_nonzero(league_consistencies < consistency)
+            / len(league_consistencies)
         )
 
         # Classification logic
@@ -582,42 +708,67 @@ class CrossRoundMetrics:
         """
         arcs = []
 
-        for submitter_id, submitter_info in data.competitors.items():
-            avg_points, consistency = SubmitterMetrics.consistency_score(
-                data, submitter_id
-            )
+        submitter_ids = list(data.competitors.keys())
+        stats = SubmitterMetrics.get_all_stats(data).set_index('submitter_id')
+        stats = stats.reindex(submitter_ids).fillna(0.0)
+        avgs = stats['avg_points'].to_numpy(dtype=np.float64)
+        stds = stats['std_points'].to_numpy(dtype=np.float64)
 
-            if avg_points == 0:
-                continue  # Skip players with no submissions
+        # League-wide context for the arc percentiles, shared by every player
+        active = avgs > 0
+        league_avgs, league_stds = avgs[active], stds[active]
 
-            finish_strength = CrossRoundMetrics.finishing_strength(
-                data, submitter_id
-            )
-            peak_info = CrossRoundMetrics.peak_round(data, submitter_id)
-            stretch_info = CrossRoundMetrics.best_stretch(data, submitter_id)
-
-            # Pre-compute stats for arc type calculation
-            stats = {
-                'avg_points': avg_points,
-                'consistency': consistency,
-                'finishing_strength': finish_strength,
-                'peak_points': peak_info['points']
-            }
-            arc_type = CrossRoundMetrics.player_arc_type(
-                data, submitter_id, all_stats=stats
+        points, submitted = CrossRoundMetrics._round_points_matrix(data)
+        window = 3
+
+        for i in np.flatnonzero(active):
+            submitter_id = submitter_ids[i]
+            round_idx = np.flatnonzero(submitted[i])
+            scores = points[i, round_idx]
+            n_rounds = len(scores)
+
+            # Finishing strength: second half avg minus first half avg
+            if n_rounds < 2:
+                finish_strength = 0.0
+            else:
+                midpoint = n_rounds // 2
+                finish_strength = float(scores[midpoint:].mean() - scores[:midpoint].mean())
+
+            # Peak round (first best round on ties)
+            if n_rounds:
+                peak = int(scores.argmax())
+                peak_round, peak_points = int(round_idx[peak]) + 1, int(scores[peak])
+            else:
+                peak_round, peak_points = 0, 0
+
+            # Best consecutive stretch of played rounds
+            if n_rounds < window:
+                stretch_start = 1 if n_rounds else 0
+                stretch_avg = int(scores.sum()) / n_rounds if n_rounds else 0
+            else:
+                totals = np.convolve(scores, np.ones(window, dtype=np.int64), mode='valid')
+                best = int(totals.argmax())
+                if totals[best] > 0:
+                    stretch_start, stretch_avg = best + 1, int(totals[best]) / window
+                else:
+                    stretch_start, stretch_avg = 1, 0.0
+
+            arc_type = CrossRoundMetrics._classify_arc(
+                avgs[i], stds[i], finish_strength, peak_points,
+                league_avgs, league_stds
             )
 
             arcs.append({
                 'submitter_id': submitter_id,
-                'submitter': submitter_info['name'],
+                'submitter': data.competitors[submitter_id]['name'],
                 'arc_type': arc_type,
-                'avg_points': round(avg_points, 1),
-                'consistency': round(consistency, 1),
+                'avg_points': round(float(avgs[i]), 1),
+                'consistency': round(float(stds[i]), 1),
                 'finishing_strength': round(finish_strength, 1),
-                'peak_round': peak_info['round_num'],
-                'peak_points': peak_info['points'],
-                'best_stretch_start': stretch_info['start_round'],
-                'best_stretch_avg': round(stretch_info['avg_points'], 1),
+                'peak_round': peak_round,
+                'peak_points': peak_points,
+                'best_stretch_start': stretch_start,
+                'best_stretch_avg': round(stretch_avg, 1),
             })
 
         df = pd.DataFrame(arcs)
@@ -758,7 +909,7 @@ class CrossLeagueMetrics:
                 song_df['spotify_popularity'].mean() if len(song_df) > 0 else 0
             )
             total_songs = len(song_df)
-            total_votes = len([v for v in data.votes if v['points'] > 0])
+            total_votes = int(data.votes_df['points'].gt(0).sum())
 
             # Calculate voter similarity
             sim_matrix = VoterMetrics.voter_similarity_matrix(data)
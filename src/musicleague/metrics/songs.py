@@ -5,7 +5,6 @@ Provides metrics focused on individual songs including controversy,
 vote distribution, and obscurity scores.
 """
 
-from collections import defaultdict
 from typing import Dict, List, Optional, TYPE_CHECKING
 
 import numpy as np
@@ -61,10 +60,8 @@ class SongMetrics:
             Dictionary mapping point values to counts (e.g., {1: 2, 2: 3, 3: 5})
         """
         votes = data.get_votes_for_song(spotify_uri, round_id)
-        distribution: Dict[int, int] = defaultdict(int)
-        for vote in votes:
-            distribution[vote] += 1
-        return dict(distribution)
+        values, counts = np.unique(votes, return_counts=True)
+        return dict(zip(values.tolist(), counts.tolist()))
 
     @staticmethod
     def total_points(
@@ -83,8 +80,9 @@ class SongMetrics:
         Returns:
             Sum of all votes for this song
         """
-        votes = data.get_votes_for_song(spotify_uri, round_id)
-        return sum(votes)
+        if round_id is None:
+            return data.song_points_by_uri.get(spotify_uri, 0)
+        return data.song_points.get((spotify_uri, round_id), 0)
 
     @staticmethod
     def obscurity_score(
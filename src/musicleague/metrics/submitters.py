@@ -9,6 +9,7 @@ from collections import defaultdict
 from typing import Dict, List, Optional, Tuple, TYPE_CHECKING
 
 import numpy as np
+import pandas as pd
 
 if TYPE_CHECKING:
     from musicleague.data.loader import MusicLeagueData
@@ -129,6 +130,113 @@ class SubmitterMetrics:
         avg_popularity = total_popularity / len(submissions)
         return total_points / (avg_popularity + 1)
 
+    @staticmethod
+    def get_all_stats(
+        data: "MusicLeagueData",
+        round_id: Optional[str] = None
+    ) -> pd.DataFrame:
+        """
+        Calculate average points, consistency and underdog factor for every
+        submitter in a single pass over submissions and votes.
+
+        Equivalent to calling average_points_per_submission, consistency_score
+        and underdog_factor for each submitter.
+
+        Args:
+            data: MusicLeagueData object
+            round_id: Optional round ID to filter by
+
+        Returns:
+            DataFrame with columns: submitter_id, num_submissions, avg_points,
+            std_points, underdog_factor (one row per submitter with submissions)
+        """
+        columns = ['submitter_id', 'num_submissions', 'avg_points', 'std_points', 'underdog_factor']
+
+        uris = data.submission_uris
+        round_ids = data.submission_round_ids
+        submitter_column = data.submission_submitter_ids
+        if round_id is not None:
+            in_round = round_ids == round_id
+            uris, round_ids, submitter_column = uris[in_round], round_ids[in_round], submitter_column[in_round]
+
+        if len(uris) == 0:
+            return pd.DataFrame(columns=columns)
+
+        # Song totals are aggregated once on the data object
+        song_points = data.song_points
+        points = np.array([
+            song_points.get(key, 0) for key in zip(uris, round_ids)
+        ], dtype=np.float64)
+
+        # Look up popularity once per distinct track rather than per submission
+        unique_uris, uri_codes = np.unique(uris, return_inverse=True)
+        popularity = np.array([
+            data.get_spotify_data(uri)['popularity'] for uri in unique_uris
+        ], dtype=np.float64)[uri_codes]
+
+        submitter_ids, codes = np.unique(submitter_column, return_inverse=True)
+
+        n_submitters = len(submitter_ids)
+        counts = np.bincount(codes, minlength=n_submitters)
+        total_points = np.bincount(codes, weights=points, minlength=n_submitters)
+        avg_popularity = np.bincount(codes, weights=popularity, minlength=n_submitters) / counts
+
+        # Group points by submitter for the per-submitter standard deviation
+        grouped_points = np.split(points[np.argsort(codes, kind='stable')], np.cumsum(counts)[:-1])
+        std_points = np.array([np.std(group) for group in grouped_points])
+
+        return pd.DataFrame({
+            'submitter_id': submitter_ids,
+            'num_submissions': counts,
+            'avg_points': total_points / counts,
+            'std_points': std_points,
+            'underdog_factor': total_points / (avg_popularity + 1),
+        }, columns=columns)
+
+    @staticmethod
+    def all_average_points(
+        data: "MusicLeagueData",
+        round_id: Optional[str] = None
+    ) -> pd.Series:
+        """
+        Calculate average points per submission for every competitor at once.
+
+        Equivalent to calling average_points_per_submission for each
+        competitor.
+
+        Args:
+            data: MusicLeagueData object
+            round_id: Optional round ID to filter by
+
+        Returns:
+            Series of average points indexed by submitter ID, in competitor
+            order (0.0 for competitors without submissions)
+        """
+        stats = SubmitterMetrics.get_all_stats(data, round_id)
+        averages = stats.set_index('submitter_id')['avg_points']
+        return averages.reindex(list(data.competitors.keys()), fill_value=0.0).astype(float)
+
+    @staticmethod
+    def all_underdog_factors(
+        data: "MusicLeagueData",
+        round_id: Optional[str] = None
+    ) -> Dict[str, float]:
+        """
+        Calculate underdog factor for every submitter in a single pass.
+
+        Equivalent to calling underdog_factor for each submitter.
+
+        Args:
+            data: MusicLeagueData object
+            round_id: Optional round ID to filter by
+
+        Returns:
+            Dictionary mapping submitter ID to underdog factor
+            (submitters with no submissions are omitted)
+        """
+        stats = SubmitterMetrics.get_all_stats(data, round_id)
+        return dict(zip(stats['submitter_id'].tolist(), stats['underdog_factor'].tolist()))
+
     @staticmethod
     def biggest_fan_and_nemesis(
         data: "MusicLeagueData",
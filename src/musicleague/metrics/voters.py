@@ -182,6 +182,66 @@ class VoterMetrics:
         correlation, _ = stats.spearmanr(voter_scores, final_scores_list)
         return float(correlation) if not np.isnan(correlation) else 0.0
 
+    @staticmethod
+    def all_golden_ear_scores(
+        data: "MusicLeagueData",
+        round_id: Optional[str] = None
+    ) -> Dict[str, float]:
+        """
+        Calculate golden ear scores for every competitor in a single pass.
+
+        Equivalent to calling golden_ear_score for each competitor, but song
+        totals are accumulated once and each voter's own votes are subtracted
+        out instead of rescanning all votes per song.
+
+        Args:
+            data: MusicLeagueData object
+            round_id: Optional round ID to filter by
+
+        Returns:
+            Dictionary mapping voter ID to Spearman correlation (-1 to 1)
+        """
+        song_totals: Dict[Tuple[str, str], List[int]] = defaultdict(lambda: [0, 0])
+        own_totals: Dict[Tuple[str, str, str], List[int]] = defaultdict(lambda: [0, 0])
+        voter_votes: Dict[str, Dict[Tuple[str, str], int]] = defaultdict(dict)
+
+        for vote in data.votes:
+            key = (vote['spotify_uri'], vote['round_id'])
+            song_total = song_totals[key]
+            song_total[0] += vote['points']
+            song_total[1] += 1
+            own_total = own_totals[(vote['voter_id'],) + key]
+            own_total[0] += vote['points']
+            own_total[1] += 1
+
+            if vote['points'] > 0 and (round_id is None or vote['round_id'] == round_id):
+                voter_votes[vote['voter_id']][key] = vote['points']
+
+        scores = {}
+        for voter_id in data.competitors:
+            votes = voter_votes.get(voter_id, {})
+            if len(votes) < 3:
+                scores[voter_id] = 0.0
+                continue
+
+            voter_scores = []
+            final_scores_list = []
+            for key, voter_score in votes.items():
+                total_points, total_count = song_totals[key]
+                own_points, own_count = own_totals[(voter_id,) + key]
+                if total_count - own_count > 0:
+                    voter_scores.append(voter_score)
+                    final_scores_list.append(total_points - own_points)
+
+            if len(voter_scores) < 3:
+                scores[voter_id] = 0.0
+                continue
+
+            correlation, _ = stats.spearmanr(voter_scores, final_scores_list)
+            scores[voter_id] = float(correlation) if not np.isnan(correlation) else 0.0
+
+        return scores
+
     @staticmethod
     def voter_similarity_matrix(
         data: "MusicLeagueData",
@@ -160,8 +160,9 @@ def analyze_single_round(league_name: str, round_id: str = None):
     print("\nUnderdog Factor (Success with Obscure Songs):")
     print("-" * 80)
     underdog_scores = []
+    all_underdogs = SubmitterMetrics.all_underdog_factors(data, round_id)
     for submitter_id, submitter_data in data.competitors.items():
-        score = SubmitterMetrics.underdog_factor(data, submitter_id, round_id)
+        score = all_underdogs.get(submitter_id, 0.0)
         if score > 0:
             underdog_scores.append((submitter_data['name'], score))
 
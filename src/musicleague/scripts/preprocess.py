@@ -60,17 +60,15 @@ def preprocess_league(league_name: str, force: bool = False) -> bool:
     print(f"✓ Loaded {len(data.votes)} votes")
     print(f"✓ Rounds: {', '.join(data.rounds)}")
 
-    # Fetch all Spotify data upfront
+    # Spotify metadata is batch-fetched on load; look up any stragglers one by one
     print("\nFetching Spotify metadata...")
     unique_uris = list(set(sub['spotify_uri'] for sub in data.submissions))
     total_tracks = len(unique_uris)
 
-    for i, uri in enumerate(unique_uris, 1):
-        if i % 10 == 0 or i == total_tracks:
-            print(f"  Progress: {i}/{total_tracks} tracks", end='\r')
+    for uri in unique_uris:
         data.get_spotify_data(uri)
 
-    print(f"\n✓ Fetched metadata for {total_tracks} tracks")
+    print(f"✓ Fetched metadata for {total_tracks} tracks")
 
     # Calculate all song metrics
     print("\nCalculating song metrics...")
@@ -136,7 +134,7 @@ def preprocess_league(league_name: str, force: bool = False) -> bool:
     summary_stats = {
         'total_competitors': len(data.competitors),
         'total_submissions': len(data.submissions),
-        'total_votes': len([v for v in data.votes if v['points'] > 0]),
+        'total_votes': int(data.votes_df['points'].gt(0).sum()),
         'total_rounds': len(data.rounds),
         'avg_controversy': song_df['controversy_score'].mean() if len(song_df) > 0 else 0,
         'avg_spotify_popularity': song_df['spotify_popularity'].mean() if len(song_df) > 0 else 0,
@@ -147,11 +145,13 @@ def preprocess_league(league_name: str, force: bool = False) -> bool:
     preprocessed_data = {
         'league_name': league_name,
         'raw_data': {
+            # Submissions and votes are stored once, as frames; the loader
+            # rebuilds the record lists from them on first access
             'competitors': data.competitors,
-            'submissions': data.submissions,
-            'votes': data.votes,
             'rounds': data.rounds,
             'spotify_data': data.spotify_data,
+            'submissions_df': data.submissions_df,
+            'votes_df': data.votes_df,
         },
         'song_metrics': song_df,
         'voter_metrics': voter_metrics,
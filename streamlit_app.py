@@ -6,14 +6,10 @@ Uses st.navigation() for explicit control over page names and order.
 """
 
 import streamlit as st
+from musicleague.dashboard import PAGE_CONFIG
 
 # Page configuration - must be first Streamlit command
-st.set_page_config(
-    page_title="Music League Dashboard",
-    page_icon="🎵",
-    layout="wide",
-    initial_sidebar_state="expanded",
-)
+st.set_page_config(**PAGE_CONFIG)
 
 # Define pages with explicit titles (no filename-based naming)
 pages = [